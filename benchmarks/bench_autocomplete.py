@@ -0,0 +1,88 @@
+"""Server-name autocomplete benchmarks.
+
+Measures NameIndex construction and lookups for fleets of 100 to 10000
+names, with query shapes users actually type: a short prefix, a longer
+prefix, a word in the middle of the name and a miss.
+
+Usage:
+    uv run python -m benchmarks.bench_autocomplete --quick --output results.json
+"""
+
+import random
+import time
+
+from benchmarks.common import BenchResult, finish, parse_args, result
+from gameserver_pilot.cloud.names import NameIndex
+
+SUITE = "autocomplete"
+FLEETS = (100, 1000, 5000, 10000)
+QUICK_FLEETS = (100, 1000)
+GAMES = ("terraria", "minecraft", "valheim", "corekeeper", "palworld", "factorio")
+REGIONS = ("tokyo", "osaka", "seoul", "oregon")
+QUERIES = {
+    "short_prefix": "te",
+    "long_prefix": "minecraft-os",
+    "middle_word": "seoul",
+    "miss": "zzzz",
+}
+LOOKUPS = 2000
+BUILDS = 5
+
+
+def fleet_names(size: int) -> list[str]:
+    """Generate realistic server names such as "terraria-tokyo-0042"."""
+    rng = random.Random(size)
+    return [f"{rng.choice(GAMES)}-{rng.choice(REGIONS)}-{i:04d}" for i in range(size)]
+
+
+def bench_build(names: list[str]) -> BenchResult:
+    """Time building the index, as done on every registry refresh."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(BUILDS):
+        build_started = time.perf_counter()
+        NameIndex(names)
+        latencies.append(time.perf_counter() - build_started)
+    elapsed = time.perf_counter() - started
+    return result(SUITE, "build", {"names": len(names)}, latencies, BUILDS, elapsed, "builds/s")
+
+
+def bench_lookup(index: NameIndex, case: str, query: str) -> BenchResult:
+    """Time repeated lookups of one query."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(LOOKUPS):
+        lookup_started = time.perf_counter()
+        index.search(query)
+        latencies.append(time.perf_counter() - lookup_started)
+    elapsed = time.perf_counter() - started
+    return result(
+        SUITE,
+        f"lookup_{case}",
+        {"names": len(index)},
+        latencies,
+        LOOKUPS,
+        elapsed,
+        "lookups/s",
+    )
+
+
+def run(quick: bool) -> list[BenchResult]:
+    """Run every case."""
+    results = []
+    for size in QUICK_FLEETS if quick else FLEETS:
+        names = fleet_names(size)
+        results.append(bench_build(names))
+        index = NameIndex(names)
+        results.extend(bench_lookup(index, case, query) for case, query in QUERIES.items())
+    return results
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    args = parse_args(__doc__.splitlines()[0])
+    finish(run(args.quick), args.output)
+
+
+if __name__ == "__main__":
+    main()
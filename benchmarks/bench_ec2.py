@@ -0,0 +1,92 @@
+"""EC2Provider benchmarks against moto.
+
+Measures batched fleet snapshots and single-instance lookups for fleets of
+10 to 1000 instances. moto answers in-process, so results reflect the
+provider's own overhead (botocore serialization, pagination, thread hops)
+rather than network latency.
+
+Usage:
+    uv run python -m benchmarks.bench_ec2 --quick --output results.json
+"""
+
+import asyncio
+import os
+
+import boto3
+from moto import mock_aws
+
+from benchmarks.common import BenchResult, finish, parse_args, result, time_calls
+from gameserver_pilot.cloud.ec2 import EC2Provider
+
+SUITE = "ec2"
+REGION = "ap-northeast-1"
+IMAGE_ID = "ami-12345678"
+FLEETS = (10, 100, 1000)
+QUICK_FLEETS = (10, 100)
+BATCH_ITERATIONS = 20
+SINGLE_LOOKUPS = 50
+
+
+async def bench_fleet(size: int) -> list[BenchResult]:
+    """Run the cases for one fleet size inside a fresh moto backend."""
+    with mock_aws():
+        ec2 = boto3.client("ec2", region_name=REGION)
+        instance_ids = [
+            instance["InstanceId"]
+            for instance in ec2.run_instances(ImageId=IMAGE_ID, MinCount=size, MaxCount=size)[
+                "Instances"
+            ]
+        ]
+        provider = EC2Provider(region=REGION)
+        await provider.start()
+        try:
+            latencies, elapsed = await time_calls(
+                lambda: provider.get_server_snapshots(instance_ids), BATCH_ITERATIONS
+            )
+            batch = result(
+                SUITE,
+                "snapshots_batch",
+                {"instances": size},
+                latencies,
+                size * BATCH_ITERATIONS,
+                elapsed,
+                "instances/s",
+            )
+
+            sample = instance_ids[:SINGLE_LOOKUPS]
+            lookups = iter(sample * (SINGLE_LOOKUPS // len(sample) + 1))
+            latencies, elapsed = await time_calls(
+                lambda: provider.get_server_snapshot(next(lookups)), SINGLE_LOOKUPS
+            )
+            single = result(
+                SUITE,
+                "snapshot_single",
+                {"instances": size},
+                latencies,
+                SINGLE_LOOKUPS,
+                elapsed,
+                "lookups/s",
+            )
+        finally:
+            await provider.close()
+    return [batch, single]
+
+
+async def run(quick: bool = False) -> list[BenchResult]:
+    """Run every EC2 case."""
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        os.environ.setdefault(name, "benchmark")
+    results = []
+    for size in QUICK_FLEETS if quick else FLEETS:
+        results.extend(await bench_fleet(size))
+    return results
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    args = parse_args(__doc__.splitlines()[0])
+    finish(asyncio.run(run(args.quick)), args.output)
+
+
+if __name__ == "__main__":
+    main()
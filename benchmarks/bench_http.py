@@ -0,0 +1,141 @@
+"""BeszelClient and TShockMonitor benchmarks against local stub servers.
+
+A local aiohttp server stands in for the Beszel hub and TShock REST API and
+adds a fixed delay to every response, so connection reuse and pagination
+costs show up the way they would against a remote host.
+
+Usage:
+    uv run python -m benchmarks.bench_http --quick --output results.json
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from benchmarks.common import BenchResult, finish, parse_args, result, time_calls
+from gameserver_pilot.monitoring.beszel_client import BeszelClient
+from gameserver_pilot.monitors.tshock import TShockMonitor, create_http_client
+
+LATENCIES_MS = (0, 5, 20)
+QUICK_LATENCIES_MS = (5,)
+SYSTEM_COUNTS = (10, 1000)
+TSHOCK_CALLS = 200
+CONCURRENT_MONITORS = 50
+BESZEL_CALLS = 20
+PLAYERS = 8
+
+
+def stub_app(latency: float, systems: int) -> web.Application:
+    """Build a server answering TShock and Beszel requests after a delay."""
+
+    async def players(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"players": [{"nickname": f"p{i}"} for i in range(PLAYERS)]})
+
+    async def auth(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"token": "benchmark"})
+
+    async def records(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        page = int(request.query.get("page", "1"))
+        per_page = int(request.query.get("perPage", "30"))
+        first = (page - 1) * per_page
+        items = [
+            {
+                "id": f"r{i}",
+                "name": f"system-{i}",
+                "status": "up",
+                "info": {"cpu": 12.5, "mem": 40.0, "disk": 55.0},
+            }
+            for i in range(first, min(first + per_page, systems))
+        ]
+        return web.json_response({"items": items})
+
+    app = web.Application()
+    app.router.add_get("/v2/players/list", players)
+    app.router.add_post("/api/collections/users/auth-with-password", auth)
+    app.router.add_get("/api/collections/systems/records", records)
+    return app
+
+
+async def bench_tshock(server: TestServer, latency_ms: int) -> list[BenchResult]:
+    """Time sequential and concurrent player count probes over a pooled client."""
+    params = {"latency_ms": latency_ms}
+    host, port = str(server.host), int(server.port or 0)
+    async with create_http_client() as client:
+        monitor = TShockMonitor(host, port, "token", client=client)
+        latencies, elapsed = await time_calls(monitor.get_player_count, TSHOCK_CALLS)
+        sequential = result(
+            "tshock", "sequential", params, latencies, TSHOCK_CALLS, elapsed, "probes/s"
+        )
+
+        monitors = [
+            TShockMonitor(host, port, "token", client=client) for _ in range(CONCURRENT_MONITORS)
+        ]
+        rounds = TSHOCK_CALLS // CONCURRENT_MONITORS
+
+        async def probe_all() -> None:
+            await asyncio.gather(*(m.get_player_count() for m in monitors))
+
+        latencies, elapsed = await time_calls(probe_all, rounds)
+        concurrent = result(
+            "tshock",
+            "concurrent",
+            {**params, "monitors": CONCURRENT_MONITORS},
+            latencies,
+            rounds * CONCURRENT_MONITORS,
+            elapsed,
+            "probes/s",
+        )
+    return [sequential, concurrent]
+
+
+async def bench_beszel(server: TestServer, latency_ms: int, systems: int) -> BenchResult:
+    """Time full fleet fetches, including pagination."""
+    client = BeszelClient(str(server.make_url("")).rstrip("/"), "admin@example.com", "password")
+    try:
+        await client.get_all_systems()
+        latencies, elapsed = await time_calls(client.get_all_systems, BESZEL_CALLS)
+    finally:
+        await client.close()
+    return result(
+        "beszel",
+        "get_all_systems",
+        {"latency_ms": latency_ms, "systems": systems},
+        latencies,
+        BESZEL_CALLS * systems,
+        elapsed,
+        "systems/s",
+    )
+
+
+async def run(quick: bool = False) -> list[BenchResult]:
+    """Run every HTTP case."""
+    results = []
+    for latency_ms in QUICK_LATENCIES_MS if quick else LATENCIES_MS:
+        for systems in SYSTEM_COUNTS:
+            server = TestServer(stub_app(latency_ms / 1000, systems))
+            await server.start_server()
+            try:
+                if systems == SYSTEM_COUNTS[0]:
+                    results.extend(await bench_tshock(server, latency_ms))
+                results.append(await bench_beszel(server, latency_ms, systems))
+            finally:
+                await server.close()
+    return results
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    args = parse_args(__doc__.splitlines()[0])
+    started = time.perf_counter()
+    results = asyncio.run(run(args.quick))
+    finish(results, args.output)
+    print(f"elapsed: {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""LogFileMonitor benchmarks on generated logs.
+
+Measures full-scan throughput on logs of 10 MiB to 2 GiB at several
+join/leave densities, and the latency of incremental polls after small
+appends.
+
+Usage:
+    uv run python -m benchmarks.bench_logfile --quick --output results.json
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_matcher import JOIN_PATTERN, LEAVE_PATTERN, generate_log
+from benchmarks.common import BenchResult, finish, parse_args, result, time_calls
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+
+SUITE = "logfile"
+SIZES_MB = (10, 100, 1024, 2048)
+QUICK_SIZES_MB = (10,)
+# Lines per join/leave event: busy, typical and quiet servers
+DENSITIES = (50, 1000, 20000)
+POLLS = 200
+LINES_PER_APPEND = 100
+
+
+async def bench_full_scan(path: Path, size_mb: int, event_every: int) -> BenchResult:
+    """Time a cold scan of the whole log."""
+    monitor = LogFileMonitor(str(path), JOIN_PATTERN, LEAVE_PATTERN)
+    latencies, elapsed = await time_calls(monitor.get_player_count, 1)
+    return result(
+        SUITE,
+        "full_scan",
+        {"size_mb": size_mb, "event_every": event_every},
+        latencies,
+        path.stat().st_size / (1024 * 1024),
+        elapsed,
+        "MiB/s",
+    )
+
+
+async def bench_incremental(path: Path, size_mb: int, event_every: int) -> BenchResult:
+    """Time polls that each see a small appended batch of lines."""
+    monitor = LogFileMonitor(str(path), JOIN_PATTERN, LEAVE_PATTERN)
+    await monitor.get_player_count()
+    batch = "".join(
+        "Player1 has joined\n" if i % event_every == 0 else "[Server] Saving world data...\n"
+        for i in range(LINES_PER_APPEND)
+    )
+
+    latencies = []
+    started = time.perf_counter()
+    with path.open("a", encoding="utf-8") as log:
+        for _ in range(POLLS):
+            log.write(batch)
+            log.flush()
+            poll_started = time.perf_counter()
+            await monitor.get_player_count()
+            latencies.append(time.perf_counter() - poll_started)
+    elapsed = time.perf_counter() - started
+    return result(
+        SUITE,
+        "incremental_poll",
+        {"size_mb": size_mb, "event_every": event_every},
+        latencies,
+        POLLS,
+        elapsed,
+        "polls/s",
+    )
+
+
+async def run(quick: bool = False) -> list[BenchResult]:
+    """Run every log file case."""
+    results = []
+    for size_mb in QUICK_SIZES_MB if quick else SIZES_MB:
+        for event_every in DENSITIES:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "server.log"
+                generate_log(path, size_mb, event_every)
+                results.append(await bench_full_scan(path, size_mb, event_every))
+                results.append(await bench_incremental(path, size_mb, event_every))
+    return results
+
+
+def main() -> None:
+    """Run the suite from the command line."""
+    args = parse_args(__doc__.splitlines()[0])
+    finish(asyncio.run(run(args.quick)), args.output)
+
+
+if __name__ == "__main__":
+    main()
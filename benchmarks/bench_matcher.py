@@ -0,0 +1,111 @@
+"""Microbenchmark for log join/leave matching.
+
+Generates a synthetic game server log and reports lines/sec for the previous
+two-regex-per-line loop and for LogFileMonitor with the combined matcher.
+
+Usage:
+    uv run python -m benchmarks.bench_matcher --size-mb 1024
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+
+JOIN_PATTERN = r"(.+) has joined"
+LEAVE_PATTERN = r"(.+) has left"
+NOISE_LINES = [
+    "[Server] Saving world data...",
+    "[Server] World saved in 142ms",
+    "[Network] Ping from 10.0.0.{n}: 38ms",
+    "[AI] Spawned slime at ({n}, 421)",
+    "[Chat] <Player{n}> anyone want to fight the boss?",
+]
+
+
+def generate_log(path: Path, size_mb: int, event_every: int, seed: int = 0) -> int:
+    """Write a synthetic log of roughly size_mb megabytes.
+
+    Args:
+        path: Destination file.
+        size_mb: Target size in MiB.
+        event_every: One join or leave line per this many lines.
+        seed: Random seed for reproducible content.
+
+    Returns:
+        Number of lines written.
+    """
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    lines = 0
+    with path.open("w", encoding="utf-8") as f:
+        while written < target:
+            block = []
+            for _ in range(10_000):
+                lines += 1
+                if lines % event_every == 0:
+                    player = f"Player{rng.randrange(64)}"
+                    verb = rng.choice(("joined", "left"))
+                    block.append(f"{player} has {verb}\n")
+                else:
+                    block.append(rng.choice(NOISE_LINES).format(n=rng.randrange(255)) + "\n")
+            chunk = "".join(block)
+            f.write(chunk)
+            written += len(chunk.encode())
+    return lines
+
+
+def run_two_regex(path: Path) -> int:
+    """Count players with the original per-line join/leave search loop."""
+    join_regex = re.compile(JOIN_PATTERN)
+    leave_regex = re.compile(LEAVE_PATTERN)
+    players: set[str] = set()
+    with path.open("r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            join_match = join_regex.search(line)
+            if join_match:
+                players.add(join_match.group(1))
+                continue
+            leave_match = leave_regex.search(line)
+            if leave_match:
+                players.discard(leave_match.group(1))
+    return len(players)
+
+
+def run_matcher(path: Path) -> int:
+    """Count players with a fresh LogFileMonitor (full scan)."""
+    return asyncio.run(LogFileMonitor(str(path), JOIN_PATTERN, LEAVE_PATTERN).get_player_count())
+
+
+def main() -> None:
+    """Run the benchmark and print lines/sec for both implementations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024, help="log size in MiB")
+    parser.add_argument("--event-every", type=int, default=1000, help="lines per join/leave")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "server.log"
+        lines = generate_log(path, args.size_mb, args.event_every)
+        print(f"log: {args.size_mb} MiB, {lines:,} lines, 1 event per {args.event_every} lines")
+
+        results = {}
+        for name, func in (("two-regex", run_two_regex), ("matcher", run_matcher)):
+            started = time.perf_counter()
+            players = func(path)
+            elapsed = time.perf_counter() - started
+            results[name] = elapsed
+            rate = lines / elapsed
+            print(f"{name:>10}: {rate:>14,.0f} lines/s  ({elapsed:.2f}s, {players} players)")
+
+        print(f"speedup: {results['two-regex'] / results['matcher']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
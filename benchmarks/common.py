@@ -0,0 +1,162 @@
+"""Shared timing, memory and result helpers for the benchmark suite."""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class BenchResult:
+    """Outcome of one benchmark case."""
+
+    suite: str
+    case: str
+    params: dict[str, Any] = field(default_factory=dict)
+    samples: int = 0
+    throughput: float = 0.0
+    unit: str = "ops/s"
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    peak_rss_mb: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Identifier used to match cases across runs."""
+        params = ",".join(f"{name}={value}" for name, value in sorted(self.params.items()))
+        return f"{self.suite}/{self.case}[{params}]"
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of a series (0.0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(max(round(fraction * len(ordered) + 0.5) - 1, 0), len(ordered) - 1)
+    return ordered[rank]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def result(
+    suite: str,
+    case: str,
+    params: dict[str, Any],
+    latencies: Sequence[float],
+    work: float,
+    elapsed: float,
+    unit: str,
+) -> BenchResult:
+    """Build a result from per-operation latencies and total work done.
+
+    Args:
+        suite: Suite name.
+        case: Case name within the suite.
+        params: Parameters distinguishing this case.
+        latencies: Seconds taken by each measured operation.
+        work: Units of work done in elapsed seconds.
+        elapsed: Wall-clock seconds for the whole case.
+        unit: Throughput unit, e.g. "lines/s".
+
+    Returns:
+        The assembled result.
+    """
+    return BenchResult(
+        suite=suite,
+        case=case,
+        params=params,
+        samples=len(latencies),
+        throughput=work / elapsed if elapsed else 0.0,
+        unit=unit,
+        p50_ms=percentile(latencies, 0.50) * 1000,
+        p99_ms=percentile(latencies, 0.99) * 1000,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+async def time_calls(
+    func: Callable[[], Awaitable[Any]], iterations: int
+) -> tuple[list[float], float]:
+    """Await a callable repeatedly, timing each call.
+
+    Returns:
+        Per-call latencies in seconds and the total elapsed seconds.
+    """
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await func()
+        latencies.append(time.perf_counter() - call_started)
+    return latencies, time.perf_counter() - started
+
+
+def git_commit() -> str | None:
+    """Current commit hash, if run inside a git checkout."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def write_results(path: Path, results: Sequence[BenchResult]) -> None:
+    """Write results with run metadata as JSON."""
+    document = {
+        "commit": git_commit(),
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(item) for item in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> list[BenchResult]:
+    """Read results written by write_results."""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return [BenchResult(**item) for item in document["results"]]
+
+
+def print_results(results: Sequence[BenchResult]) -> None:
+    """Print a human-readable results table."""
+    for item in results:
+        print(
+            f"{item.key:<58} {item.throughput:>14,.1f} {item.unit:<10} "
+            f"p50 {item.p50_ms:>9.3f}ms  p99 {item.p99_ms:>9.3f}ms  "
+            f"rss {item.peak_rss_mb:>7.1f}MiB"
+        )
+
+
+def parse_args(description: str) -> argparse.Namespace:
+    """Parse the options shared by every suite."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--quick", action="store_true", help="run only the smallest cases")
+    parser.add_argument("--output", type=Path, help="write results to this JSON file")
+    return parser.parse_args()
+
+
+def finish(results: Sequence[BenchResult], output: Path | None) -> None:
+    """Print results and optionally write them as JSON."""
+    print_results(results)
+    if output is not None:
+        write_results(output, results)
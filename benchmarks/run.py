@@ -0,0 +1,99 @@
+"""Run the benchmark suite and compare results across commits.
+
+Each suite runs in its own interpreter so peak RSS is attributed to that
+suite alone. Results are merged into one JSON file, by default
+benchmarks/results/<commit>.json, which can be compared to an earlier run.
+
+Usage:
+    uv run python -m benchmarks.run --quick
+    uv run python -m benchmarks.run --compare benchmarks/results/abc1234.json
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import (
+    BenchResult,
+    git_commit,
+    load_results,
+    print_results,
+    write_results,
+)
+
+SUITES = ("bench_logfile", "bench_ec2", "bench_http", "bench_autocomplete")
+RESULTS_DIR = Path(__file__).parent / "results"
+# Relative change treated as a regression
+DEFAULT_TOLERANCE = 0.10
+
+
+def run_suite(suite: str, quick: bool) -> list[BenchResult]:
+    """Run one suite in a subprocess and load its results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / f"{suite}.json"
+        command = [sys.executable, "-m", f"benchmarks.{suite}", "--output", str(output)]
+        if quick:
+            command.append("--quick")
+        subprocess.run(command, check=True)
+        return load_results(output)
+
+
+def compare(current: list[BenchResult], baseline: list[BenchResult], tolerance: float) -> list[str]:
+    """Describe cases whose throughput or p99 latency got worse.
+
+    Args:
+        current: Results of this run.
+        baseline: Results of the run to compare against.
+        tolerance: Relative change ignored as noise.
+
+    Returns:
+        One line per regressed case.
+    """
+    previous = {item.key: item for item in baseline}
+    regressions = []
+    for item in current:
+        before = previous.get(item.key)
+        if before is None:
+            continue
+        throughput = item.throughput / before.throughput - 1 if before.throughput else 0.0
+        p99 = item.p99_ms / before.p99_ms - 1 if before.p99_ms else 0.0
+        print(f"{item.key:<58} throughput {throughput:+7.1%}  p99 {p99:+7.1%}")
+        if throughput < -tolerance or p99 > tolerance:
+            regressions.append(f"{item.key}: throughput {throughput:+.1%}, p99 {p99:+.1%}")
+    return regressions
+
+
+def main() -> None:
+    """Run the selected suites, write JSON and optionally compare."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="run only the smallest cases")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="suite to run")
+    parser.add_argument("--output", type=Path, help="results file to write")
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results: list[BenchResult] = []
+    for suite in args.suite or SUITES:
+        print(f"== {suite}", flush=True)
+        results.extend(run_suite(suite, args.quick))
+
+    print("== summary")
+    print_results(results)
+    output = args.output or RESULTS_DIR / f"{git_commit() or 'unknown'}.json"
+    write_results(output, results)
+    print(f"results written to {output}")
+
+    if args.compare is not None:
+        print(f"== compared with {args.compare}")
+        regressions = compare(results, load_results(args.compare), args.tolerance)
+        if regressions:
+            print("regressions:")
+            print("\n".join(f"  {line}" for line in regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
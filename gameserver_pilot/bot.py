@@ -1,33 +1,170 @@
 """Discord bot for managing game servers."""
 
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from gameserver_pilot.cloud.base import CloudProvider
-from gameserver_pilot.cloud.ec2 import EC2Provider
+from gameserver_pilot.cloud.base import CloudProvider, ServerSnapshot
+from gameserver_pilot.cloud.cache import STABLE_STATES, TRANSITIONAL_STATES, CachingProvider
+from gameserver_pilot.cloud.coalesce import CoalescingProvider, OperationInProgressError
+from gameserver_pilot.cloud.instrumented import InstrumentedProvider
 from gameserver_pilot.cloud.mock import MockProvider
-from gameserver_pilot.config import settings
-from gameserver_pilot.monitoring import BeszelClient, MonitoringReporter
+from gameserver_pilot.cloud.registry import ServerRegistry
+from gameserver_pilot.command_sync import sync_commands
+from gameserver_pilot.config import GameServerSettings, Settings, get_settings
+from gameserver_pilot.embeds import group_into_messages, paginate_fields
+from gameserver_pilot.metrics import MetricsRegistry, MetricsServer
+from gameserver_pilot.monitoring.beszel_client import BeszelClient
+from gameserver_pilot.monitoring.history import MetricsHistory
+from gameserver_pilot.monitoring.reporter import MonitoringReporter
+from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.monitors.factory import create_monitor
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+from gameserver_pilot.monitors.tshock import create_http_client
+from gameserver_pilot.monitors.watcher import LogWatcher, PlayerCountChange
+from gameserver_pilot.scheduler import (
+    AutoStopScheduler,
+    DemandTracker,
+    PollPolicy,
+    PrewarmPolicy,
+    PrewarmScheduler,
+    StartProgress,
+    StartStage,
+    StartWaiter,
+)
+from gameserver_pilot.scheduler.startup import ReadinessProbe, tcp_probe
+
+if TYPE_CHECKING:
+    from gameserver_pilot.cloud.ec2 import EC2Provider
+
+# /status argument that reports every registered server
+FLEET_KEYWORD = "all"
+# Discord rejects autocomplete choice names longer than this
+MAX_CHOICE_LENGTH = 100
 
 
 class GameServerBot(commands.Bot):
     """Discord bot for game server management."""
 
-    def __init__(self) -> None:
-        """Initialize the bot."""
+    def __init__(self, settings: Settings) -> None:
+        """Initialize the bot.
+
+        Args:
+            settings: Application settings
+        """
         intents = discord.Intents.default()
         super().__init__(command_prefix="!", intents=intents)
+        self.settings = settings
+
+        # Call counts and latencies, optionally served to Prometheus
+        self.metrics = MetricsRegistry()
+        self.metrics_server: MetricsServer | None = None
+        if settings.metrics_port is not None:
+            self.metrics_server = MetricsServer(
+                self.metrics, settings.metrics_host, settings.metrics_port
+            )
 
         # Use mock provider in development, EC2 in production
-        self.cloud: CloudProvider
-        if settings.is_production:
-            self.cloud = EC2Provider(region=settings.aws_default_region)
+        provider: CloudProvider
+        ec2: EC2Provider | None = None
+        if settings.is_production and len(settings.all_aws_regions) > 1:
+            from gameserver_pilot.cloud.multiregion import MultiRegionProvider
+
+            provider = MultiRegionProvider.for_regions(
+                settings.all_aws_regions, max_workers=settings.aws_max_workers
+            )
+        elif settings.is_production:
+            # boto3 is slow to import and unused in development
+            from gameserver_pilot.cloud.ec2 import EC2Provider
+
+            ec2 = EC2Provider(
+                region=settings.aws_default_region,
+                max_workers=settings.aws_max_workers,
+                state_queue_url=settings.aws_state_queue_url,
+            )
+            provider = ec2
         else:
-            self.cloud = MockProvider()
+            provider = MockProvider()
+
+        # Bursts of identical requests share one provider call
+        self.coalescer = CoalescingProvider(provider)
+
+        # Instance state cache shared by all commands
+        self.cache = CachingProvider(
+            self.coalescer,
+            state_ttls={
+                "running": settings.cache_running_ttl,
+                **dict.fromkeys(STABLE_STATES, settings.cache_stable_ttl),
+                **dict.fromkeys(TRANSITIONAL_STATES, settings.cache_transitional_ttl),
+                "error": 0.0,
+            },
+        )
+        self.cloud: CloudProvider = InstrumentedProvider(self.cache, self.metrics)
+        if ec2 is not None:
+            # Pushed state changes make cached snapshots stale immediately
+            ec2.subscribe(lambda event: self.cache.invalidate(event.instance_id))
+
+        # Keep-alive HTTP client shared by every TShockMonitor
+        self.tshock_http = create_http_client(
+            connect_timeout=settings.tshock_connect_timeout,
+            read_timeout=settings.tshock_read_timeout,
+            max_connections=settings.tshock_max_connections,
+            max_keepalive=settings.tshock_max_keepalive,
+        )
 
-        # Server ID mapping (server name -> instance ID)
-        self.servers: dict[str, str] = {}
+        # Server names and IDs found by tag discovery
+        self.registry = ServerRegistry(
+            self.cloud,
+            tag_key=settings.server_tag_key,
+            refresh_interval=settings.server_refresh_seconds,
+        )
+
+        # Stops servers whose monitors report no players for too long
+        self.autostop = AutoStopScheduler(
+            self.cloud,
+            idle_timeout=settings.auto_stop_minutes * 60,
+            policy=PollPolicy(
+                base_interval=settings.auto_stop_poll_seconds,
+                max_interval=settings.auto_stop_max_poll_seconds,
+            ),
+            max_concurrency=settings.auto_stop_max_concurrency,
+        )
+        self.autostop.instrument(self.metrics)
+        # Configured servers and their monitors, keyed by server ID
+        self.game_servers: dict[str, GameServerSettings] = {}
+        self.monitors: dict[str, PlayerMonitor] = {}
+        # Pushes log file player counts to auto-stop instead of being polled
+        self.log_watcher = LogWatcher()
+        self.log_watcher.subscribe(self.on_player_count_change)
+
+        # Learns when servers are used and starts them shortly before
+        self.prewarm = PrewarmScheduler(
+            self.cloud,
+            DemandTracker(
+                min_weeks=settings.prewarm_min_weeks,
+                path=Path(settings.prewarm_history_file),
+            ),
+            PrewarmPolicy(
+                lead_time=settings.prewarm_lead_minutes * 60,
+                threshold=settings.prewarm_threshold,
+                budget_minutes=settings.prewarm_budget_minutes,
+                window=settings.auto_stop_minutes * 60,
+            ),
+            on_start=self.autostop.wake,
+        )
+        self.autostop.subscribe(self.prewarm.observe)
+
+        # Follows /start requests until the server is reachable
+        self.starts = StartWaiter(
+            self.cloud,
+            initial_delay=settings.start_poll_seconds,
+            max_delay=settings.start_max_poll_seconds,
+            timeout=settings.start_timeout_minutes * 60,
+        )
 
         # Monitoring reporter (optional)
         self.reporter: MonitoringReporter | None = None
@@ -43,11 +180,15 @@ class GameServerBot(commands.Bot):
                 hub_url=settings.beszel_hub_url,
                 email=settings.beszel_email,
                 password=settings.beszel_password,
+                metrics=self.metrics,
             )
             self.reporter = MonitoringReporter(
                 bot=self,
                 beszel=beszel,
                 channel_id=settings.beszel_report_channel_id,
+                history=MetricsHistory(sample_interval=settings.beszel_sample_seconds),
+                realtime=settings.beszel_realtime,
+                channel_ids=settings.beszel_report_channel_ids,
             )
 
     async def setup_hook(self) -> None:
@@ -55,76 +196,305 @@ class GameServerBot(commands.Bot):
         self.tree.add_command(start_command)
         self.tree.add_command(stop_command)
         self.tree.add_command(status_command)
-        await self.tree.sync()
+        await self.sync_command_tree()
+        await self.cloud.start()
+        # Configured names resolve to IDs once discovery has run
+        self.registry.subscribe(self.sync_monitors)
+        await self.sync_monitors()
+        self.registry.start()
+        await self.log_watcher.start()
+        self.autostop.start()
+        self.prewarm.start()
+        if self.metrics_server is not None:
+            await self.metrics_server.start()
+
+    async def sync_command_tree(self) -> None:
+        """Sync commands globally, and to the development guild if one is set."""
+        state_path = Path(self.settings.discord_command_sync_file)
+        force = self.settings.discord_force_command_sync
+        await sync_commands(self.tree, state_path, force=force)
+        if self.settings.discord_dev_guild_id is not None:
+            # Guild commands update instantly, unlike global ones
+            guild = discord.Object(id=self.settings.discord_dev_guild_id)
+            self.tree.copy_global_to(guild=guild)
+            await sync_commands(self.tree, state_path, guild, force=force)
+
+    async def sync_monitors(self) -> None:
+        """Track every configured server in auto-stop under its current ID.
+
+        Configuration keys are server names or IDs. A name that discovery
+        has not resolved yet is tracked under the name itself and moved to
+        the ID on a later sync. Log file monitors are read by the log watcher,
+        which pushes their counts to auto-stop instead of being polled.
+        """
+        self.game_servers = {
+            self.registry.resolve(key): config for key, config in self.settings.game_servers.items()
+        }
+        wanted = {
+            server_id: config
+            for server_id, config in self.game_servers.items()
+            if config.monitor is not None
+        }
+        for server_id in [server_id for server_id in self.monitors if server_id not in wanted]:
+            self.autostop.unregister(server_id)
+            self.log_watcher.remove(server_id)
+            await self.monitors.pop(server_id).close()
+        for server_id, config in wanted.items():
+            if server_id in self.monitors:
+                continue
+            monitor = create_monitor(
+                config, partial(self.cloud.get_server_ip, server_id), client=self.tshock_http
+            )
+            if monitor is None:
+                continue
+            self.monitors[server_id] = monitor
+            pushed = isinstance(monitor, LogFileMonitor)
+            if isinstance(monitor, LogFileMonitor):
+                self.log_watcher.add(server_id, monitor)
+            self.autostop.register(server_id, monitor, pushed=pushed)
+
+    def on_player_count_change(self, change: PlayerCountChange) -> None:
+        """Pass a player count change from a watched log to auto-stop."""
+        self.autostop.push(change.name, change.players)
+
+    def readiness_probe(self, server_id: str) -> ReadinessProbe | None:
+        """Probe telling whether a started server's game answers, if one is configured.
+
+        A configured game port is probed with a TCP connect to the instance;
+        otherwise the server's player monitor must report it available.
+        """
+        config = self.game_servers.get(server_id)
+        if config is not None and config.game_port is not None:
+            return tcp_probe(config.game_port)
+        monitor = self.monitors.get(server_id)
+        if monitor is None:
+            return None
+
+        async def probe(_: ServerSnapshot) -> bool:
+            return await monitor.is_available()
+
+        return probe
 
     async def on_ready(self) -> None:
         """Handle bot ready event."""
         print(f"Logged in as {self.user}")
-        print(f"Mode: {'production' if settings.is_production else 'development'}")
+        print(f"Mode: {'production' if self.settings.is_production else 'development'}")
 
         # Start monitoring reporter if configured
         if self.reporter:
             self.reporter.start()
             print("Monitoring reporter started")
 
+    async def close(self) -> None:
+        """Release cloud provider and HTTP resources and disconnect."""
+        await self.registry.stop()
+        await self.autostop.stop()
+        await self.log_watcher.stop()
+        await self.prewarm.stop()
+        await self.prewarm.tracker.flush()
+        await self.starts.stop()
+        if self.metrics_server is not None:
+            await self.metrics_server.close()
+        for monitor in self.monitors.values():
+            await monitor.close()
+        await self.cloud.close()
+        await self.tshock_http.aclose()
+        if self.reporter:
+            self.reporter.stop()
+            await self.reporter.beszel.close()
+        await super().close()
+
+
+async def defer(interaction: discord.Interaction[GameServerBot]) -> None:
+    """Acknowledge an interaction, recording the Discord round trip."""
+    with interaction.client.metrics.timer("discord", "defer"):
+        await interaction.response.defer()
+
+
+async def followup(
+    interaction: discord.Interaction[GameServerBot], *args: Any, **kwargs: Any
+) -> discord.WebhookMessage | None:
+    """Send a followup message, recording the Discord round trip."""
+    with interaction.client.metrics.timer("discord", "followup"):
+        return await interaction.followup.send(*args, **kwargs)
+
 
-bot = GameServerBot()
+async def show_start_progress(
+    bot: GameServerBot, message: discord.WebhookMessage, server: str, progress: StartProgress
+) -> None:
+    """Edit a /start reply to show how far the start has got."""
+    with bot.metrics.timer("discord", "edit_message"):
+        await message.edit(content=format_start_progress(server, progress))
+
+
+async def server_autocomplete(
+    interaction: discord.Interaction[GameServerBot], current: str
+) -> list[app_commands.Choice[str]]:
+    """Suggest known servers with their cached state, without any cloud call."""
+    bot = interaction.client
+    return [
+        app_commands.Choice(
+            name=format_choice(name, bot.cache.state_of(server_id)),
+            # Overlong names cannot be sent back, but their IDs resolve too
+            value=name if len(name) <= MAX_CHOICE_LENGTH else server_id,
+        )
+        for name, server_id in bot.registry.search(current)
+    ]
 
 
 @app_commands.command(name="start", description="Start a game server")
 @app_commands.describe(server="The server to start")
-async def start_command(interaction: discord.Interaction, server: str) -> None:
+@app_commands.autocomplete(server=server_autocomplete)
+async def start_command(interaction: discord.Interaction[GameServerBot], server: str) -> None:
     """Start a game server."""
-    await interaction.response.defer()
+    bot = interaction.client
+    with bot.metrics.timer("command", "start"):
+        await defer(interaction)
 
-    server_id = bot.servers.get(server, server)
-    success = await bot.cloud.start_server(server_id)
+        server_id = bot.registry.resolve(server)
+        bot.prewarm.demand(server_id)
+        try:
+            success = await bot.cloud.start_server(server_id)
+        except OperationInProgressError as error:
+            await followup(interaction, f"Already in progress: {error.operation} of {server}")
+            return
 
-    if success:
-        await interaction.followup.send(f"Starting server: {server}")
-    else:
-        await interaction.followup.send(f"Failed to start server: {server}")
+        if success:
+            # Pick the server up without waiting out its stopped-state interval
+            bot.autostop.wake(server_id)
+            message = await followup(interaction, f"Starting server: {server}", wait=True)
+            if message is not None:
+                # The reply is edited as the start progresses, so nobody needs /status
+                bot.starts.watch(
+                    server_id,
+                    partial(show_start_progress, bot, message, server),
+                    bot.readiness_probe(server_id),
+                )
+        else:
+            await followup(interaction, f"Failed to start server: {server}")
 
 
 @app_commands.command(name="stop", description="Stop a game server")
 @app_commands.describe(server="The server to stop")
-async def stop_command(interaction: discord.Interaction, server: str) -> None:
+@app_commands.autocomplete(server=server_autocomplete)
+async def stop_command(interaction: discord.Interaction[GameServerBot], server: str) -> None:
     """Stop a game server."""
-    await interaction.response.defer()
+    bot = interaction.client
+    with bot.metrics.timer("command", "stop"):
+        await defer(interaction)
 
-    server_id = bot.servers.get(server, server)
-    success = await bot.cloud.stop_server(server_id)
+        server_id = bot.registry.resolve(server)
+        try:
+            success = await bot.cloud.stop_server(server_id)
+        except OperationInProgressError as error:
+            await followup(interaction, f"Already in progress: {error.operation} of {server}")
+            return
 
-    if success:
-        await interaction.followup.send(f"Stopping server: {server}")
-    else:
-        await interaction.followup.send(f"Failed to stop server: {server}")
+        if success:
+            await followup(interaction, f"Stopping server: {server}")
+        else:
+            await followup(interaction, f"Failed to stop server: {server}")
 
 
 @app_commands.command(name="status", description="Check game server status")
-@app_commands.describe(server="The server to check")
-async def status_command(interaction: discord.Interaction, server: str) -> None:
+@app_commands.describe(server=f"The server to check, or '{FLEET_KEYWORD}' for every server")
+@app_commands.autocomplete(server=server_autocomplete)
+async def status_command(interaction: discord.Interaction[GameServerBot], server: str) -> None:
     """Check game server status."""
-    await interaction.response.defer()
+    bot = interaction.client
+    with bot.metrics.timer("command", "status"):
+        if server == FLEET_KEYWORD:
+            await send_fleet_status(interaction)
+            return
+
+        server_id = bot.registry.resolve(server)
+
+        # Answer immediately from a warm cache, skipping the defer round trip
+        cached = bot.cache.peek(server_id)
+        if cached is not None:
+            with bot.metrics.timer("discord", "send_message"):
+                await interaction.response.send_message(format_snapshot(server, cached))
+            return
+
+        await defer(interaction)
+        snapshot = await bot.cloud.get_server_snapshot(server_id)
+
+        await followup(interaction, format_snapshot(server, snapshot))
+
+
+async def send_fleet_status(interaction: discord.Interaction[GameServerBot]) -> None:
+    """Report every registered server using one batched provider call."""
+    bot = interaction.client
+    await defer(interaction)
+
+    servers = bot.registry.servers
+    if not servers:
+        await followup(interaction, "No servers registered")
+        return
+
+    snapshots = await bot.cloud.get_server_snapshots(list(servers.values()))
+    fields = [
+        (name, format_fleet_entry(snapshots[server_id])) for name, server_id in servers.items()
+    ]
+    embeds = paginate_fields("Fleet Status", fields, color=discord.Color.blue())
+    for batch in group_into_messages(embeds):
+        await followup(interaction, embeds=batch)
+
+
+def format_choice(name: str, state: str | None) -> str:
+    """Label an autocomplete choice, e.g. "terraria (running)"."""
+    label = f"{name} ({state})" if state else name
+    return label[:MAX_CHOICE_LENGTH]
+
+
+def format_fleet_entry(snapshot: ServerSnapshot) -> str:
+    """Render a snapshot as a compact embed field value."""
+    if snapshot.public_ip:
+        return f"{snapshot.state}\n{snapshot.public_ip}"
+    return snapshot.state
+
 
-    server_id = bot.servers.get(server, server)
-    status = await bot.cloud.get_server_status(server_id)
-    ip = await bot.cloud.get_server_ip(server_id)
+def format_start_progress(server: str, progress: StartProgress) -> str:
+    """Render the progress of a start as a /start reply."""
+    elapsed = f"{progress.elapsed:.0f}s"
+    snapshot = progress.snapshot
+    ip = snapshot.public_ip if snapshot is not None else None
+    if progress.stage is StartStage.READY:
+        return f"**{server}** is ready ({elapsed})\nIP: {ip}"
+    if progress.stage is StartStage.ADDRESSED:
+        return f"**{server}** is running ({elapsed})\nIP: {ip}"
+    if progress.stage is StartStage.FAILED:
+        state = snapshot.state if snapshot is not None else "unknown"
+        return f"Failed to start server: {server} (now {state})"
+    if progress.stage is StartStage.TIMED_OUT:
+        return f"**{server}** is still not ready after {elapsed}"
+    if progress.stage is StartStage.RUNNING:
+        return f"Starting server: {server}\nStatus: running, waiting for an IP ({elapsed})"
+    return f"Starting server: {server}\nStatus: {progress.stage} ({elapsed})"
 
-    message = f"**{server}**\nStatus: {status}"
-    if ip:
-        message += f"\nIP: {ip}"
 
-    await interaction.followup.send(message)
+def format_snapshot(server: str, snapshot: ServerSnapshot) -> str:
+    """Render a server snapshot as a status message."""
+    message = f"**{server}**\nStatus: {snapshot.state}"
+    if snapshot.public_ip:
+        message += f"\nIP: {snapshot.public_ip}"
+    if snapshot.instance_type:
+        message += f"\nType: {snapshot.instance_type}"
+    if snapshot.state == "running" and snapshot.launch_time:
+        message += f"\nLaunched: {discord.utils.format_dt(snapshot.launch_time, 'R')}"
+    elif snapshot.state_transition_time:
+        message += f"\nSince: {discord.utils.format_dt(snapshot.state_transition_time, 'R')}"
+    return message
 
 
 def main() -> None:
     """Run the Discord bot."""
+    settings = get_settings()
     if not settings.discord_token:
         print("Error: DISCORD_TOKEN environment variable is required")
         return
 
-    bot.run(settings.discord_token)
+    GameServerBot(settings).run(settings.discord_token)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,41 @@
 """Cloud provider implementations for server management."""
 
-from gameserver_pilot.cloud.base import CloudProvider
-from gameserver_pilot.cloud.ec2 import EC2Provider
+from typing import TYPE_CHECKING, Any
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+from gameserver_pilot.cloud.cache import CachingProvider
+from gameserver_pilot.cloud.coalesce import CoalescingProvider, OperationInProgressError
+from gameserver_pilot.cloud.instrumented import InstrumentedProvider
 from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.cloud.registry import ServerRegistry
+
+if TYPE_CHECKING:
+    from gameserver_pilot.cloud.ec2 import EC2Provider
+    from gameserver_pilot.cloud.multiregion import MultiRegionProvider
+
+__all__ = [
+    "CachingProvider",
+    "CloudProvider",
+    "CoalescingProvider",
+    "EC2Provider",
+    "InstrumentedProvider",
+    "MockProvider",
+    "MultiRegionProvider",
+    "OperationInProgressError",
+    "ServerInfo",
+    "ServerRegistry",
+    "ServerSnapshot",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import AWS providers on first access, so boto3 loads only when it is used."""
+    if name == "EC2Provider":
+        from gameserver_pilot.cloud.ec2 import EC2Provider
+
+        return EC2Provider
+    if name == "MultiRegionProvider":
+        from gameserver_pilot.cloud.multiregion import MultiRegionProvider
 
-__all__ = ["CloudProvider", "EC2Provider", "MockProvider"]
+        return MultiRegionProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
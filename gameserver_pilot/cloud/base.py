@@ -1,6 +1,29 @@
 """Abstract base class for cloud providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ServerSnapshot(BaseModel):
+    """Point-in-time view of a server returned by a single provider call."""
+
+    server_id: str
+    state: str
+    public_ip: str | None = None
+    instance_type: str | None = None
+    launch_time: datetime | None = None
+    state_transition_time: datetime | None = None
+
+
+class ServerInfo(BaseModel):
+    """A game server found by discovery, with the tags identifying it."""
+
+    server_id: str
+    name: str
+    tags: dict[str, str] = {}
 
 
 class CloudProvider(ABC):
@@ -53,3 +76,54 @@ class CloudProvider(ABC):
             Public IP address or None if not available.
         """
         ...
+
+    @abstractmethod
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get state, IP and instance details of a server in one call.
+
+        Args:
+            server_id: The server/instance identifier.
+
+        Returns:
+            Snapshot of the server. The state is "unknown" if the server does
+            not exist and "error" if the provider call failed.
+        """
+        ...
+
+    @abstractmethod
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get snapshots of many servers with as few provider calls as possible.
+
+        Args:
+            server_ids: The server/instance identifiers.
+
+        Returns:
+            Mapping of server ID to snapshot, with an entry for every
+            requested ID (state "unknown" for servers that do not exist).
+        """
+        ...
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Find every game server carrying a tag.
+
+        Args:
+            tag_key: Tag marking game servers. Its value is the server name.
+
+        Returns:
+            Discovered servers. The default implementation finds none.
+        """
+        return []
+
+    async def start(self) -> None:
+        """Start background work such as event ingestion.
+
+        The default implementation has nothing to start.
+        """
+        return
+
+    async def close(self) -> None:
+        """Release resources held by the provider.
+
+        The default implementation has nothing to release.
+        """
+        return
@@ -0,0 +1,212 @@
+"""TTL cache of server snapshots in front of any CloudProvider."""
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+
+STABLE_STATES = ("stopped", "terminated")
+TRANSITIONAL_STATES = ("pending", "stopping", "shutting-down")
+
+DEFAULT_STATE_TTLS: dict[str, float] = {
+    "running": 30.0,
+    **dict.fromkeys(STABLE_STATES, 300.0),
+    **dict.fromkeys(TRANSITIONAL_STATES, 5.0),
+    "error": 0.0,
+}
+DEFAULT_TTL = 5.0
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the snapshot cache."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachingProvider(CloudProvider):
+    """CloudProvider wrapper that caches snapshots with per-state TTLs.
+
+    Stable states are kept longer than transitional ones, and start/stop
+    requests invalidate the affected entry as soon as they complete. Every
+    invalidation bumps a per-server generation; a fetch that was in flight
+    across one is returned to its caller but not cached, so a read that
+    started before a start request cannot store the old state afterwards.
+    """
+
+    def __init__(
+        self,
+        provider: CloudProvider,
+        state_ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the caching provider.
+
+        Args:
+            provider: The provider to wrap.
+            state_ttls: Seconds to keep a snapshot, keyed by server state.
+            default_ttl: TTL for states missing from state_ttls.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.provider = provider
+        self.state_ttls = dict(DEFAULT_STATE_TTLS if state_ttls is None else state_ttls)
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: dict[str, tuple[float, ServerSnapshot]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+
+    def _ttl(self, state: str) -> float:
+        """Return the TTL for a server state."""
+        return self.state_ttls.get(state, self.default_ttl)
+
+    def _lookup(self, server_id: str) -> ServerSnapshot | None:
+        """Return a fresh cached snapshot, evicting it if expired."""
+        entry = self._entries.get(server_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if self._clock() >= expires_at:
+            del self._entries[server_id]
+            return None
+        return snapshot
+
+    def _generation(self, server_id: str) -> tuple[int, int]:
+        """Invalidation count of a server, including invalidations of every entry."""
+        return self._epoch, self._generations.get(server_id, 0)
+
+    def _store(self, snapshot: ServerSnapshot, generation: tuple[int, int]) -> None:
+        """Cache a snapshot according to its state's TTL.
+
+        Args:
+            snapshot: The fetched snapshot.
+            generation: The server's generation when the fetch started;
+                the snapshot is dropped if it was invalidated since.
+        """
+        if self._generation(snapshot.server_id) != generation:
+            return
+        ttl = self._ttl(snapshot.state)
+        if ttl > 0:
+            self._entries[snapshot.server_id] = (self._clock() + ttl, snapshot)
+
+    def peek(self, server_id: str) -> ServerSnapshot | None:
+        """Return a cached snapshot without calling the wrapped provider.
+
+        Hits are counted; misses are not, because the caller is expected to
+        fall back to get_server_snapshot which records the miss.
+
+        Args:
+            server_id: The server/instance identifier.
+
+        Returns:
+            A copy of the cached snapshot, or None if nothing fresh is cached.
+        """
+        snapshot = self._lookup(server_id)
+        if snapshot is None:
+            return None
+        self.stats.hits += 1
+        return snapshot.model_copy()
+
+    def state_of(self, server_id: str) -> str | None:
+        """Return the cached state of a server without counting a lookup.
+
+        Meant for hot paths such as autocomplete that only decorate output
+        with whatever happens to be cached.
+
+        Args:
+            server_id: The server/instance identifier.
+
+        Returns:
+            The state from a fresh cached snapshot, or None if nothing is cached.
+        """
+        snapshot = self._lookup(server_id)
+        return snapshot.state if snapshot is not None else None
+
+    def invalidate(self, server_id: str | None = None) -> None:
+        """Drop one cached entry, or every entry if server_id is None."""
+        if server_id is None:
+            self._entries.clear()
+            self._epoch += 1
+        else:
+            self._entries.pop(server_id, None)
+            self._generations[server_id] = self._generations.get(server_id, 0) + 1
+        self.stats.invalidations += 1
+
+    async def start_server(self, server_id: str) -> bool:
+        """Start a server and invalidate its cached snapshot."""
+        try:
+            return await self.provider.start_server(server_id)
+        finally:
+            self.invalidate(server_id)
+
+    async def stop_server(self, server_id: str) -> bool:
+        """Stop a server and invalidate its cached snapshot."""
+        try:
+            return await self.provider.stop_server(server_id)
+        finally:
+            self.invalidate(server_id)
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get a snapshot from the cache, fetching it on a miss."""
+        cached = self._lookup(server_id)
+        if cached is not None:
+            self.stats.hits += 1
+            return cached.model_copy()
+
+        self.stats.misses += 1
+        generation = self._generation(server_id)
+        snapshot = await self.provider.get_server_snapshot(server_id)
+        self._store(snapshot, generation)
+        return snapshot.model_copy()
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get snapshots from the cache, batch-fetching every miss in one call."""
+        result: dict[str, ServerSnapshot] = {}
+        missing: list[str] = []
+        for server_id in dict.fromkeys(server_ids):
+            cached = self._lookup(server_id)
+            if cached is None:
+                missing.append(server_id)
+            else:
+                result[server_id] = cached.model_copy()
+        self.stats.hits += len(result)
+
+        if missing:
+            self.stats.misses += len(missing)
+            generations = {server_id: self._generation(server_id) for server_id in missing}
+            fetched = await self.provider.get_server_snapshots(missing)
+            for server_id, snapshot in fetched.items():
+                self._store(snapshot, generations[server_id])
+                result[server_id] = snapshot.model_copy()
+        return result
+
+    async def get_server_status(self, server_id: str) -> str:
+        """Get server status via the cached snapshot."""
+        return (await self.get_server_snapshot(server_id)).state
+
+    async def get_server_ip(self, server_id: str) -> str | None:
+        """Get server IP via the cached snapshot."""
+        return (await self.get_server_snapshot(server_id)).public_ip
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Discover servers through the wrapped provider."""
+        return await self.provider.discover_servers(tag_key)
+
+    async def start(self) -> None:
+        """Start the wrapped provider."""
+        await self.provider.start()
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
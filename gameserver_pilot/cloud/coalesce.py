@@ -0,0 +1,211 @@
+"""Single-flight coalescing of concurrent requests to any CloudProvider."""
+
+import asyncio
+from collections.abc import Awaitable, Sequence
+from dataclasses import dataclass
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+
+
+class OperationInProgressError(Exception):
+    """Raised when a server already has a start or stop request in flight."""
+
+    def __init__(self, server_id: str, operation: str) -> None:
+        """Initialize the error.
+
+        Args:
+            server_id: The server/instance identifier.
+            operation: The request in flight, "start" or "stop".
+        """
+        super().__init__(f"{operation} of {server_id} is already in progress")
+        self.server_id = server_id
+        self.operation = operation
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for coalesced provider calls."""
+
+    fetched: int = 0
+    shared: int = 0
+    rejected: int = 0
+
+
+def _consume(future: asyncio.Future[ServerSnapshot]) -> None:
+    """Mark a future's exception as retrieved when every waiter has left."""
+    if not future.cancelled():
+        future.exception()
+
+
+class CoalescingProvider(CloudProvider):
+    """CloudProvider wrapper that collapses bursts of identical requests.
+
+    Snapshot reads of a server share the call already in flight for it, so
+    a burst of /status commands costs one DescribeInstances no matter how
+    many users send it. Batch reads join in-flight calls for the servers
+    they overlap with and fetch the rest in one call. Results are shared
+    between callers and must not be mutated; CachingProvider hands out
+    copies.
+
+    Only one start or stop request per server is sent at a time; later
+    callers get OperationInProgressError instead of a duplicate request.
+    Once a request completes, reads of the server no longer join a call
+    begun before it, which could still report the old state.
+    """
+
+    def __init__(self, provider: CloudProvider) -> None:
+        """Initialize the coalescing provider.
+
+        Args:
+            provider: The provider to wrap.
+        """
+        self.provider = provider
+        self.stats = CoalesceStats()
+        self._snapshots: dict[str, asyncio.Future[ServerSnapshot]] = {}
+        self._operations: dict[str, str] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def _fetch(
+        self, server_ids: list[str], call: Awaitable[dict[str, ServerSnapshot]]
+    ) -> dict[str, asyncio.Future[ServerSnapshot]]:
+        """Register in-flight futures for servers and start the call filling them.
+
+        The call runs in its own task, so a caller giving up does not cancel
+        it for the callers that joined.
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future[ServerSnapshot]] = {}
+        for server_id in server_ids:
+            future: asyncio.Future[ServerSnapshot] = loop.create_future()
+            future.add_done_callback(_consume)
+            futures[server_id] = future
+        self._snapshots.update(futures)
+        self.stats.fetched += 1
+        task = loop.create_task(self._settle(futures, call))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return futures
+
+    async def _settle(
+        self,
+        futures: dict[str, asyncio.Future[ServerSnapshot]],
+        call: Awaitable[dict[str, ServerSnapshot]],
+    ) -> None:
+        """Await a provider call and resolve every future waiting on it."""
+        try:
+            snapshots = await call
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in futures.values():
+                future.set_exception(error)
+        else:
+            for server_id, future in futures.items():
+                snapshot = snapshots.get(server_id)
+                if snapshot is None:
+                    # A provider omitting an ID must not leave its waiters hanging
+                    future.set_exception(KeyError(f"Provider returned no snapshot for {server_id}"))
+                else:
+                    future.set_result(snapshot)
+        finally:
+            for server_id, future in futures.items():
+                if self._snapshots.get(server_id) is future:
+                    del self._snapshots[server_id]
+
+    async def _fetch_one(self, server_id: str) -> dict[str, ServerSnapshot]:
+        """Fetch one snapshot in the shape of a batch result."""
+        return {server_id: await self.provider.get_server_snapshot(server_id)}
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get a snapshot, joining a call already in flight for the server."""
+        future = self._snapshots.get(server_id)
+        if future is None:
+            future = self._fetch([server_id], self._fetch_one(server_id))[server_id]
+        else:
+            self.stats.shared += 1
+        return await asyncio.shield(future)
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get snapshots, batch-fetching only servers with no call in flight."""
+        unique = list(dict.fromkeys(server_ids))
+        futures = {
+            server_id: self._snapshots[server_id]
+            for server_id in unique
+            if server_id in self._snapshots
+        }
+        self.stats.shared += len(futures)
+        missing = [server_id for server_id in unique if server_id not in futures]
+        if missing:
+            futures.update(self._fetch(missing, self.provider.get_server_snapshots(missing)))
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        return dict(zip(futures, results, strict=True))
+
+    async def get_server_status(self, server_id: str) -> str:
+        """Get server status via the shared snapshot call."""
+        return (await self.get_server_snapshot(server_id)).state
+
+    async def get_server_ip(self, server_id: str) -> str | None:
+        """Get server IP via the shared snapshot call."""
+        return (await self.get_server_snapshot(server_id)).public_ip
+
+    def _begin(self, server_id: str, operation: str) -> None:
+        """Claim a server for a start or stop request.
+
+        Raises:
+            OperationInProgressError: If another request holds the server.
+        """
+        current = self._operations.get(server_id)
+        if current is not None:
+            self.stats.rejected += 1
+            raise OperationInProgressError(server_id, current)
+        self._operations[server_id] = operation
+
+    def _detach(self, server_id: str) -> None:
+        """Stop sharing a read begun before a mutation, so later reads fetch anew.
+
+        Callers already waiting on it still get its result.
+        """
+        self._snapshots.pop(server_id, None)
+
+    async def start_server(self, server_id: str) -> bool:
+        """Start a server unless a start or stop of it is in flight.
+
+        Raises:
+            OperationInProgressError: If another request holds the server.
+        """
+        self._begin(server_id, "start")
+        try:
+            return await self.provider.start_server(server_id)
+        finally:
+            del self._operations[server_id]
+            self._detach(server_id)
+
+    async def stop_server(self, server_id: str) -> bool:
+        """Stop a server unless a start or stop of it is in flight.
+
+        Raises:
+            OperationInProgressError: If another request holds the server.
+        """
+        self._begin(server_id, "stop")
+        try:
+            return await self.provider.stop_server(server_id)
+        finally:
+            del self._operations[server_id]
+            self._detach(server_id)
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Discover servers through the wrapped provider."""
+        return await self.provider.discover_servers(tag_key)
+
+    async def start(self) -> None:
+        """Start the wrapped provider."""
+        await self.provider.start()
+
+    async def close(self) -> None:
+        """Cancel calls in flight and close the wrapped provider."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.provider.close()
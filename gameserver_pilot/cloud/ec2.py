@@ -1,26 +1,278 @@
 """AWS EC2 cloud provider implementation."""
 
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from gameserver_pilot.cloud.base import CloudProvider
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+from gameserver_pilot.cloud.events import InstanceStateEvent, InstanceStateListener
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+# Seconds an event-fed snapshot is served before the instance is described again
+DEFAULT_VIEW_MAX_AGE = 300.0
+
+# DescribeInstances accepts at most 200 values per filter and 1000 results per page
+FILTER_VALUES_LIMIT = 200
+DESCRIBE_PAGE_SIZE = 1000
+
+# States in which an instance has released its public IP
+IP_RELEASED_STATES = ("stopping", "stopped", "shutting-down", "terminated")
+# States of instances that can still be started, i.e. worth discovering
+DISCOVERABLE_STATES = ("pending", "running", "stopping", "stopped")
+
+# Adaptive retries back off client-side when EC2 starts throttling
+RETRY_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+
+# StateTransitionReason looks like "User initiated (2024-01-01 12:00:00 GMT)"
+_TRANSITION_TIME_RE = re.compile(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) GMT\)")
+
+
+def _parse_transition_time(reason: str) -> datetime | None:
+    """Extract the timestamp embedded in an EC2 StateTransitionReason."""
+    match = _TRANSITION_TIME_RE.search(reason)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
+
+
+def snapshot_from_instance(instance: dict[str, Any]) -> ServerSnapshot:
+    """Build a ServerSnapshot from a DescribeInstances instance entry."""
+    return ServerSnapshot(
+        server_id=instance["InstanceId"],
+        state=instance.get("State", {}).get("Name", "unknown"),
+        public_ip=instance.get("PublicIpAddress"),
+        instance_type=instance.get("InstanceType"),
+        launch_time=instance.get("LaunchTime"),
+        state_transition_time=_parse_transition_time(instance.get("StateTransitionReason", "")),
+    )
+
+
+@dataclass
+class CallStats:
+    """Accumulated timing for one EC2 API operation."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    queued_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average time the event loop waited for the call."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def record(self, elapsed: float, queued: float) -> None:
+        """Add one completed call to the totals."""
+        self.count += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.queued_seconds += queued
 
 
 class EC2Provider(CloudProvider):
-    """AWS EC2 implementation of CloudProvider."""
+    """AWS EC2 implementation of CloudProvider.
+
+    boto3 is synchronous, so every API call is dispatched to a bounded thread
+    pool and awaited. The event loop (and the Discord gateway heartbeat) keeps
+    running while AWS responds.
 
-    def __init__(self, region: str = "ap-northeast-1") -> None:
+    When a state-change queue is configured, described instances are kept in
+    an in-memory view that EventBridge events keep current, and reads are
+    served from it. Without a queue every read polls DescribeInstances.
+    SQS does not preserve event order, so events older than the state they
+    would replace are ignored, and view entries are described again once
+    they reach a maximum age.
+    """
+
+    def __init__(
+        self,
+        region: str = "ap-northeast-1",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        state_queue_url: str | None = None,
+        view_max_age: float = DEFAULT_VIEW_MAX_AGE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize EC2 provider.
 
         Args:
             region: AWS region name.
+            max_workers: Maximum number of concurrent boto3 calls.
+            state_queue_url: Optional SQS queue receiving EC2 state-change events.
+            view_max_age: Seconds after a describe that an event-fed
+                snapshot may still be served.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.ec2 = boto3.client("ec2", region_name=region, config=RETRY_CONFIG)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ec2-provider"
+        )
+        self.call_stats: dict[str, CallStats] = {}
+
+        self.view_max_age = view_max_age
+        self._clock = clock
+        # Snapshots with the time they were described
+        self._view: dict[str, tuple[float, ServerSnapshot]] = {}
+        self._subscribers: list[Callable[[InstanceStateEvent], None]] = []
+        self.events: InstanceStateListener | None = None
+        if state_queue_url:
+            self.events = InstanceStateListener(state_queue_url, region, self._apply_state_event)
+
+    @property
+    def push_enabled(self) -> bool:
+        """Whether reads are served from the event-fed view."""
+        return self.events is not None and self.events.running
+
+    def subscribe(self, callback: Callable[[InstanceStateEvent], None]) -> None:
+        """Register a callback invoked for every ingested state change event."""
+        self._subscribers.append(callback)
+
+    def _apply_state_event(self, event: InstanceStateEvent) -> None:
+        """Update the in-memory view from a state change event.
+
+        Events older than the last transition of the viewed instance arrived
+        out of order and are ignored.
+        """
+        entry = self._view.get(event.instance_id)
+        snapshot = entry[1] if entry is not None else None
+        if (
+            snapshot is not None
+            and event.time is not None
+            and snapshot.state_transition_time is not None
+            and event.time < snapshot.state_transition_time
+        ):
+            logger.debug("Ignoring out-of-order %s event for %s", event.state, event.instance_id)
+            return
+        if snapshot is not None:
+            if event.state == "running" and snapshot.public_ip is None:
+                # The newly assigned IP is only available from DescribeInstances
+                del self._view[event.instance_id]
+            else:
+                snapshot.state = event.state
+                snapshot.state_transition_time = event.time
+                if event.state in IP_RELEASED_STATES:
+                    snapshot.public_ip = None
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("State event subscriber failed for %s", event.instance_id)
+
+    def _viewed(self, server_id: str) -> ServerSnapshot | None:
+        """Return the event-fed snapshot of an instance, if available."""
+        if not self.push_enabled:
+            return None
+        entry = self._view.get(server_id)
+        if entry is None:
+            return None
+        described, snapshot = entry
+        if self._clock() - described >= self.view_max_age:
+            del self._view[server_id]
+            return None
+        return snapshot.model_copy()
+
+    def _remember(self, snapshot: ServerSnapshot) -> None:
+        """Add a described instance to the event-fed view."""
+        if self.events is not None and snapshot.state not in ("error", "unknown"):
+            self._view[snapshot.server_id] = (self._clock(), snapshot.model_copy())
+
+    async def _call(self, operation: str, **kwargs: Any) -> dict[str, Any]:
+        """Run a boto3 EC2 operation on the executor and await its result.
+
+        Args:
+            operation: boto3 client method name (e.g., "describe_instances").
+            **kwargs: Parameters passed to the boto3 method.
+
+        Returns:
+            The boto3 response dictionary.
+
+        Raises:
+            ClientError: If the AWS API call fails.
         """
-        self.ec2 = boto3.client("ec2", region_name=region)
+        method = getattr(self.ec2, operation)
+        return await self._call_sync(operation, lambda: method(**kwargs))
+
+    async def _call_sync(
+        self, operation: str, func: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Run a blocking boto3 callable on the executor and record its timing.
+
+        Args:
+            operation: Name used for call_stats and logging.
+            func: Callable performing the blocking AWS request(s).
+
+        Returns:
+            The callable's result.
+        """
+        submitted = time.perf_counter()
+        started = submitted
+
+        def invoke() -> dict[str, Any]:
+            nonlocal started
+            started = time.perf_counter()
+            return func()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, invoke)
+        finally:
+            elapsed = time.perf_counter() - submitted
+            queued = started - submitted
+            self.call_stats.setdefault(operation, CallStats()).record(elapsed, queued)
+            logger.debug("EC2 %s awaited %.3fs (queued %.3fs)", operation, elapsed, queued)
+
+    async def _describe_all(self, **kwargs: Any) -> list[dict[str, Any]]:
+        """Run a paginated DescribeInstances on the executor.
+
+        Args:
+            **kwargs: Parameters passed to every DescribeInstances page.
+
+        Returns:
+            Every instance across all pages and reservations.
+
+        Raises:
+            ClientError: If the AWS API call fails.
+        """
+
+        def paginate() -> dict[str, Any]:
+            paginator = self.ec2.get_paginator("describe_instances")
+            instances: list[Any] = []
+            pages = paginator.paginate(**kwargs, PaginationConfig={"PageSize": DESCRIBE_PAGE_SIZE})
+            for page in pages:
+                for reservation in page.get("Reservations", []):
+                    instances.extend(reservation.get("Instances", []))
+            return {"Instances": instances}
+
+        response = await self._call_sync("describe_instances", paginate)
+        instances: list[dict[str, Any]] = response["Instances"]
+        return instances
+
+    async def _describe_instance(self, server_id: str) -> dict[str, Any] | None:
+        """Describe a single instance, returning None when it is not found."""
+        response = await self._call("describe_instances", InstanceIds=[server_id])
+        reservations = response.get("Reservations", [])
+        if reservations:
+            instances = reservations[0].get("Instances", [])
+            if instances:
+                instance: dict[str, Any] = instances[0]
+                return instance
+        return None
 
     async def start_server(self, server_id: str) -> bool:
         """Start an EC2 instance."""
         try:
-            self.ec2.start_instances(InstanceIds=[server_id])
+            await self._call("start_instances", InstanceIds=[server_id])
+            self._view.pop(server_id, None)
             return True
         except ClientError:
             return False
@@ -28,33 +280,102 @@ class EC2Provider(CloudProvider):
     async def stop_server(self, server_id: str) -> bool:
         """Stop an EC2 instance."""
         try:
-            self.ec2.stop_instances(InstanceIds=[server_id])
+            await self._call("stop_instances", InstanceIds=[server_id])
+            self._view.pop(server_id, None)
             return True
         except ClientError:
             return False
 
     async def get_server_status(self, server_id: str) -> str:
         """Get EC2 instance status."""
-        try:
-            response = self.ec2.describe_instances(InstanceIds=[server_id])
-            reservations = response.get("Reservations", [])
-            if reservations:
-                instances = reservations[0].get("Instances", [])
-                if instances:
-                    return instances[0].get("State", {}).get("Name", "unknown")
-            return "unknown"
-        except ClientError:
-            return "error"
+        return (await self.get_server_snapshot(server_id)).state
 
     async def get_server_ip(self, server_id: str) -> str | None:
         """Get EC2 instance public IP."""
+        return (await self.get_server_snapshot(server_id)).public_ip
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get EC2 instance state and details with at most one DescribeInstances call."""
+        viewed = self._viewed(server_id)
+        if viewed is not None:
+            return viewed
+
         try:
-            response = self.ec2.describe_instances(InstanceIds=[server_id])
-            reservations = response.get("Reservations", [])
-            if reservations:
-                instances = reservations[0].get("Instances", [])
-                if instances:
-                    return instances[0].get("PublicIpAddress")
-            return None
+            instance = await self._describe_instance(server_id)
         except ClientError:
-            return None
+            return ServerSnapshot(server_id=server_id, state="error")
+        if instance is None:
+            return ServerSnapshot(server_id=server_id, state="unknown")
+        snapshot = snapshot_from_instance(instance)
+        self._remember(snapshot)
+        return snapshot
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get snapshots of many instances with paginated DescribeInstances calls.
+
+        Instance IDs are passed as an instance-id filter rather than
+        InstanceIds, so unknown IDs are simply absent from the result instead
+        of failing the whole request. One request is made per 200 IDs.
+        """
+        result: dict[str, ServerSnapshot] = {}
+        to_describe: list[str] = []
+        for server_id in dict.fromkeys(server_ids):
+            viewed = self._viewed(server_id)
+            if viewed is None:
+                to_describe.append(server_id)
+            else:
+                result[server_id] = viewed
+
+        for offset in range(0, len(to_describe), FILTER_VALUES_LIMIT):
+            chunk = to_describe[offset : offset + FILTER_VALUES_LIMIT]
+            try:
+                instances = await self._describe_all(
+                    Filters=[{"Name": "instance-id", "Values": chunk}]
+                )
+            except ClientError:
+                logger.exception("DescribeInstances failed for %d instances", len(chunk))
+                result.update(
+                    (server_id, ServerSnapshot(server_id=server_id, state="error"))
+                    for server_id in chunk
+                )
+                continue
+            for instance in instances:
+                snapshot = snapshot_from_instance(instance)
+                self._remember(snapshot)
+                result[snapshot.server_id] = snapshot
+
+        for server_id in to_describe:
+            result.setdefault(server_id, ServerSnapshot(server_id=server_id, state="unknown"))
+        return result
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Find tagged instances with one filtered, paginated DescribeInstances.
+
+        Terminated instances are skipped. A server is named by its tag value,
+        falling back to its Name tag and then its instance ID.
+        """
+        instances = await self._describe_all(
+            Filters=[
+                {"Name": "tag-key", "Values": [tag_key]},
+                {"Name": "instance-state-name", "Values": list(DISCOVERABLE_STATES)},
+            ]
+        )
+        servers = []
+        for instance in instances:
+            self._remember(snapshot_from_instance(instance))
+            tags = {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
+            server_id = instance["InstanceId"]
+            name = tags.get(tag_key) or tags.get("Name") or server_id
+            servers.append(ServerInfo(server_id=server_id, name=name, tags=tags))
+        return servers
+
+    async def start(self) -> None:
+        """Start consuming state change events if a queue is configured."""
+        if self.events is not None:
+            self.events.start()
+
+    async def close(self) -> None:
+        """Stop event ingestion and shut down the executor used for boto3 calls."""
+        if self.events is not None:
+            await self.events.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,176 @@
+"""Push-based EC2 instance state ingestion from an SQS queue.
+
+EventBridge rules matching "EC2 Instance State-change Notification" can
+target an SQS queue (directly or through SNS). The listener long-polls that
+queue and hands every state change to a callback.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+STATE_CHANGE_DETAIL_TYPE = "EC2 Instance State-change Notification"
+LONG_POLL_SECONDS = 20
+MAX_BATCH_MESSAGES = 10
+INITIAL_ERROR_BACKOFF_SECONDS = 1.0
+MAX_ERROR_BACKOFF_SECONDS = 60.0
+
+
+class InstanceStateEvent(BaseModel):
+    """A single EC2 instance state transition."""
+
+    instance_id: str
+    state: str
+    time: datetime | None = None
+
+
+def parse_state_event(body: str) -> InstanceStateEvent | None:
+    """Parse an SQS message body into a state change event.
+
+    Accepts raw EventBridge events as well as events wrapped in an SNS
+    notification envelope.
+
+    Args:
+        body: The SQS message body.
+
+    Returns:
+        The parsed event, or None if the message is not a state change.
+    """
+    try:
+        payload: Any = json.loads(body)
+        if isinstance(payload, dict) and payload.get("Type") == "Notification":
+            payload = json.loads(payload["Message"])
+        if not isinstance(payload, dict) or payload.get("detail-type") != STATE_CHANGE_DETAIL_TYPE:
+            return None
+        detail = payload["detail"]
+        return InstanceStateEvent(
+            instance_id=detail["instance-id"],
+            state=detail["state"],
+            time=payload.get("time"),
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class InstanceStateListener:
+    """Long-polls an SQS queue for EC2 state changes."""
+
+    def __init__(
+        self,
+        queue_url: str,
+        region: str,
+        handler: Callable[[InstanceStateEvent], None],
+        wait_seconds: int = LONG_POLL_SECONDS,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            queue_url: URL of the SQS queue receiving EventBridge events.
+            region: AWS region of the queue.
+            handler: Called for every parsed state change event.
+            wait_seconds: SQS long polling wait time.
+        """
+        self.queue_url = queue_url
+        self.handler = handler
+        self.wait_seconds = wait_seconds
+        self.sqs = boto3.client("sqs", region_name=region)
+        # Long polls block a thread for up to wait_seconds, so they get their
+        # own worker instead of competing with EC2 API calls.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqs-listener")
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background polling task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def poll_once(self) -> int:
+        """Receive one batch of messages, dispatch events and delete the handled ones.
+
+        Returns:
+            Number of state change events dispatched.
+
+        Raises:
+            ClientError: If the SQS API rejects a call.
+            BotoCoreError: If SQS cannot be reached.
+        """
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executor,
+            lambda: self.sqs.receive_message(
+                QueueUrl=self.queue_url,
+                MaxNumberOfMessages=MAX_BATCH_MESSAGES,
+                WaitTimeSeconds=self.wait_seconds,
+            ),
+        )
+        messages = response.get("Messages", [])
+        if not messages:
+            return 0
+
+        dispatched = 0
+        done: list[dict[str, Any]] = []
+        for message in messages:
+            event = parse_state_event(message.get("Body", ""))
+            if event is None:
+                # Unrecognized messages are deleted too, so they cannot loop forever
+                logger.warning("Discarding unrecognized message %s", message.get("MessageId"))
+                done.append(message)
+                continue
+            try:
+                self.handler(event)
+            except Exception:
+                # Left on the queue, so SQS redelivers it (or moves it to a DLQ)
+                logger.exception("Failed to handle state event for %s", event.instance_id)
+                continue
+            dispatched += 1
+            done.append(message)
+
+        if not done:
+            return dispatched
+        entries = [
+            {"Id": str(index), "ReceiptHandle": message["ReceiptHandle"]}
+            for index, message in enumerate(done)
+        ]
+        await loop.run_in_executor(
+            self._executor,
+            lambda: self.sqs.delete_message_batch(QueueUrl=self.queue_url, Entries=entries),
+        )
+        return dispatched
+
+    async def _run(self) -> None:
+        """Poll until cancelled, backing off on API and network errors."""
+        backoff = INITIAL_ERROR_BACKOFF_SECONDS
+        while True:
+            try:
+                await self.poll_once()
+                backoff = INITIAL_ERROR_BACKOFF_SECONDS
+            except (ClientError, BotoCoreError):
+                logger.exception("Failed to receive EC2 state events, retrying in %.0fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, MAX_ERROR_BACKOFF_SECONDS)
+
+    def start(self) -> None:
+        """Start the background polling task."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and release the worker thread."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
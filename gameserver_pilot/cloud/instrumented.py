@@ -0,0 +1,69 @@
+"""Cloud provider wrapper that records call metrics."""
+
+from collections.abc import Sequence
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+from gameserver_pilot.metrics import MetricsRegistry
+
+COMPONENT = "cloud"
+
+
+class InstrumentedProvider(CloudProvider):
+    """Records count, errors and latency of every call to a wrapped provider.
+
+    Wrap the outermost provider so the numbers reflect what callers see,
+    including cache hits.
+    """
+
+    def __init__(self, provider: CloudProvider, metrics: MetricsRegistry) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            provider: The provider to measure.
+            metrics: Registry receiving the measurements.
+        """
+        self.provider = provider
+        self.metrics = metrics
+
+    async def start_server(self, server_id: str) -> bool:
+        """Start a server, recording the call."""
+        with self.metrics.timer(COMPONENT, "start_server"):
+            return await self.provider.start_server(server_id)
+
+    async def stop_server(self, server_id: str) -> bool:
+        """Stop a server, recording the call."""
+        with self.metrics.timer(COMPONENT, "stop_server"):
+            return await self.provider.stop_server(server_id)
+
+    async def get_server_status(self, server_id: str) -> str:
+        """Get a server status, recording the call."""
+        with self.metrics.timer(COMPONENT, "get_server_status"):
+            return await self.provider.get_server_status(server_id)
+
+    async def get_server_ip(self, server_id: str) -> str | None:
+        """Get a server IP, recording the call."""
+        with self.metrics.timer(COMPONENT, "get_server_ip"):
+            return await self.provider.get_server_ip(server_id)
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get a server snapshot, recording the call."""
+        with self.metrics.timer(COMPONENT, "get_server_snapshot"):
+            return await self.provider.get_server_snapshot(server_id)
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get several server snapshots, recording the call."""
+        with self.metrics.timer(COMPONENT, "get_server_snapshots"):
+            return await self.provider.get_server_snapshots(server_ids)
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Discover servers, recording the call."""
+        with self.metrics.timer(COMPONENT, "discover_servers"):
+            return await self.provider.discover_servers(tag_key)
+
+    async def start(self) -> None:
+        """Start the wrapped provider."""
+        await self.provider.start()
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
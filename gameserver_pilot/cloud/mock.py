@@ -1,6 +1,9 @@
 """Mock cloud provider for development and testing."""
 
-from gameserver_pilot.cloud.base import CloudProvider
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
 
 
 class MockProvider(CloudProvider):
@@ -8,36 +11,62 @@ class MockProvider(CloudProvider):
 
     def __init__(self) -> None:
         """Initialize mock provider with simulated server states."""
-        self._servers: dict[str, dict[str, str | None]] = {
-            "terraria": {"status": "stopped", "ip": None},
-            "corekeeper": {"status": "stopped", "ip": None},
+        self._servers: dict[str, ServerSnapshot] = {
+            "terraria": ServerSnapshot(
+                server_id="terraria", state="stopped", instance_type="t3.small"
+            ),
+            "corekeeper": ServerSnapshot(
+                server_id="corekeeper", state="stopped", instance_type="t3.medium"
+            ),
         }
 
     async def start_server(self, server_id: str) -> bool:
         """Simulate starting a server."""
         if server_id in self._servers:
-            self._servers[server_id]["status"] = "running"
-            self._servers[server_id]["ip"] = f"192.168.1.{hash(server_id) % 255}"
+            now = datetime.now(UTC)
+            server = self._servers[server_id]
+            server.state = "running"
+            server.public_ip = f"192.168.1.{hash(server_id) % 255}"
+            server.launch_time = now
+            server.state_transition_time = now
             return True
         return False
 
     async def stop_server(self, server_id: str) -> bool:
         """Simulate stopping a server."""
         if server_id in self._servers:
-            self._servers[server_id]["status"] = "stopped"
-            self._servers[server_id]["ip"] = None
+            server = self._servers[server_id]
+            server.state = "stopped"
+            server.public_ip = None
+            server.state_transition_time = datetime.now(UTC)
             return True
         return False
 
     async def get_server_status(self, server_id: str) -> str:
         """Get simulated server status."""
         if server_id in self._servers:
-            return str(self._servers[server_id]["status"])
+            return self._servers[server_id].state
         return "unknown"
 
     async def get_server_ip(self, server_id: str) -> str | None:
         """Get simulated server IP."""
         if server_id in self._servers:
-            ip = self._servers[server_id]["ip"]
-            return str(ip) if ip else None
+            return self._servers[server_id].public_ip
         return None
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get a copy of the simulated server state."""
+        if server_id in self._servers:
+            return self._servers[server_id].model_copy()
+        return ServerSnapshot(server_id=server_id, state="unknown")
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get copies of the simulated state of several servers."""
+        return {server_id: await self.get_server_snapshot(server_id) for server_id in server_ids}
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Report every simulated server, named after its ID."""
+        return [
+            ServerInfo(server_id=server_id, name=server_id, tags={tag_key: server_id})
+            for server_id in self._servers
+        ]
@@ -0,0 +1,183 @@
+"""Cloud provider spanning several AWS regions."""
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Self
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo, ServerSnapshot
+from gameserver_pilot.cloud.ec2 import DEFAULT_MAX_WORKERS, EC2Provider
+
+# Snapshot states that do not tell which region owns an instance
+UNRESOLVED_STATES = ("unknown", "error")
+
+
+def merge_snapshots(server_id: str, candidates: Sequence[ServerSnapshot]) -> ServerSnapshot:
+    """Pick the answer of the region that owns a server.
+
+    Args:
+        server_id: The server/instance identifier.
+        candidates: Snapshots of the server from the regions asked.
+
+    Returns:
+        The first snapshot from a region that knows the server. Otherwise
+        "error" if any region failed, so a failure is not mistaken for a
+        missing server, and "unknown" if no region has it.
+    """
+    for snapshot in candidates:
+        if snapshot.state not in UNRESOLVED_STATES:
+            return snapshot
+    if any(snapshot.state == "error" for snapshot in candidates):
+        return ServerSnapshot(server_id=server_id, state="error")
+    return ServerSnapshot(server_id=server_id, state="unknown")
+
+
+class MultiRegionProvider(CloudProvider):
+    """Routes calls to per-region providers and fans fleet calls out to all.
+
+    Instance IDs are unique across regions but do not say which region owns
+    them, so the owning region of every server seen is kept in an index.
+    Calls for a single server go to its region; a server not in the index
+    is looked up in every region at once. Fleet-wide calls ask all regions
+    concurrently, so they take as long as the slowest region rather than
+    the sum of all of them.
+    """
+
+    def __init__(self, providers: Mapping[str, CloudProvider]) -> None:
+        """Initialize the provider.
+
+        Args:
+            providers: Provider for each region, keyed by region name.
+
+        Raises:
+            ValueError: If no region is given.
+        """
+        if not providers:
+            raise ValueError("At least one region is required")
+        self.providers = dict(providers)
+        self.regions: dict[str, str] = {}
+
+    @classmethod
+    def for_regions(cls, regions: Sequence[str], max_workers: int = DEFAULT_MAX_WORKERS) -> Self:
+        """Create a provider with one EC2 client per region.
+
+        Args:
+            regions: AWS region names.
+            max_workers: Maximum number of concurrent boto3 calls per region.
+
+        Returns:
+            The multi-region provider.
+        """
+        return cls(
+            {
+                region: EC2Provider(region=region, max_workers=max_workers)
+                for region in dict.fromkeys(regions)
+            }
+        )
+
+    def _learn(self, snapshots: Mapping[str, ServerSnapshot], region: str) -> None:
+        """Record the region of every server a region reported."""
+        for server_id, snapshot in snapshots.items():
+            if snapshot.state not in UNRESOLVED_STATES:
+                self.regions[server_id] = region
+
+    async def _locate(self, server_id: str) -> ServerSnapshot:
+        """Ask every region for a server not in the index and remember its owner.
+
+        The batch call is used because it reports a server a region does not
+        have as "unknown", where a single lookup by ID fails with an error.
+        """
+        return (await self.get_server_snapshots([server_id]))[server_id]
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        """Get a snapshot from the owning region, locating the server if needed.
+
+        The owning region is asked through its batch call as well, so a
+        server that left it reads as "unknown" and is located again, while
+        "error" is kept for real failures of the region.
+        """
+        region = self.regions.get(server_id)
+        if region is not None:
+            provider = self.providers[region]
+            snapshot = (await provider.get_server_snapshots([server_id]))[server_id]
+            if snapshot.state != "unknown":
+                return snapshot
+            # Gone from the region it was seen in; look again everywhere
+            del self.regions[server_id]
+        return await self._locate(server_id)
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        """Get snapshots from every region concurrently.
+
+        Servers in the index are asked of their own region only; the rest
+        are asked of every region in the same round of calls.
+        """
+        unique = list(dict.fromkeys(server_ids))
+        requests = {
+            region: [
+                server_id for server_id in unique if self.regions.get(server_id, region) == region
+            ]
+            for region in self.providers
+        }
+        regions = [region for region, ids in requests.items() if ids]
+        responses = await asyncio.gather(
+            *(self.providers[region].get_server_snapshots(requests[region]) for region in regions)
+        )
+
+        candidates: dict[str, list[ServerSnapshot]] = {server_id: [] for server_id in unique}
+        for region, snapshots in zip(regions, responses, strict=True):
+            self._learn(snapshots, region)
+            for server_id, snapshot in snapshots.items():
+                candidates[server_id].append(snapshot)
+        return {
+            server_id: merge_snapshots(server_id, snapshots)
+            for server_id, snapshots in candidates.items()
+        }
+
+    async def get_server_status(self, server_id: str) -> str:
+        """Get server status from the owning region."""
+        return (await self.get_server_snapshot(server_id)).state
+
+    async def get_server_ip(self, server_id: str) -> str | None:
+        """Get server IP from the owning region."""
+        return (await self.get_server_snapshot(server_id)).public_ip
+
+    async def _owner(self, server_id: str) -> CloudProvider | None:
+        """Provider of the region owning a server, locating it if needed."""
+        if server_id not in self.regions:
+            await self._locate(server_id)
+        region = self.regions.get(server_id)
+        return self.providers[region] if region is not None else None
+
+    async def start_server(self, server_id: str) -> bool:
+        """Start a server in its region."""
+        provider = await self._owner(server_id)
+        return await provider.start_server(server_id) if provider is not None else False
+
+    async def stop_server(self, server_id: str) -> bool:
+        """Stop a server in its region."""
+        provider = await self._owner(server_id)
+        return await provider.stop_server(server_id) if provider is not None else False
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        """Discover servers in every region concurrently.
+
+        A failure in any region fails the whole discovery, so a registry
+        keeps its previous index rather than dropping a region's servers.
+        """
+        regions = list(self.providers)
+        results = await asyncio.gather(
+            *(self.providers[region].discover_servers(tag_key) for region in regions)
+        )
+        servers: list[ServerInfo] = []
+        for region, discovered in zip(regions, results, strict=True):
+            self.regions.update((info.server_id, region) for info in discovered)
+            servers.extend(discovered)
+        return servers
+
+    async def start(self) -> None:
+        """Start every regional provider."""
+        await asyncio.gather(*(provider.start() for provider in self.providers.values()))
+
+    async def close(self) -> None:
+        """Close every regional provider."""
+        await asyncio.gather(*(provider.close() for provider in self.providers.values()))
@@ -0,0 +1,101 @@
+"""Prefix and substring search over server names for autocomplete."""
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+# Discord shows at most 25 autocomplete choices
+MAX_RESULTS = 25
+# Length of the substrings indexed for matches in the middle of a name
+NGRAM = 3
+WORD_SEPARATORS = re.compile(r"[\s_\-.:/]+")
+
+
+def _ngrams(text: str) -> set[str]:
+    """Every substring of NGRAM characters."""
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class NameIndex:
+    """Immutable index answering name queries without scanning every name.
+
+    Matches are ranked: names starting with the query, then names with a
+    later word starting with it, then names containing it anywhere (for
+    queries of at least NGRAM characters). Matching ignores case. Each tier
+    is found by binary search over sorted keys or by intersecting n-gram
+    posting lists, so lookups stay fast for fleets of thousands of names.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Build the index.
+
+        Args:
+            names: Names to index; duplicates are ignored.
+        """
+        self.names = sorted(set(names), key=str.casefold)
+        self._folded = [name.casefold() for name in self.names]
+        words = sorted(
+            (word, position)
+            for position, name in enumerate(self._folded)
+            for word in WORD_SEPARATORS.split(name)[1:]
+            if word
+        )
+        self._word_keys = [word for word, _ in words]
+        self._word_positions = [position for _, position in words]
+        postings: dict[str, list[int]] = {}
+        for position, name in enumerate(self._folded):
+            for gram in _ngrams(name):
+                postings.setdefault(gram, []).append(position)
+        self._postings = postings
+
+    def __len__(self) -> int:
+        """Number of indexed names."""
+        return len(self.names)
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[str]:
+        """Find names matching a partial query.
+
+        Args:
+            query: What the user typed so far.
+            limit: Maximum number of names returned.
+
+        Returns:
+            Matching names, best matches first. An empty query returns the
+            first names alphabetically.
+        """
+        folded = query.strip().casefold()
+        if not folded:
+            return self.names[:limit]
+        found: dict[int, None] = {}
+        for tier in (self._prefixed, self._word_prefixed, self._containing):
+            for position in tier(folded):
+                found.setdefault(position)
+                if len(found) >= limit:
+                    return [self.names[position] for position in found]
+        return [self.names[position] for position in found]
+
+    def _prefixed(self, query: str) -> Iterator[int]:
+        """Positions of names starting with the query, in name order."""
+        position = bisect_left(self._folded, query)
+        while position < len(self._folded) and self._folded[position].startswith(query):
+            yield position
+            position += 1
+
+    def _word_prefixed(self, query: str) -> Iterator[int]:
+        """Positions of names with a later word starting with the query."""
+        index = bisect_left(self._word_keys, query)
+        while index < len(self._word_keys) and self._word_keys[index].startswith(query):
+            yield self._word_positions[index]
+            index += 1
+
+    def _containing(self, query: str) -> Iterator[int]:
+        """Positions of names containing the query, in name order."""
+        if len(query) < NGRAM:
+            return
+        lists = sorted((self._postings.get(gram, []) for gram in _ngrams(query)), key=len)
+        if not lists[0]:
+            return
+        others = [set(postings) for postings in lists[1:]]
+        for position in lists[0]:
+            if all(position in other for other in others) and query in self._folded[position]:
+                yield position
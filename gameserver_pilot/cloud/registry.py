@@ -0,0 +1,160 @@
+"""In-memory index of game servers found by tag discovery."""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerInfo
+from gameserver_pilot.cloud.names import MAX_RESULTS, NameIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAG_KEY = "GameServer"
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Called without arguments after every successful refresh
+RefreshCallback = Callable[[], Awaitable[None] | None]
+
+
+class ServerRegistry:
+    """Maps server names to IDs using periodic discovery.
+
+    One discovery call finds every tagged server; the results are indexed
+    by name (case-insensitive) and by ID, so commands resolve names with a
+    dictionary lookup instead of a provider call. A background task keeps
+    the indexes fresh, and the previous indexes stay in place when a
+    refresh fails.
+    """
+
+    def __init__(
+        self,
+        cloud: CloudProvider,
+        tag_key: str = DEFAULT_TAG_KEY,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            cloud: Provider used for discovery.
+            tag_key: Tag marking game servers. Its value is the server name.
+            refresh_interval: Seconds between background refreshes.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.cloud = cloud
+        self.tag_key = tag_key
+        self.refresh_interval = refresh_interval
+        self.refreshed_at: float | None = None
+        self._clock = clock
+        self._by_name: dict[str, ServerInfo] = {}
+        self._by_id: dict[str, ServerInfo] = {}
+        self._servers: dict[str, str] = {}
+        self._index = NameIndex(())
+        self._callbacks: list[RefreshCallback] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def servers(self) -> dict[str, str]:
+        """Server IDs keyed by display name, sorted by name."""
+        return self._servers
+
+    def __len__(self) -> int:
+        """Number of known servers."""
+        return len(self._by_id)
+
+    def resolve(self, name: str) -> str:
+        """Return the ID of a named server.
+
+        Args:
+            name: Server name (any case) or server ID.
+
+        Returns:
+            The server's ID, or name unchanged if it names no known server,
+            so raw IDs keep working.
+        """
+        info = self._by_name.get(name.casefold())
+        return info.server_id if info is not None else name
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[tuple[str, str]]:
+        """Find servers whose names match a partial query, from memory only.
+
+        Args:
+            query: What the user typed so far.
+            limit: Maximum number of servers returned.
+
+        Returns:
+            (name, server ID) pairs, best matches first.
+        """
+        return [(name, self._servers[name]) for name in self._index.search(query, limit)]
+
+    def get(self, server_id: str) -> ServerInfo | None:
+        """Return what discovery knows about a server, if anything."""
+        return self._by_id.get(server_id)
+
+    def subscribe(self, callback: RefreshCallback) -> None:
+        """Register a sync or async callback run after every successful refresh."""
+        self._callbacks.append(callback)
+
+    async def refresh(self) -> None:
+        """Rebuild both indexes from one discovery call.
+
+        The indexes are replaced only if discovery succeeds; provider errors
+        propagate to the caller. Subscribers run after the indexes are
+        replaced, and their errors are logged.
+        """
+        discovered = await self.cloud.discover_servers(self.tag_key)
+        by_name: dict[str, ServerInfo] = {}
+        for info in sorted(discovered, key=lambda info: info.server_id):
+            key = info.name.casefold()
+            if key in by_name:
+                logger.warning(
+                    "Servers %s and %s are both named %s; keeping the first",
+                    by_name[key].server_id,
+                    info.server_id,
+                    info.name,
+                )
+                continue
+            by_name[key] = info
+        self._by_name = by_name
+        self._by_id = {info.server_id: info for info in discovered}
+        self._servers = {
+            info.name: info.server_id
+            for info in sorted(by_name.values(), key=lambda info: info.name.casefold())
+        }
+        self._index = NameIndex(self._servers)
+        self.refreshed_at = self._clock()
+        logger.info("Discovered %d game servers tagged %s", len(discovered), self.tag_key)
+        for callback in self._callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Server registry callback failed")
+
+    async def _refresh_forever(self) -> None:
+        """Refresh immediately, then on every interval."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Server discovery failed, keeping %d known servers", len(self))
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Start refreshing in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
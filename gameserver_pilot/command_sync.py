@@ -0,0 +1,92 @@
+"""Syncing the Discord command tree only when it has changed."""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import discord
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+# Scope name of commands registered for every guild
+GLOBAL_SCOPE = "global"
+
+
+def tree_fingerprint(
+    tree: app_commands.CommandTree[Any], guild: discord.abc.Snowflake | None = None
+) -> str:
+    """Hash the payload a sync would upload for one scope.
+
+    Args:
+        tree: Command tree with every command added
+        guild: Guild whose commands are hashed, or None for global commands
+
+    Returns:
+        Hex digest that changes whenever the uploaded commands would
+    """
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command["type"], command["name"]),
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def load_fingerprints(path: Path) -> dict[str, str]:
+    """Read the fingerprints of previous syncs, treating unreadable files as empty."""
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.warning("Ignoring unreadable command sync state: %s", path)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(scope): str(fingerprint) for scope, fingerprint in data.items()}
+
+
+def save_fingerprints(path: Path, fingerprints: dict[str, str]) -> None:
+    """Write fingerprints atomically so a crash never leaves a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_text(json.dumps(fingerprints, indent=2, sort_keys=True))
+    temporary.replace(path)
+
+
+async def sync_commands(
+    tree: app_commands.CommandTree[Any],
+    state_path: Path,
+    guild: discord.abc.Snowflake | None = None,
+    force: bool = False,
+) -> bool:
+    """Sync the command tree unless it matches the last synced fingerprint.
+
+    Syncing is a slow, heavily rate-limited call, so restarts that do not
+    change any command skip it. Fingerprints are stored per application and
+    scope, and only after Discord accepted the sync.
+
+    Args:
+        tree: Command tree with every command added
+        state_path: JSON file holding fingerprints of previous syncs
+        guild: Guild to sync, or None to sync global commands
+        force: Sync even if the fingerprint is unchanged
+
+    Returns:
+        True if the tree was synced, False if the sync was skipped
+    """
+    scope = f"{tree.client.application_id}:{guild.id if guild else GLOBAL_SCOPE}"
+    fingerprint = tree_fingerprint(tree, guild)
+    fingerprints = load_fingerprints(state_path)
+    if not force and fingerprints.get(scope) == fingerprint:
+        logger.info("Command tree unchanged for %s, skipping sync", scope)
+        return False
+
+    await tree.sync(guild=guild)
+    fingerprints[scope] = fingerprint
+    save_fingerprints(state_path, fingerprints)
+    logger.info("Synced command tree for %s", scope)
+    return True
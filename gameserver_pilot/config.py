@@ -1,36 +1,126 @@
 """Application configuration management."""
 
+from functools import cache
+from typing import Literal, Self
+
+from pydantic import BaseModel, model_validator
 from pydantic_settings import BaseSettings
 
 
+class GameServerSettings(BaseModel):
+    """How the players of one game server are counted."""
+
+    # "tshock" polls the TShock REST API, "logfile" parses the server log
+    monitor: Literal["tshock", "logfile"] | None = None
+
+    # TCP port the game listens on; /start waits until it accepts connections
+    game_port: int | None = None
+
+    # TShock REST API; the host defaults to the instance's public IP
+    host: str | None = None
+    api_port: int = 7878
+    token: str = ""
+
+    # Log file monitor
+    log_path: str | None = None
+    join_pattern: str = r"(.+) has joined"
+    leave_pattern: str = r"(.+) has left"
+    state_path: str | None = None
+
+    @model_validator(mode="after")
+    def _require_log_path(self) -> Self:
+        """Reject log file monitors without a log to read."""
+        if self.monitor == "logfile" and not self.log_path:
+            raise ValueError("log_path is required for the logfile monitor")
+        return self
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Discord
     discord_token: str = ""
+    # Guild that also receives commands instantly while developing (optional)
+    discord_dev_guild_id: int | None = None
+    # Fingerprints of synced command trees; unchanged trees are not re-synced
+    discord_command_sync_file: str = ".command-sync.json"
+    discord_force_command_sync: bool = False
 
     # AWS
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
     aws_default_region: str = "ap-northeast-1"
+    aws_max_workers: int = 4
+    # Further regions with game servers, e.g. ["ap-southeast-1", "us-west-2"]
+    aws_regions: list[str] = []
+    # SQS queue receiving EventBridge EC2 state-change events (optional)
+    aws_state_queue_url: str | None = None
+
+    # Game server discovery: instances tagged with this key, named by its value
+    server_tag_key: str = "GameServer"
+    server_refresh_seconds: float = 300.0
+    # Player monitors keyed by server name or ID,
+    # e.g. {"terraria": {"monitor": "tshock", "token": "..."}}
+    game_servers: dict[str, GameServerSettings] = {}
+
+    # Instance state cache TTLs (seconds)
+    cache_running_ttl: float = 30.0
+    cache_stable_ttl: float = 300.0
+    cache_transitional_ttl: float = 5.0
 
     # Environment
     env: str = "development"
 
+    # Prometheus metrics endpoint (disabled unless a port is set)
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int | None = None
+
+    # TShock REST API client
+    tshock_connect_timeout: float = 3.0
+    tshock_read_timeout: float = 10.0
+    tshock_max_connections: int = 100
+    tshock_max_keepalive: int = 20
+
     # Auto-stop settings
     auto_stop_minutes: int = 60
+    auto_stop_poll_seconds: float = 60.0
+    auto_stop_max_poll_seconds: float = 600.0
+    auto_stop_max_concurrency: int = 20
+
+    # Following /start until the server is reachable
+    start_poll_seconds: float = 2.0
+    start_max_poll_seconds: float = 15.0
+    start_timeout_minutes: int = 10
+
+    # Starting servers before the hours they are usually used
+    # Instance-minutes per UTC day; 0 only records history
+    prewarm_budget_minutes: float = 0.0
+    prewarm_lead_minutes: int = 10
+    prewarm_threshold: float = 0.6
+    prewarm_min_weeks: int = 2
+    prewarm_history_file: str = ".prewarm-history.json"
 
     # Beszel monitoring (optional)
     beszel_hub_url: str | None = None
     beszel_email: str | None = None
     beszel_password: str | None = None
     beszel_report_channel_id: int | None = None
+    # Additional channels receiving the same reports, e.g. [123, 456]
+    beszel_report_channel_ids: list[int] = []
+    beszel_sample_seconds: float = 60.0
+    # Subscribe to realtime updates instead of polling the hub
+    beszel_realtime: bool = False
 
     @property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.env == "production"
 
+    @property
+    def all_aws_regions(self) -> list[str]:
+        """Default region followed by any further regions, without repeats."""
+        return list(dict.fromkeys([self.aws_default_region, *self.aws_regions]))
+
     @property
     def beszel_configured(self) -> bool:
         """Check if Beszel monitoring is configured."""
@@ -44,4 +134,11 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Load settings from the environment on first use.
+
+    Returns:
+        Settings shared by every caller
+    """
+    return Settings()
@@ -0,0 +1,90 @@
+"""Helpers for splitting large result sets across Discord embeds."""
+
+from collections.abc import Iterable
+
+import discord
+
+# Discord API limits
+MAX_FIELDS_PER_EMBED = 25
+MAX_EMBED_CHARS = 6000
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_FIELD_NAME_CHARS = 256
+MAX_FIELD_VALUE_CHARS = 1024
+
+# Room left for the " (12/34)" page suffix added after pagination
+PAGE_SUFFIX_RESERVE = 16
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to a Discord length limit."""
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def paginate_fields(
+    title: str,
+    fields: Iterable[tuple[str, str]],
+    color: discord.Color | None = None,
+    inline: bool = True,
+) -> list[discord.Embed]:
+    """Spread embed fields over as many embeds as Discord's limits require.
+
+    Each embed holds at most 25 fields and stays under the 6000 character
+    cap. When more than one embed is produced, titles get a page suffix.
+
+    Args:
+        title: Embed title.
+        fields: (name, value) pairs in display order.
+        color: Embed color.
+        inline: Whether fields are rendered inline.
+
+    Returns:
+        List of embeds, empty if there are no fields.
+    """
+    embeds: list[discord.Embed] = []
+    current: discord.Embed | None = None
+    for raw_name, raw_value in fields:
+        name = _truncate(raw_name, MAX_FIELD_NAME_CHARS)
+        value = _truncate(raw_value, MAX_FIELD_VALUE_CHARS)
+        if (
+            current is None
+            or len(current.fields) >= MAX_FIELDS_PER_EMBED
+            or len(current) + len(name) + len(value) > MAX_EMBED_CHARS - PAGE_SUFFIX_RESERVE
+        ):
+            current = discord.Embed(title=title, color=color)
+            embeds.append(current)
+        current.add_field(name=name, value=value, inline=inline)
+
+    if len(embeds) > 1:
+        for page, embed in enumerate(embeds, start=1):
+            embed.title = f"{title} ({page}/{len(embeds)})"
+    return embeds
+
+
+def group_into_messages(embeds: Iterable[discord.Embed]) -> list[list[discord.Embed]]:
+    """Group embeds into per-message batches.
+
+    Discord allows 10 embeds per message and 6000 characters across all
+    embeds of the same message.
+
+    Args:
+        embeds: Embeds in display order.
+
+    Returns:
+        List of embed batches, one per message to send.
+    """
+    messages: list[list[discord.Embed]] = []
+    current: list[discord.Embed] = []
+    current_chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (
+            len(current) >= MAX_EMBEDS_PER_MESSAGE or current_chars + size > MAX_EMBED_CHARS
+        ):
+            messages.append(current)
+            current = []
+            current_chars = 0
+        current.append(embed)
+        current_chars += size
+    if current:
+        messages.append(current)
+    return messages
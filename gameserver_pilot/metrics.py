@@ -0,0 +1,188 @@
+"""Call counts, errors and latency histograms exposed in Prometheus format."""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from http import HTTPStatus
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "gameserver_pilot"
+# Upper bounds in seconds, from cache hits to slow EC2 transitions
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+MAX_REQUEST_HEADER_BYTES = 8192
+
+
+class CallSeries:
+    """Counts and latency histogram for one component method."""
+
+    __slots__ = ("bucket_counts", "buckets", "calls", "errors", "total_seconds")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize empty counters.
+
+        Args:
+            buckets: Sorted histogram upper bounds in seconds.
+        """
+        self.buckets = buckets
+        # One slot per bound plus the +Inf overflow
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+
+
+class MetricsRegistry:
+    """Registry of call series keyed by component and method.
+
+    Recording a call is a dict lookup, a bisect over a short tuple and a few
+    integer increments, cheap enough to leave enabled in production.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the registry.
+
+        Args:
+            buckets: Histogram upper bounds in seconds, ascending.
+        """
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple[str, str], CallSeries] = {}
+
+    def series(self, component: str, method: str) -> CallSeries:
+        """Get or create the series for a component method."""
+        key = (component, method)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = CallSeries(self.buckets)
+        return series
+
+    def observe(self, component: str, method: str, seconds: float, error: bool = False) -> None:
+        """Record one call of a component method."""
+        self.series(component, method).observe(seconds, error)
+
+    @contextmanager
+    def timer(self, component: str, method: str) -> Iterator[None]:
+        """Time the enclosed block, counting it as an error if it raises.
+
+        Args:
+            component: Component label, e.g. "cloud" or "command".
+            method: Method label, e.g. "start_server".
+        """
+        series = self.series(component, method)
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except Exception:
+            error = True
+            raise
+        finally:
+            series.observe(time.perf_counter() - started, error)
+
+    def render(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        calls = f"{METRIC_PREFIX}_calls_total"
+        errors = f"{METRIC_PREFIX}_errors_total"
+        duration = f"{METRIC_PREFIX}_call_duration_seconds"
+        lines = [
+            f"# HELP {calls} Calls by component and method.",
+            f"# TYPE {calls} counter",
+        ]
+        items = sorted(self._series.items())
+        lines += [f"{calls}{{{_labels(*key)}}} {series.calls}" for key, series in items]
+        lines += [
+            f"# HELP {errors} Calls that raised, by component and method.",
+            f"# TYPE {errors} counter",
+        ]
+        lines += [f"{errors}{{{_labels(*key)}}} {series.errors}" for key, series in items]
+        lines += [
+            f"# HELP {duration} Call latency by component and method.",
+            f"# TYPE {duration} histogram",
+        ]
+        for key, series in items:
+            labels = _labels(*key)
+            cumulative = 0
+            bounds = [*(repr(bound) for bound in series.buckets), "+Inf"]
+            for bound, count in zip(bounds, series.bucket_counts, strict=True):
+                cumulative += count
+                lines.append(f'{duration}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{duration}_sum{{{labels}}} {series.total_seconds!r}")
+            lines.append(f"{duration}_count{{{labels}}} {series.calls}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(component: str, method: str) -> str:
+    """Format the label set of a series."""
+    return f'component="{_escape(component)}",method="{_escape(method)}"'
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsServer:
+    """Minimal HTTP endpoint serving GET /metrics from a registry."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialize the server.
+
+        Args:
+            registry: Registry to expose.
+            host: Interface to bind; keep it local unless scraped remotely.
+            port: TCP port, 0 to pick a free one.
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start listening; the bound port is stored in port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Metrics endpoint listening on http://%s:%d/metrics", self.host, self.port)
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one HTTP request and close the connection."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        request_line = head[:MAX_REQUEST_HEADER_BYTES].split(b"\r\n", 1)[0].decode("latin-1")
+        method, _, rest = request_line.partition(" ")
+        path = rest.split(" ", 1)[0].split("?", 1)[0]
+        if method == "GET" and path == "/metrics":
+            status, body = HTTPStatus.OK, self.registry.render().encode()
+        else:
+            status, body = HTTPStatus.NOT_FOUND, b"not found\n"
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode()
+            + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
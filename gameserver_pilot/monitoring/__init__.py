@@ -1,6 +1,20 @@
 """Beszel monitoring integration for server resource monitoring."""
 
+from typing import TYPE_CHECKING, Any
+
 from gameserver_pilot.monitoring.beszel_client import BeszelClient, ServerMetrics
-from gameserver_pilot.monitoring.reporter import MonitoringReporter
+from gameserver_pilot.monitoring.history import MetricsHistory
+
+if TYPE_CHECKING:
+    from gameserver_pilot.monitoring.reporter import MonitoringReporter
+
+__all__ = ["BeszelClient", "MetricsHistory", "ServerMetrics", "MonitoringReporter"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import MonitoringReporter on first access, so discord.py loads only when it is used."""
+    if name == "MonitoringReporter":
+        from gameserver_pilot.monitoring.reporter import MonitoringReporter
 
-__all__ = ["BeszelClient", "ServerMetrics", "MonitoringReporter"]
+        return MonitoringReporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,31 @@
 """Beszel API client for fetching server metrics."""
 
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from http import HTTPStatus
+from typing import Any, Literal, NamedTuple
+
 import httpx
 from pydantic import BaseModel
 
+from gameserver_pilot.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 10.0
+# Largest page PocketBase serves; fewer round trips for big hubs
+PAGE_SIZE = 500
+# Only the fields ServerMetrics is built from, plus the id realtime events use
+SYSTEM_FIELDS = "id,name,status,info"
+# PocketBase realtime topic covering every record of the systems collection
+SYSTEMS_TOPIC = "systems/*"
+CONNECT_EVENT = "PB_CONNECT"
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
 
 class ServerMetrics(BaseModel):
     """Server metrics data from Beszel."""
@@ -14,21 +37,140 @@ class ServerMetrics(BaseModel):
     disk: float
 
 
+class SystemChange(NamedTuple):
+    """A change to a system seen through the realtime subscription."""
+
+    action: Literal["create", "update", "delete"]
+    system: ServerMetrics
+    previous: ServerMetrics | None
+
+
+def parse_system(item: dict[str, Any]) -> ServerMetrics:
+    """Build ServerMetrics from a systems collection record."""
+    info = item.get("info") or {}
+    return ServerMetrics(
+        name=item["name"],
+        status=item.get("status", "unknown"),
+        cpu=info.get("cpu", 0.0),
+        memory=info.get("mem", 0.0),
+        disk=info.get("disk", 0.0),
+    )
+
+
+async def read_sse(lines: AsyncIterator[str]) -> AsyncGenerator[tuple[str, str]]:
+    """Parse a server-sent event stream into (event, data) pairs.
+
+    Args:
+        lines: Lines of the stream without line terminators.
+
+    Yields:
+        Event name ("message" if unnamed) and data of each dispatched event.
+    """
+    event = ""
+    data: list[str] = []
+    async for line in lines:
+        if not line:
+            if data:
+                yield event or "message", "\n".join(data)
+            event = ""
+            data = []
+            continue
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """httpx transport recording every request by method and path.
+
+    Transport errors and 5xx responses count as errors. For streamed
+    responses the latency covers the time until headers arrive.
+    """
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, metrics: MetricsRegistry, component: str
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: Transport that performs the requests.
+            metrics: Registry receiving the measurements.
+            component: Component label, e.g. "beszel".
+        """
+        self.transport = transport
+        self.metrics = metrics
+        self.component = component
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the wrapped transport, recording it."""
+        series = self.metrics.series(self.component, f"{request.method} {request.url.path}")
+        started = time.perf_counter()
+        error = True
+        try:
+            response = await self.transport.handle_async_request(request)
+            error = response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+            return response
+        finally:
+            series.observe(time.perf_counter() - started, error)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.transport.aclose()
+
+
 class BeszelClient:
-    """Client for Beszel Hub REST API (PocketBase)."""
+    """Client for Beszel Hub REST API (PocketBase).
+
+    A single keep-alive HTTP client is reused for every request. Credentials
+    are kept so that an expired token can be replaced by re-authenticating.
 
-    def __init__(self, hub_url: str, email: str, password: str) -> None:
+    In streaming mode the client subscribes to PocketBase realtime updates
+    of the systems collection and keeps every system in memory. The cache is
+    resynchronized over REST after every (re)connect, so changes missed while
+    disconnected are still reported.
+    """
+
+    def __init__(
+        self,
+        hub_url: str,
+        email: str,
+        password: str,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
         """Initialize the Beszel client.
 
         Args:
             hub_url: Base URL of the Beszel Hub (e.g., https://beszel.railway.app)
             email: Admin email for authentication
             password: Admin password for authentication
+            metrics: Registry recording every request, if given
         """
         self.hub_url = hub_url.rstrip("/")
         self.email = email
         self.password = password
+        self.metrics = metrics
         self._token: str | None = None
+        self._client: httpx.AsyncClient | None = None
+        self.systems: dict[str, ServerMetrics] = {}
+        self._names_by_id: dict[str, str] = {}
+        self._synced = False
+        self._queues: list[asyncio.Queue[SystemChange]] = []
+        self._stream_task: asyncio.Task[None] | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Persistent HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            transport = None
+            if self.metrics is not None:
+                transport = InstrumentedTransport(
+                    httpx.AsyncHTTPTransport(), self.metrics, "beszel"
+                )
+            self._client = httpx.AsyncClient(timeout=REQUEST_TIMEOUT, transport=transport)
+        return self._client
 
     async def _authenticate(self, client: httpx.AsyncClient) -> str:
         """Authenticate with Beszel Hub and return token.
@@ -45,22 +187,52 @@ class BeszelClient:
         if self._token:
             return self._token
 
-        try:
-            response = await client.post(
-                f"{self.hub_url}/api/collections/users/auth-with-password",
-                json={"identity": self.email, "password": self.password},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            token: str = data["token"]
-            self._token = token
-            return token
-        finally:
-            self.password = ""  # Always clear password after auth attempt
+        response = await client.post(
+            f"{self.hub_url}/api/collections/users/auth-with-password",
+            json={"identity": self.email, "password": self.password},
+        )
+        response.raise_for_status()
+        data = response.json()
+        token: str = data["token"]
+        self._token = token
+        return token
+
+    async def _get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send an authenticated GET, re-authenticating once on 401.
+
+        Args:
+            path: API path relative to the hub URL.
+            params: Query parameters.
+
+        Returns:
+            Decoded JSON response.
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails after re-authentication
+        """
+        client = self.client
+        token = await self._authenticate(client)
+        url = f"{self.hub_url}{path}"
+        response = await client.get(url, headers={"Authorization": token}, params=params)
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            # The cached token expired; get a fresh one and retry once
+            self.clear_token()
+            token = await self._authenticate(client)
+            response = await client.get(url, headers={"Authorization": token}, params=params)
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+        return data
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the realtime subscription task is running."""
+        return self._stream_task is not None and not self._stream_task.done()
 
     async def get_all_systems(self) -> list[ServerMetrics]:
-        """Fetch metrics for all monitored systems.
+        """Get metrics for all monitored systems.
+
+        While streaming and in sync, systems are served from memory;
+        otherwise every page is fetched from the hub.
 
         Returns:
             List of ServerMetrics for each system
@@ -68,29 +240,149 @@ class BeszelClient:
         Raises:
             httpx.HTTPStatusError: If API request fails
         """
-        async with httpx.AsyncClient() as client:
-            token = await self._authenticate(client)
-            headers = {"Authorization": token}
+        if self.streaming and self._synced:
+            return list(self.systems.values())
+        return [parse_system(item) for item in await self._fetch_records()]
 
-            response = await client.get(
-                f"{self.hub_url}/api/collections/systems/records",
-                headers=headers,
-                timeout=10.0,
+    async def _fetch_records(self) -> list[dict[str, Any]]:
+        """Fetch every systems record, following every page."""
+        records: list[dict[str, Any]] = []
+        page = 1
+        while True:
+            data = await self._get(
+                "/api/collections/systems/records",
+                {
+                    "page": page,
+                    "perPage": PAGE_SIZE,
+                    "fields": SYSTEM_FIELDS,
+                    "skipTotal": "true",
+                },
             )
+            items = data.get("items", [])
+            records.extend(items)
+            if len(items) < PAGE_SIZE:
+                return records
+            page += 1
+
+    async def changes(self) -> AsyncGenerator[SystemChange]:
+        """Iterate over system changes received while streaming."""
+        queue: asyncio.Queue[SystemChange] = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    def start_streaming(self) -> None:
+        """Start the realtime subscription in the background."""
+        if not self.streaming:
+            self._stream_task = asyncio.create_task(self._stream_forever())
+
+    async def stop_streaming(self) -> None:
+        """Stop the realtime subscription."""
+        if self._stream_task is None:
+            return
+        self._stream_task.cancel()
+        try:
+            await self._stream_task
+        except asyncio.CancelledError:
+            pass
+        self._stream_task = None
+        self._synced = False
+
+    async def _stream_forever(self) -> None:
+        """Keep a realtime subscription open, reconnecting with backoff."""
+        backoff = INITIAL_BACKOFF
+        while True:
+            delay = INITIAL_BACKOFF
+            try:
+                await self._stream()
+                logger.info("Beszel realtime stream closed, reconnecting")
+            except (httpx.HTTPError, httpx.StreamError, ValueError, KeyError):
+                logger.warning("Beszel realtime stream failed, retrying in %.0fs", backoff)
+                delay = backoff
+            # Back off only while connections keep failing before they sync
+            backoff = INITIAL_BACKOFF if self._synced else min(backoff * 2, MAX_BACKOFF)
+            self._synced = False
+            await asyncio.sleep(delay)
+
+    async def _stream(self) -> None:
+        """Consume one realtime connection until it ends."""
+        client = self.client
+        timeout = httpx.Timeout(REQUEST_TIMEOUT, read=None)
+        async with client.stream(
+            "GET", f"{self.hub_url}/api/realtime", timeout=timeout
+        ) as response:
             response.raise_for_status()
-            data = response.json()
-
-            return [
-                ServerMetrics(
-                    name=item["name"],
-                    status=item.get("status", "unknown"),
-                    cpu=item.get("info", {}).get("cpu", 0.0),
-                    memory=item.get("info", {}).get("mem", 0.0),
-                    disk=item.get("info", {}).get("disk", 0.0),
-                )
-                for item in data.get("items", [])
-            ]
+            async for event, data in read_sse(response.aiter_lines()):
+                if event == CONNECT_EVENT:
+                    await self._subscribe(json.loads(data)["clientId"])
+                    await self._resync()
+                elif event == SYSTEMS_TOPIC:
+                    message = json.loads(data)
+                    self._apply(message["action"], message["record"])
+
+    async def _subscribe(self, client_id: str) -> None:
+        """Subscribe a realtime connection to the systems collection."""
+        client = self.client
+        token = await self._authenticate(client)
+        body = {"clientId": client_id, "subscriptions": [SYSTEMS_TOPIC]}
+        url = f"{self.hub_url}/api/realtime"
+        response = await client.post(url, json=body, headers={"Authorization": token})
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            self.clear_token()
+            token = await self._authenticate(client)
+            response = await client.post(url, json=body, headers={"Authorization": token})
+        response.raise_for_status()
+
+    async def _resync(self) -> None:
+        """Replace the cache with a full fetch, publishing the differences."""
+        records = await self._fetch_records()
+        fetched = {system.name: system for system in map(parse_system, records)}
+        for name, system in fetched.items():
+            previous = self.systems.get(name)
+            if previous is None:
+                self._publish(SystemChange("create", system, None))
+            elif previous != system:
+                self._publish(SystemChange("update", system, previous))
+        for name in self.systems.keys() - fetched.keys():
+            self._publish(SystemChange("delete", self.systems[name], self.systems[name]))
+        self.systems = fetched
+        self._names_by_id = {item["id"]: item["name"] for item in records if "id" in item}
+        self._synced = True
+
+    def _apply(self, action: str, record: dict[str, Any]) -> None:
+        """Apply one realtime record event to the cache."""
+        system = parse_system(record)
+        record_id = record.get("id")
+        # Follow renames so the old name does not linger in the cache
+        old_name = self._names_by_id.get(record_id) if record_id else None
+        previous = self.systems.pop(old_name, None) if old_name else None
+        previous = self.systems.get(system.name, previous)
+        if action == "delete":
+            self.systems.pop(system.name, None)
+            if record_id:
+                self._names_by_id.pop(record_id, None)
+            self._publish(SystemChange("delete", system, previous))
+            return
+        self.systems[system.name] = system
+        if record_id:
+            self._names_by_id[record_id] = system.name
+        self._publish(SystemChange("create" if previous is None else "update", system, previous))
+
+    def _publish(self, change: SystemChange) -> None:
+        """Deliver a change to every iterator."""
+        for queue in self._queues:
+            queue.put_nowait(change)
 
     def clear_token(self) -> None:
         """Clear cached authentication token."""
         self._token = None
+
+    async def close(self) -> None:
+        """Stop streaming and close the persistent HTTP client."""
+        await self.stop_streaming()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
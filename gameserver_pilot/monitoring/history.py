@@ -0,0 +1,279 @@
+"""Bounded in-memory time series of Beszel server metrics."""
+
+import math
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import NamedTuple
+
+from gameserver_pilot.monitoring.beszel_client import ServerMetrics
+
+METRIC_NAMES = ("cpu", "memory", "disk")
+DEFAULT_SAMPLE_INTERVAL = 60.0
+DEFAULT_RETENTION = 24 * 3600.0
+DEFAULT_ROLLUP_SECONDS = 3600.0
+DEFAULT_ROLLUP_RETENTION = 30 * 24 * 3600.0
+PERCENTILE = 0.95
+
+
+class MetricSummary(NamedTuple):
+    """Distribution of one metric over a period."""
+
+    minimum: float
+    mean: float
+    maximum: float
+    p95: float
+
+
+def summarize(values: Sequence[float]) -> MetricSummary | None:
+    """Compute min/avg/max/p95 of a series with one sort and one sum.
+
+    Args:
+        values: Samples, typically an array slice.
+
+    Returns:
+        The summary, or None if there are no samples.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(PERCENTILE * len(ordered)) - 1, 0)
+    return MetricSummary(
+        minimum=ordered[0],
+        mean=math.fsum(ordered) / len(ordered),
+        maximum=ordered[-1],
+        p95=ordered[rank],
+    )
+
+
+class RingBuffer:
+    """Fixed-capacity ring of timestamps with float32 value columns.
+
+    All storage is allocated up front, so memory use depends only on the
+    capacity and number of columns.
+    """
+
+    def __init__(self, capacity: int, columns: int) -> None:
+        """Allocate the buffer.
+
+        Args:
+            capacity: Maximum number of rows kept.
+            columns: Number of values stored per row.
+        """
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.columns = [array("f", bytes(4 * capacity)) for _ in range(columns)]
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of rows currently stored."""
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for timestamps and values."""
+        return sum(column.itemsize * len(column) for column in [self.times, *self.columns])
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        """Store a row, overwriting the oldest one when full.
+
+        Args:
+            timestamp: Row timestamp; rows must be appended in time order.
+            values: One value per column.
+        """
+        self.times[self._next] = timestamp
+        for column, value in zip(self.columns, values, strict=True):
+            column[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _ordered(self, data: array[float]) -> array[float]:
+        """Return a column in chronological order."""
+        if self._size < self.capacity:
+            return data[: self._size]
+        return data[self._next :] + data[: self._next]
+
+    def window(
+        self, start: float, end: float = math.inf
+    ) -> tuple[array[float], list[array[float]]]:
+        """Slice the rows with start <= timestamp < end.
+
+        Args:
+            start: Inclusive lower bound.
+            end: Exclusive upper bound.
+
+        Returns:
+            Timestamps and one array per column, oldest first.
+        """
+        times = self._ordered(self.times)
+        first = bisect_left(times, start)
+        last = bisect_left(times, end)
+        return times[first:last], [self._ordered(column)[first:last] for column in self.columns]
+
+
+class SystemHistory:
+    """Raw samples and hourly rollups for one system."""
+
+    def __init__(self, raw_capacity: int, rollup_capacity: int, rollup_seconds: float) -> None:
+        """Allocate the buffers for one system.
+
+        Args:
+            raw_capacity: Number of raw samples kept.
+            rollup_capacity: Number of rollup periods kept.
+            rollup_seconds: Length of one rollup period.
+        """
+        self.rollup_seconds = rollup_seconds
+        self.raw = RingBuffer(raw_capacity, len(METRIC_NAMES))
+        self.rollups = RingBuffer(rollup_capacity, len(METRIC_NAMES) * len(MetricSummary._fields))
+        self.last_seen = 0.0
+        self._period: int | None = None
+
+    def append(self, timestamp: float, metrics: ServerMetrics) -> None:
+        """Record a sample, rolling up the previous period once it is complete."""
+        period = math.floor(timestamp / self.rollup_seconds)
+        if self._period is not None and period > self._period:
+            self._roll_up(self._period)
+        self._period = period
+        self.raw.append(timestamp, [getattr(metrics, name) for name in METRIC_NAMES])
+        self.last_seen = timestamp
+
+    def _roll_up(self, period: int) -> None:
+        """Downsample the raw samples of a finished period into one rollup row."""
+        start = period * self.rollup_seconds
+        _, columns = self.raw.window(start, start + self.rollup_seconds)
+        summaries = [summarize(column) for column in columns]
+        if any(summary is None for summary in summaries):
+            return
+        self.rollups.append(start, [value for summary in summaries if summary for value in summary])
+
+
+class MetricsHistory:
+    """Time series store for Beszel metrics with bounded memory.
+
+    Each system gets a preallocated ring of raw samples covering the
+    retention window, and a second ring of min/avg/max/p95 rollups for older
+    data. Systems that stop reporting for longer than the retention window
+    are dropped.
+    """
+
+    def __init__(
+        self,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        retention: float = DEFAULT_RETENTION,
+        rollup_seconds: float = DEFAULT_ROLLUP_SECONDS,
+        rollup_retention: float = DEFAULT_ROLLUP_RETENTION,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            sample_interval: Expected seconds between samples.
+            retention: Seconds of raw samples kept per system.
+            rollup_seconds: Length of one rollup period in seconds.
+            rollup_retention: Seconds of rollups kept per system.
+            clock: Wall-clock time source.
+
+        Raises:
+            ValueError: If the raw window cannot hold a full rollup period.
+        """
+        if retention < rollup_seconds:
+            raise ValueError("retention must cover at least one rollup period")
+        self.sample_interval = sample_interval
+        self.retention = retention
+        self.rollup_seconds = rollup_seconds
+        self.raw_capacity = math.ceil(retention / sample_interval)
+        self.rollup_capacity = math.ceil(rollup_retention / rollup_seconds)
+        self._clock = clock
+        self._systems: dict[str, SystemHistory] = {}
+
+    @property
+    def systems(self) -> list[str]:
+        """Names of systems with recorded history."""
+        return list(self._systems)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for all series."""
+        return sum(
+            history.raw.nbytes + history.rollups.nbytes for history in self._systems.values()
+        )
+
+    def record(self, systems: Iterable[ServerMetrics], timestamp: float | None = None) -> None:
+        """Record one sample for each system.
+
+        Args:
+            systems: Metrics fetched from Beszel.
+            timestamp: Sample time; defaults to now.
+        """
+        now = self._clock() if timestamp is None else timestamp
+        for metrics in systems:
+            history = self._systems.get(metrics.name)
+            if history is None:
+                history = SystemHistory(
+                    self.raw_capacity, self.rollup_capacity, self.rollup_seconds
+                )
+                self._systems[metrics.name] = history
+            history.append(now, metrics)
+        stale = [
+            name
+            for name, history in self._systems.items()
+            if now - history.last_seen > self.retention
+        ]
+        for name in stale:
+            del self._systems[name]
+
+    def trend(
+        self, name: str, window: float | None = None, now: float | None = None
+    ) -> dict[str, MetricSummary] | None:
+        """Summarize the raw samples of a system over a recent window.
+
+        Args:
+            name: System name.
+            window: Seconds to look back; defaults to the retention window.
+            now: End of the window; defaults to now.
+
+        Returns:
+            Summary per metric name, or None if there are no samples.
+        """
+        history = self._systems.get(name)
+        if history is None:
+            return None
+        end = self._clock() if now is None else now
+        start = end - (self.retention if window is None else window)
+        _, columns = history.raw.window(start, end + 1)
+        summaries = [summarize(column) for column in columns]
+        if any(summary is None for summary in summaries):
+            return None
+        return {
+            metric: summary
+            for metric, summary in zip(METRIC_NAMES, summaries, strict=True)
+            if summary
+        }
+
+    def rollups(
+        self, name: str, since: float = 0.0
+    ) -> list[tuple[float, dict[str, MetricSummary]]]:
+        """Return the rollups of a system, oldest first.
+
+        Args:
+            name: System name.
+            since: Only include periods starting at or after this time.
+
+        Returns:
+            (period start, summary per metric name) pairs.
+        """
+        history = self._systems.get(name)
+        if history is None:
+            return []
+        width = len(MetricSummary._fields)
+        times, columns = history.rollups.window(since)
+        rows = []
+        for i, start in enumerate(times):
+            summaries = {
+                metric: MetricSummary(*(columns[m * width + j][i] for j in range(width)))
+                for m, metric in enumerate(METRIC_NAMES)
+            }
+            rows.append((start, summaries))
+        return rows
@@ -1,15 +1,64 @@
 """Periodic reporting of server metrics to Discord."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import groupby
 
 import discord
 from discord.ext import commands, tasks
 
-from gameserver_pilot.monitoring.beszel_client import BeszelClient
+from gameserver_pilot.embeds import group_into_messages, paginate_fields
+from gameserver_pilot.monitoring.beszel_client import BeszelClient, ServerMetrics, SystemChange
+from gameserver_pilot.monitoring.history import DEFAULT_SAMPLE_INTERVAL, MetricsHistory
 
 logger = logging.getLogger(__name__)
 
 REPORT_INTERVAL_HOURS = 24
+REPORT_WINDOW_SECONDS = REPORT_INTERVAL_HOURS * 3600.0
+METRIC_LABELS = {"cpu": "CPU", "memory": "RAM", "disk": "Disk"}
+# Report sections in display order; unknown statuses sort last
+STATUS_ORDER = ("down", "pending", "paused", "up")
+STATUS_COLORS = {
+    "down": discord.Color.red(),
+    "pending": discord.Color.orange(),
+    "paused": discord.Color.light_grey(),
+    "up": discord.Color.green(),
+}
+# Channels delivered to at once; each channel's messages stay sequential
+MAX_CONCURRENT_CHANNELS = 5
+
+
+@dataclass
+class ReportTiming:
+    """Where the latency of one report went."""
+
+    fetch_seconds: float = 0.0
+    render_seconds: float = 0.0
+    deliver_seconds: float = 0.0
+    systems: int = 0
+    messages: int = 0
+    channels: int = 0
+
+
+def format_alert(change: SystemChange) -> str | None:
+    """Describe a change worth alerting on.
+
+    Args:
+        change: Change received from the realtime subscription
+
+    Returns:
+        Alert text for status changes and removals, or None otherwise
+    """
+    name = change.system.name
+    if change.action == "delete":
+        return f"- {name} was removed from monitoring"
+    if change.previous is None or change.previous.status == change.system.status:
+        return None
+    indicator = "+" if change.system.status == "up" else "-"
+    return f"{indicator} {name} is now {change.system.status} (was {change.previous.status})"
 
 
 class MonitoringReporter:
@@ -20,6 +69,9 @@ class MonitoringReporter:
         bot: commands.Bot,
         beszel: BeszelClient,
         channel_id: int,
+        history: MetricsHistory | None = None,
+        realtime: bool = False,
+        channel_ids: Sequence[int] = (),
     ) -> None:
         """Initialize the monitoring reporter.
 
@@ -27,44 +79,181 @@ class MonitoringReporter:
             bot: Discord bot instance
             beszel: Beszel API client
             channel_id: Discord channel ID for reports
+            history: Metrics store sampled between reports for daily trends
+            realtime: Stream Beszel updates, serving reports from memory and
+                posting up/down alerts as they happen
+            channel_ids: Additional channel IDs that receive the same reports
         """
         self.bot = bot
         self.beszel = beszel
         self.channel_id = channel_id
+        self.channel_ids = list(dict.fromkeys([channel_id, *channel_ids]))
+        self.last_timing: ReportTiming | None = None
+        self.history = history
+        self.realtime = realtime
+        self._alert_task: asyncio.Task[None] | None = None
+        if history is not None:
+            self.sample_metrics.change_interval(seconds=history.sample_interval)
+
+    @tasks.loop(seconds=DEFAULT_SAMPLE_INTERVAL)
+    async def sample_metrics(self) -> None:
+        """Record current metrics of every system into the history."""
+        if self.history is None:
+            return
+        try:
+            systems = await self.beszel.get_all_systems()
+        except Exception:
+            logger.exception("Failed to sample metrics from Beszel")
+            return
+        self.history.record(systems)
+
+    @sample_metrics.before_loop
+    async def before_sample_metrics(self) -> None:
+        """Wait for bot to be ready before sampling."""
+        await self.bot.wait_until_ready()
+
+    def format_system(self, system: ServerMetrics) -> str:
+        """Format current metrics of a system, with daily trends when available.
+
+        Args:
+            system: Current metrics
+
+        Returns:
+            Embed field value
+        """
+        trend = self.history.trend(system.name, REPORT_WINDOW_SECONDS) if self.history else None
+        lines = []
+        for metric, label in METRIC_LABELS.items():
+            line = f"{label}: {getattr(system, metric):.1f}%"
+            if trend:
+                day = trend[metric]
+                line += f" (avg {day.mean:.1f} / p95 {day.p95:.1f} / max {day.maximum:.1f})"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def render(self, systems: Sequence[ServerMetrics]) -> list[list[discord.Embed]]:
+        """Render a report as message batches within Discord's limits.
+
+        Systems are grouped by status (problems first), sorted by name and
+        paginated, so fleets of any size produce valid messages.
+
+        Args:
+            systems: Metrics of every system
+
+        Returns:
+            Embed batches, one per message
+        """
+
+        def status_rank(system: ServerMetrics) -> int:
+            if system.status in STATUS_ORDER:
+                return STATUS_ORDER.index(system.status)
+            return len(STATUS_ORDER)
+
+        ordered = sorted(systems, key=lambda system: (status_rank(system), system.name))
+        embeds: list[discord.Embed] = []
+        for status, group in groupby(ordered, key=lambda system: system.status):
+            members = list(group)
+            indicator = "+" if status == "up" else "-"
+            embeds.extend(
+                paginate_fields(
+                    f"Daily Server Report: {status} ({len(members)})",
+                    (
+                        (f"{indicator} {system.name}", self.format_system(system))
+                        for system in members
+                    ),
+                    color=STATUS_COLORS.get(status, discord.Color.blue()),
+                )
+            )
+        return group_into_messages(embeds)
+
+    def _channels(self) -> list[discord.TextChannel]:
+        """Resolve the report channels, skipping ones that cannot be found."""
+        channels = []
+        for channel_id in self.channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if not channel or not isinstance(channel, discord.TextChannel):
+                logger.warning("Report channel not found: %s", channel_id)
+                continue
+            channels.append(channel)
+        return channels
+
+    async def deliver(
+        self, channels: Sequence[discord.TextChannel], messages: Sequence[list[discord.Embed]]
+    ) -> None:
+        """Send the same messages to several channels concurrently.
+
+        Messages to one channel share a Discord rate-limit bucket, so they are
+        sent in order and discord.py paces them within that bucket. Different
+        channels have separate buckets and are delivered in parallel, capped
+        to stay clear of the global rate limit.
+
+        Args:
+            channels: Destination channels
+            messages: Embed batches, one per message
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNELS)
+
+        async def send_all(channel: discord.TextChannel) -> None:
+            async with semaphore:
+                try:
+                    for batch in messages:
+                        await channel.send(embeds=batch)
+                except discord.HTTPException:
+                    logger.exception("Failed to deliver report to channel %s", channel.id)
+
+        await asyncio.gather(*(send_all(channel) for channel in channels))
+
+    async def forward_alerts(self) -> None:
+        """Post a message whenever a streamed system goes up, down or away."""
+        async for change in self.beszel.changes():
+            message = format_alert(change)
+            if message is None:
+                continue
+            for channel in self._channels():
+                try:
+                    await channel.send(message)
+                except discord.HTTPException:
+                    logger.exception("Failed to send alert for %s", change.system.name)
 
     @tasks.loop(hours=REPORT_INTERVAL_HOURS)
     async def daily_report(self) -> None:
         """Send daily server status report."""
-        channel = self.bot.get_channel(self.channel_id)
-        if not channel or not isinstance(channel, discord.TextChannel):
-            logger.warning("Report channel not found: %s", self.channel_id)
+        channels = self._channels()
+        if not channels:
             return
 
+        timing = ReportTiming(channels=len(channels))
+        started = time.perf_counter()
         try:
             systems = await self.beszel.get_all_systems()
         except Exception:
             logger.exception("Failed to fetch systems from Beszel")
             return
+        fetched = time.perf_counter()
+        timing.fetch_seconds = fetched - started
 
         if not systems:
             logger.info("No systems to report")
             return
 
-        embed = discord.Embed(
-            title="Daily Server Report",
-            color=discord.Color.blue(),
-        )
+        messages = self.render(systems)
+        rendered = time.perf_counter()
+        timing.render_seconds = rendered - fetched
+        timing.systems = len(systems)
+        timing.messages = len(messages)
 
-        for sys in systems:
-            status_indicator = "+" if sys.status == "up" else "-"
-            embed.add_field(
-                name=f"{status_indicator} {sys.name}",
-                value=f"CPU: {sys.cpu:.1f}%\nRAM: {sys.memory:.1f}%\nDisk: {sys.disk:.1f}%",
-                inline=True,
-            )
-
-        await channel.send(embed=embed)
-        logger.info("Daily report sent to channel %s", self.channel_id)
+        await self.deliver(channels, messages)
+        timing.deliver_seconds = time.perf_counter() - rendered
+        self.last_timing = timing
+        logger.info(
+            "Daily report of %d systems sent to %d channels "
+            "(fetch %.3fs, render %.3fs, deliver %.3fs)",
+            timing.systems,
+            timing.channels,
+            timing.fetch_seconds,
+            timing.render_seconds,
+            timing.deliver_seconds,
+        )
 
     @daily_report.before_loop
     async def before_daily_report(self) -> None:
@@ -72,9 +261,18 @@ class MonitoringReporter:
         await self.bot.wait_until_ready()
 
     def start(self) -> None:
-        """Start the daily report task."""
+        """Start the daily report, metrics sampling and alert tasks."""
         self.daily_report.start()
+        if self.history is not None:
+            self.sample_metrics.start()
+        if self.realtime:
+            self.beszel.start_streaming()
+            self._alert_task = asyncio.create_task(self.forward_alerts())
 
     def stop(self) -> None:
-        """Stop the daily report task."""
+        """Stop the daily report, metrics sampling and alert tasks."""
         self.daily_report.cancel()
+        self.sample_metrics.cancel()
+        if self._alert_task is not None:
+            self._alert_task.cancel()
+            self._alert_task = None
@@ -1,7 +1,37 @@
 """Player monitoring implementations for different game servers."""
 
+from typing import TYPE_CHECKING, Any
+
 from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.monitors.instrumented import InstrumentedMonitor
 from gameserver_pilot.monitors.logfile import LogFileMonitor
-from gameserver_pilot.monitors.tshock import TShockMonitor
+from gameserver_pilot.monitors.matcher import JoinLeaveMatcher
+from gameserver_pilot.monitors.watcher import LogWatcher, PlayerCountChange
+
+if TYPE_CHECKING:
+    from gameserver_pilot.monitors.factory import create_monitor
+    from gameserver_pilot.monitors.tshock import TShockMonitor
+
+__all__ = [
+    "InstrumentedMonitor",
+    "JoinLeaveMatcher",
+    "LogFileMonitor",
+    "LogWatcher",
+    "PlayerCountChange",
+    "PlayerMonitor",
+    "TShockMonitor",
+    "create_monitor",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the TShock monitor on first access, so httpx loads only when it is used."""
+    if name == "TShockMonitor":
+        from gameserver_pilot.monitors.tshock import TShockMonitor
+
+        return TShockMonitor
+    if name == "create_monitor":
+        from gameserver_pilot.monitors.factory import create_monitor
 
-__all__ = ["PlayerMonitor", "TShockMonitor", "LogFileMonitor"]
+        return create_monitor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
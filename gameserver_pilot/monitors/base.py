@@ -23,3 +23,10 @@ class PlayerMonitor(ABC):
             True if the server is reachable and monitoring is possible.
         """
         ...
+
+    async def close(self) -> None:
+        """Release resources held by the monitor.
+
+        The default implementation has nothing to release.
+        """
+        return
@@ -0,0 +1,41 @@
+"""Building player monitors from configuration."""
+
+import httpx
+
+from gameserver_pilot.config import GameServerSettings
+from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+from gameserver_pilot.monitors.tshock import HostResolver, TShockMonitor
+
+
+def create_monitor(
+    settings: GameServerSettings,
+    resolve_host: HostResolver,
+    client: httpx.AsyncClient | None = None,
+) -> PlayerMonitor | None:
+    """Create the monitor a game server is configured with.
+
+    Args:
+        settings: Monitoring settings of the server.
+        resolve_host: Looks up the server's current host; used by TShock
+            monitors without a fixed host.
+        client: Shared HTTP client for TShock monitors.
+
+    Returns:
+        The monitor, or None if the server has no monitor configured.
+    """
+    if settings.monitor == "tshock":
+        return TShockMonitor(
+            settings.host or resolve_host,
+            port=settings.api_port,
+            token=settings.token,
+            client=client,
+        )
+    if settings.monitor == "logfile" and settings.log_path:
+        return LogFileMonitor(
+            settings.log_path,
+            join_pattern=settings.join_pattern,
+            leave_pattern=settings.leave_pattern,
+            state_path=settings.state_path,
+        )
+    return None
@@ -0,0 +1,39 @@
+"""Player monitor wrapper that records call metrics."""
+
+from gameserver_pilot.metrics import MetricsRegistry
+from gameserver_pilot.monitors.base import PlayerMonitor
+
+COMPONENT = "monitor"
+
+
+class InstrumentedMonitor(PlayerMonitor):
+    """Records count, errors and latency of every call to a wrapped monitor.
+
+    Calls are labelled with the monitor class, e.g. "TShockMonitor.get_player_count",
+    so different monitor types can be told apart.
+    """
+
+    def __init__(self, monitor: PlayerMonitor, metrics: MetricsRegistry) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            monitor: The monitor to measure.
+            metrics: Registry receiving the measurements.
+        """
+        self.monitor = monitor
+        self.metrics = metrics
+        self._kind = type(monitor).__name__
+
+    async def get_player_count(self) -> int:
+        """Get the player count, recording the call."""
+        with self.metrics.timer(COMPONENT, f"{self._kind}.get_player_count"):
+            return await self.monitor.get_player_count()
+
+    async def is_available(self) -> bool:
+        """Check availability, recording the call."""
+        with self.metrics.timer(COMPONENT, f"{self._kind}.is_available"):
+            return await self.monitor.is_available()
+
+    async def close(self) -> None:
+        """Close the wrapped monitor."""
+        await self.monitor.close()
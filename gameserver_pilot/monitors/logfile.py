@@ -1,19 +1,35 @@
 """Log file based player monitor for various game servers."""
 
-import re
+import json
+import logging
+import os
 from pathlib import Path
+from typing import BinaryIO
 
 from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.monitors.matcher import JoinLeaveMatcher
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_BYTES = 1024 * 1024
+# Leading bytes remembered to detect a file replaced in place (e.g., copytruncate)
+HEAD_FINGERPRINT_BYTES = 64
 
 
 class LogFileMonitor(PlayerMonitor):
-    """Player monitor that parses game server log files."""
+    """Player monitor that parses game server log files.
+
+    The monitor tails the log: it remembers the player set, the byte offset
+    and the identity of the file between polls and only parses appended
+    bytes. Truncation or rotation is detected and triggers a full rescan.
+    """
 
     def __init__(
         self,
         log_path: str,
         join_pattern: str = r"(.+) has joined",
         leave_pattern: str = r"(.+) has left",
+        state_path: str | None = None,
     ) -> None:
         """Initialize log file monitor.
 
@@ -21,34 +37,128 @@ class LogFileMonitor(PlayerMonitor):
             log_path: Path to the game server log file.
             join_pattern: Regex pattern for player join messages.
             leave_pattern: Regex pattern for player leave messages.
+            state_path: Optional JSON file used to checkpoint the tail state
+                so that a restart resumes from the last offset.
         """
         self.log_path = Path(log_path)
-        self.join_regex = re.compile(join_pattern)
-        self.leave_regex = re.compile(leave_pattern)
+        self.matcher = JoinLeaveMatcher(join_pattern, leave_pattern)
+        self.state_path = Path(state_path) if state_path else None
+
+        self._players: set[str] = set()
+        self._offset = 0
+        self._identity: tuple[int, int] | None = None
+        self._head = b""
+
+        if self.state_path:
+            self._load_state()
 
     async def get_player_count(self) -> int:
-        """Parse log file to determine current player count."""
+        """Parse newly appended log lines to determine current player count."""
         if not self.log_path.exists():
+            self._reset(None)
             return 0
 
-        players: set[str] = set()
-
         try:
-            with self.log_path.open("r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    join_match = self.join_regex.search(line)
-                    if join_match:
-                        players.add(join_match.group(1))
-                        continue
-
-                    leave_match = self.leave_regex.search(line)
-                    if leave_match:
-                        players.discard(leave_match.group(1))
+            changed = self._poll()
         except OSError:
             return 0
 
-        return len(players)
+        if changed and self.state_path:
+            self._save_state()
+        return len(self._players)
 
     async def is_available(self) -> bool:
         """Check if log file exists and is readable."""
         return self.log_path.exists() and self.log_path.is_file()
+
+    def _reset(self, identity: tuple[int, int] | None) -> None:
+        """Forget all tail state so the next read starts from the beginning."""
+        self._players.clear()
+        self._offset = 0
+        self._identity = identity
+        self._head = b""
+
+    def _poll(self) -> bool:
+        """Read bytes appended since the last poll.
+
+        Returns:
+            True if the tail state changed.
+
+        Raises:
+            OSError: If the log file cannot be read.
+        """
+        with self.log_path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            head = f.read(HEAD_FINGERPRINT_BYTES)
+
+            rotated = identity != self._identity
+            truncated = stat.st_size < self._offset
+            replaced = not head.startswith(self._head)
+            if rotated or truncated or replaced:
+                if self._identity is not None:
+                    logger.info("Log %s rotated or truncated, rescanning", self.log_path)
+                self._reset(identity)
+            self._head = head
+
+            if stat.st_size == self._offset:
+                return rotated or truncated or replaced
+
+            f.seek(self._offset)
+            self._offset += self._consume(f)
+        return True
+
+    def _consume(self, f: BinaryIO) -> int:
+        """Parse complete lines from the current position.
+
+        A trailing line without a newline is left unread so that it is
+        parsed whole on a later poll.
+
+        Returns:
+            Number of bytes consumed.
+        """
+        consumed = 0
+        pending = b""
+        while chunk := f.read(READ_CHUNK_BYTES):
+            data = pending + chunk
+            end = data.rfind(b"\n") + 1
+            for event in self.matcher.scan(data[:end]):
+                if event.kind == "join":
+                    self._players.add(event.player)
+                else:
+                    self._players.discard(event.player)
+            consumed += end
+            pending = data[end:]
+        return consumed
+
+    def _load_state(self) -> None:
+        """Restore tail state from the checkpoint file, if present."""
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            self._offset = int(state["offset"])
+            self._identity = (int(state["device"]), int(state["inode"]))
+            self._head = bytes.fromhex(state["head"])
+            self._players = set(state["players"])
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable log monitor state: %s", self.state_path)
+            self._reset(None)
+
+    def _save_state(self) -> None:
+        """Write tail state to the checkpoint file atomically."""
+        if not self.state_path or self._identity is None:
+            return
+        state = {
+            "offset": self._offset,
+            "device": self._identity[0],
+            "inode": self._identity[1],
+            "head": self._head.hex(),
+            "players": sorted(self._players),
+        }
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            tmp_path.replace(self.state_path)
+        except OSError:
+            logger.warning("Failed to save log monitor state: %s", self.state_path)
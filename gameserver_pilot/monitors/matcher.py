@@ -0,0 +1,212 @@
+"""Single-pass join/leave matching for log based monitors."""
+
+import re
+from collections.abc import Iterator
+from typing import Literal, NamedTuple
+
+_META_CHARS = frozenset(".^$+[]()|")
+_OPTIONAL = "optional"
+_BREAK = "break"
+_ABORT = "abort"
+_LITERAL = "literal"
+# Inline flags, named groups and backreferences change meaning (or stop
+# compiling) once a pattern is nested inside the combined alternation
+_UNCOMBINABLE = re.compile(r"\(\?[aiLmsux-]|\(\?P?<(?![=!])|\(\?P=|\\[1-9]")
+
+
+class LogEvent(NamedTuple):
+    """A player join or leave found in a log line."""
+
+    kind: Literal["join", "leave"]
+    player: str
+
+
+def _tokenize(pattern: str) -> Iterator[tuple[str, str]]:
+    """Classify a regex source into tokens relevant to literal extraction."""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            i += 2
+            if depth == 0 and escaped and not escaped.isalnum():
+                yield _LITERAL, escaped
+            else:
+                yield _BREAK, ""
+            continue
+        if char in "[{":
+            # Skip the whole character class or repetition count
+            closing = "]" if char == "[" else "}"
+            i = pattern.find(closing, i + 2) + 1 or len(pattern)
+            yield (_BREAK if char == "[" else _OPTIONAL), ""
+            continue
+        inline_flags = pattern.startswith("(?", i) and not pattern.startswith(("(?:", "(?P<"), i)
+        if inline_flags or (char == "|" and depth == 0):
+            yield _ABORT, ""
+            return
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        i += 1
+        if char in "?*":
+            yield _OPTIONAL, ""
+        elif char in _META_CHARS or depth > 0:
+            yield _BREAK, ""
+        else:
+            yield _LITERAL, char
+
+
+def required_literal(pattern: str) -> str:
+    """Find the longest literal substring every match of a pattern must contain.
+
+    Only top-level literal runs are considered, so the result is conservative:
+    an empty string means no usable literal was found (alternation, inline
+    flags or nothing but character classes and groups).
+
+    Args:
+        pattern: Regular expression source.
+
+    Returns:
+        The longest required literal, or "" if none can be derived.
+    """
+    best = ""
+    run: list[str] = []
+    for kind, text in [*_tokenize(pattern), (_BREAK, "")]:
+        if kind == _ABORT:
+            return ""
+        if kind == _LITERAL:
+            run.append(text)
+            continue
+        if kind == _OPTIONAL and run:
+            # The preceding character may repeat zero times, so it is not required
+            run.pop()
+        if len(run) > len(best):
+            best = "".join(run)
+        run.clear()
+    return best
+
+
+def _combinable(pattern: str) -> bool:
+    """Whether a pattern keeps its meaning inside the combined alternation."""
+    return _UNCOMBINABLE.search(pattern) is None
+
+
+class JoinLeaveMatcher:
+    """Matches join and leave events with one compiled alternation.
+
+    Patterns using inline flags, named groups or backreferences cannot be
+    nested in the alternation, so they are compiled separately instead.
+    Either way, a literal-substring prefilter derived from both patterns
+    rejects most lines before any regex runs, and operates on raw bytes so
+    lines that cannot match are never decoded.
+    """
+
+    def __init__(self, join_pattern: str, leave_pattern: str) -> None:
+        """Compile the combined matcher, or both patterns separately.
+
+        Args:
+            join_pattern: Regex for join lines; group 1 captures the player.
+            leave_pattern: Regex for leave lines; group 1 captures the player.
+
+        Raises:
+            re.error: If either pattern is not a valid regex.
+        """
+        self.regex: re.Pattern[str] | None = None
+        self._join = re.compile(join_pattern)
+        self._leave = re.compile(leave_pattern)
+        if _combinable(join_pattern) and _combinable(leave_pattern):
+            try:
+                self.regex = re.compile(f"(?P<join>{join_pattern})|(?P<leave>{leave_pattern})")
+            except re.error:
+                self.regex = None
+        if self.regex is not None:
+            # The first group inside each named alternative is the player capture
+            self._join_group = self.regex.groupindex["join"] + 1
+            self._leave_group = self.regex.groupindex["leave"] + 1
+
+        join_literal = required_literal(join_pattern)
+        leave_literal = required_literal(leave_pattern)
+        self.literals: tuple[bytes, ...] = ()
+        if join_literal and leave_literal:
+            self.literals = tuple(dict.fromkeys([join_literal.encode(), leave_literal.encode()]))
+
+    def match(self, line: str) -> LogEvent | None:
+        """Match a decoded log line.
+
+        Args:
+            line: A single log line.
+
+        Returns:
+            The join/leave event, or None if the line matches neither pattern.
+        """
+        if self.regex is None:
+            return self._match_separately(line)
+        match = self.regex.search(line)
+        if match is None:
+            return None
+        if match.group("join") is not None:
+            return LogEvent("join", match.group(self._join_group))
+        return LogEvent("leave", match.group(self._leave_group))
+
+    def _match_separately(self, line: str) -> LogEvent | None:
+        """Match with both patterns, preferring the earlier match like the alternation."""
+        join = self._join.search(line)
+        leave = self._leave.search(line)
+        if join is not None and (leave is None or join.start() <= leave.start()):
+            return LogEvent("join", join.group(1))
+        if leave is not None:
+            return LogEvent("leave", leave.group(1))
+        return None
+
+    def match_bytes(self, line: bytes) -> LogEvent | None:
+        """Match a raw log line, decoding it only if the prefilter passes.
+
+        Args:
+            line: A single undecoded log line.
+
+        Returns:
+            The join/leave event, or None if the line matches neither pattern.
+        """
+        if self.literals and not any(literal in line for literal in self.literals):
+            return None
+        return self.match(line.decode("utf-8", errors="ignore"))
+
+    def scan(self, data: bytes) -> Iterator[LogEvent]:
+        """Yield events from a buffer of complete newline-terminated lines.
+
+        With a prefilter available, only lines containing one of the literals
+        are located (via bytes.find) and decoded; everything else is skipped
+        without per-line work.
+
+        Args:
+            data: Raw log bytes ending at a line boundary.
+
+        Yields:
+            Events in the order they appear in the buffer.
+        """
+        if not self.literals:
+            for line in data.decode("utf-8", errors="ignore").splitlines():
+                event = self.match(line)
+                if event is not None:
+                    yield event
+            return
+
+        for start in self._candidate_line_starts(data):
+            end = data.find(b"\n", start)
+            raw = data[start : end if end >= 0 else len(data)].rstrip(b"\r")
+            event = self.match(raw.decode("utf-8", errors="ignore"))
+            if event is not None:
+                yield event
+
+    def _candidate_line_starts(self, data: bytes) -> list[int]:
+        """Return sorted start offsets of lines containing any literal."""
+        starts: set[int] = set()
+        for literal in self.literals:
+            pos = data.find(literal)
+            while pos >= 0:
+                line_start = data.rfind(b"\n", 0, pos) + 1
+                starts.add(line_start)
+                line_end = data.find(b"\n", pos)
+                if line_end < 0:
+                    break
+                pos = data.find(literal, line_end + 1)
+        return sorted(starts)
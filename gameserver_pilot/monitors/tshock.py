@@ -1,47 +1,129 @@
 """TShock REST API player monitor for Terraria servers."""
 
+from collections.abc import Awaitable, Callable
 from http import HTTPStatus
 
 import httpx
 
 from gameserver_pilot.monitors.base import PlayerMonitor
 
+DEFAULT_CONNECT_TIMEOUT = 3.0
+DEFAULT_READ_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+KEEPALIVE_EXPIRY = 60.0
+
+# Looks up the current host of a server, e.g. the public IP of its instance
+HostResolver = Callable[[], Awaitable[str | None]]
+
+
+def create_http_client(
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+) -> httpx.AsyncClient:
+    """Create a pooled keep-alive HTTP client for TShock monitors.
+
+    Args:
+        connect_timeout: Seconds allowed to establish a TCP connection.
+        read_timeout: Seconds allowed for reads, writes and pool acquisition.
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive: Maximum number of idle connections kept open.
+
+    Returns:
+        An HTTP client that the caller must close with aclose().
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
+
 
 class TShockMonitor(PlayerMonitor):
-    """Player monitor using TShock REST API."""
+    """Player monitor using TShock REST API.
+
+    Monitors reuse a long-lived HTTP client so consecutive probes ride on an
+    open keep-alive connection. Pass a shared client to pool connections
+    across monitors; otherwise the monitor creates and owns its own.
 
-    def __init__(self, host: str, port: int = 7878, token: str = "") -> None:
+    The host may be a resolver instead of a name, for instances whose public
+    IP changes on every start; while it resolves to nothing, the server
+    counts as unreachable.
+    """
+
+    def __init__(
+        self,
+        host: str | HostResolver,
+        port: int = 7878,
+        token: str = "",
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize TShock monitor.
 
         Args:
-            host: Server hostname or IP.
+            host: Server hostname or IP, or a resolver returning it.
             port: REST API port (default: 7878).
             token: API authentication token.
+            client: Shared HTTP client. The caller remains responsible for
+                closing it.
         """
-        self.base_url = f"http://{host}:{port}"
+        self.port = port
+        self.base_url = f"http://{host}:{port}" if isinstance(host, str) else None
+        self._resolve_host = None if isinstance(host, str) else host
         self.token = token
-        self.timeout = 10.0
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client used for probes, created on first use if not shared."""
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def _url(self, path: str) -> str | None:
+        """Full URL of an API path, or None if the host is not known right now."""
+        base_url = self.base_url
+        if self._resolve_host is not None:
+            host = await self._resolve_host()
+            base_url = f"http://{host}:{self.port}" if host else None
+        return f"{base_url}{path}" if base_url else None
 
     async def get_player_count(self) -> int:
         """Get player count from TShock REST API."""
+        url = await self._url("/v2/players/list")
+        if url is None:
+            return 0
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/v2/players/list",
-                    params={"token": self.token},
-                )
-                response.raise_for_status()
-                data = response.json()
-                players = data.get("players", [])
-                return len(players)
+            response = await self.client.get(
+                url,
+                params={"token": self.token},
+            )
+            response.raise_for_status()
+            data = response.json()
+            players = data.get("players", [])
+            return len(players)
         except httpx.HTTPError:
             return 0
 
     async def is_available(self) -> bool:
         """Check if TShock REST API is reachable."""
+        url = await self._url("/v2/server/status")
+        if url is None:
+            return False
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/v2/server/status")
-                return response.status_code == HTTPStatus.OK
+            response = await self.client.get(url)
+            return response.status_code == HTTPStatus.OK
         except httpx.HTTPError:
             return False
+
+    async def close(self) -> None:
+        """Close the HTTP client if this monitor created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
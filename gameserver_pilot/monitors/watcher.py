@@ -0,0 +1,278 @@
+"""Event-driven watching of many log files for player count changes."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import inspect
+import logging
+import os
+import struct
+import sys
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from pathlib import Path
+from typing import NamedTuple
+
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 5.0
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER_BYTES = 64 * 1024
+
+
+class PlayerCountChange(NamedTuple):
+    """A change in the player count of a watched log."""
+
+    name: str
+    players: int
+
+
+ChangeCallback = Callable[[PlayerCountChange], Awaitable[None] | None]
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        """Watch a path and return its watch descriptor."""
+        wd: int = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        return wd
+
+    def read_events(self) -> list[tuple[int, int, str]]:
+        """Drain pending events as (watch descriptor, mask, file name) tuples."""
+        events: list[tuple[int, int, str]] = []
+        try:
+            data = os.read(self.fd, _READ_BUFFER_BYTES)
+        except BlockingIOError:
+            return events
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self.fd)
+
+
+class LogWatcher:
+    """Watches the logs of many LogFileMonitors from a single event source.
+
+    On Linux one inotify descriptor watches the directories of every log, so
+    a monitor is only re-read when its file is written, replaced or removed.
+    Elsewhere, or for directories inotify cannot watch, a single polling loop
+    compares cheap stat() results and re-reads only logs that changed.
+    If the kernel drops events, every log is re-read, and logs whose
+    directory watch goes away are polled from then on.
+    Player count changes are pushed to callbacks and async iterators.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool | None = None,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            poll_interval: Seconds between stat() checks for polled logs.
+            use_inotify: Force inotify on or off; None auto-detects Linux.
+        """
+        self.poll_interval = poll_interval
+        self.use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+        self.counts: dict[str, int] = {}
+
+        self._monitors: dict[str, LogFileMonitor] = {}
+        self._names_by_path: dict[Path, set[str]] = {}
+        self._callbacks: list[ChangeCallback] = []
+        self._queues: list[asyncio.Queue[PlayerCountChange]] = []
+        self._inotify: _Inotify | None = None
+        self._watches: dict[int, Path] = {}
+        self._polled: dict[str, tuple[int, int, int] | None] = {}
+        self._dirty: set[str] = set()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._poll_task: asyncio.Task[None] | None = None
+
+    def add(self, name: str, monitor: LogFileMonitor) -> None:
+        """Watch the log of a monitor under the given name."""
+        self._monitors[name] = monitor
+        self._names_by_path.setdefault(monitor.log_path, set()).add(name)
+        if self._inotify is not None:
+            self._watch(name)
+        else:
+            self._polled[name] = None
+        self._mark_dirty(name)
+
+    def remove(self, name: str) -> None:
+        """Stop watching a log."""
+        monitor = self._monitors.pop(name, None)
+        if monitor is not None:
+            self._names_by_path.get(monitor.log_path, set()).discard(name)
+        self._polled.pop(name, None)
+        self.counts.pop(name, None)
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        """Register a sync or async callback for player count changes."""
+        self._callbacks.append(callback)
+
+    async def changes(self) -> AsyncGenerator[PlayerCountChange]:
+        """Iterate over player count changes as they happen."""
+        queue: asyncio.Queue[PlayerCountChange] = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    async def start(self) -> None:
+        """Start watching every registered log."""
+        if self.use_inotify and self._inotify is None:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                logger.warning("inotify unavailable, falling back to polling")
+            else:
+                asyncio.get_running_loop().add_reader(self._inotify.fd, self._on_inotify)
+                for name in list(self._polled):
+                    self._watch(name)
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._mark_dirty(*self._monitors)
+
+    async def stop(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        tasks = [task for task in (self._poll_task, self._refresh_task) if task is not None]
+        self._poll_task = None
+        self._refresh_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._inotify is not None:
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+            self._watches.clear()
+
+    def _watch(self, name: str) -> None:
+        """Add an inotify watch on the directory of a log, or fall back to polling."""
+        if self._inotify is None:
+            return
+        directory = self._monitors[name].log_path.parent
+        if directory in self._watches.values():
+            self._polled.pop(name, None)
+            return
+        try:
+            wd = self._inotify.add_watch(directory, WATCH_MASK)
+        except OSError:
+            logger.warning("Cannot watch %s, polling instead", directory)
+            self._polled.setdefault(name, None)
+            return
+        self._watches[wd] = directory
+        self._polled.pop(name, None)
+
+    def _on_inotify(self) -> None:
+        """Mark the monitors whose log files had events."""
+        if self._inotify is None:
+            return
+        for wd, mask, filename in self._inotify.read_events():
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped, so any log may have changed
+                logger.warning("inotify queue overflowed, re-reading every log")
+                self._mark_dirty(*self._monitors)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                self._unwatch(wd)
+                continue
+            self._mark_dirty(*self._names_by_path.get(directory / filename, ()))
+
+    def _unwatch(self, wd: int) -> None:
+        """Poll the logs of a directory whose watch the kernel removed."""
+        directory = self._watches.pop(wd)
+        logger.warning("Watch on %s was removed, polling instead", directory)
+        names = [
+            name for name, monitor in self._monitors.items() if monitor.log_path.parent == directory
+        ]
+        for name in names:
+            self._polled.setdefault(name, None)
+        self._mark_dirty(*names)
+
+    async def _poll_loop(self) -> None:
+        """Stat polled logs and mark the ones whose identity or size changed."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            for name in list(self._polled):
+                try:
+                    stat = self._monitors[name].log_path.stat()
+                    signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    signature = None
+                if signature != self._polled[name]:
+                    self._polled[name] = signature
+                    self._mark_dirty(name)
+
+    def _mark_dirty(self, *names: str) -> None:
+        """Schedule a refresh of the given monitors."""
+        if not names:
+            return
+        self._dirty.update(names)
+        if self._poll_task is None:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """Re-read dirty monitors and publish count changes."""
+        while self._dirty:
+            name = self._dirty.pop()
+            monitor = self._monitors.get(name)
+            if monitor is None:
+                continue
+            count = await monitor.get_player_count()
+            if self.counts.get(name) != count:
+                self.counts[name] = count
+                await self._publish(PlayerCountChange(name, count))
+
+    async def _publish(self, change: PlayerCountChange) -> None:
+        """Deliver a change to callbacks and iterators."""
+        for queue in self._queues:
+            queue.put_nowait(change)
+        for callback in self._callbacks:
+            try:
+                result = callback(change)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Player count callback failed for %s", change.name)
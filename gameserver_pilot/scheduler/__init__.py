@@ -0,0 +1,21 @@
+"""Scheduling of periodic server checks such as auto-stop."""
+
+from gameserver_pilot.scheduler.autostop import AutoStopScheduler, TickMetrics, TickStats
+from gameserver_pilot.scheduler.policy import PollPolicy
+from gameserver_pilot.scheduler.prewarm import DemandTracker, PrewarmPolicy, PrewarmScheduler
+from gameserver_pilot.scheduler.startup import StartProgress, StartStage, StartWaiter
+from gameserver_pilot.scheduler.wheel import TimerWheel
+
+__all__ = [
+    "AutoStopScheduler",
+    "DemandTracker",
+    "PollPolicy",
+    "PrewarmPolicy",
+    "PrewarmScheduler",
+    "StartProgress",
+    "StartStage",
+    "StartWaiter",
+    "TickMetrics",
+    "TickStats",
+    "TimerWheel",
+]
@@ -0,0 +1,388 @@
+"""Auto-stop scheduler that shuts down idle game servers."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from gameserver_pilot.cloud.base import CloudProvider
+from gameserver_pilot.cloud.coalesce import OperationInProgressError
+from gameserver_pilot.metrics import MetricsRegistry
+from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.monitors.instrumented import InstrumentedMonitor
+from gameserver_pilot.scheduler.policy import PollPolicy
+from gameserver_pilot.scheduler.wheel import DEFAULT_TICK_SECONDS, TimerWheel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 20
+DEFAULT_JITTER = 0.1
+TICK_HISTORY = 100
+
+# Called with a server ID and its player count after every successful poll
+PlayerObserver = Callable[[str, int], None]
+
+
+class CheckOutcome(StrEnum):
+    """Result of checking one server during a tick."""
+
+    SKIPPED = "skipped"
+    POLLED = "polled"
+    STOPPED = "stopped"
+    UNREACHABLE = "unreachable"
+    ERROR = "error"
+
+
+@dataclass
+class TickStats:
+    """What a single scheduler tick did and how long it took."""
+
+    started: float
+    duration: float = 0.0
+    due: int = 0
+    polled: int = 0
+    stopped: int = 0
+    unreachable: int = 0
+    errors: int = 0
+
+
+@dataclass
+class TickMetrics:
+    """Aggregated tick durations plus a window of recent ticks."""
+
+    ticks: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    polls: int = 0
+    recent: deque[TickStats] = field(default_factory=lambda: deque(maxlen=TICK_HISTORY))
+
+    def record(self, stats: TickStats) -> None:
+        """Record a finished tick."""
+        self.ticks += 1
+        self.total_seconds += stats.duration
+        self.max_seconds = max(self.max_seconds, stats.duration)
+        self.polls += stats.polled
+        self.recent.append(stats)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average tick duration."""
+        return self.total_seconds / self.ticks if self.ticks else 0.0
+
+    @property
+    def last(self) -> TickStats | None:
+        """The most recent tick, if any."""
+        return self.recent[-1] if self.recent else None
+
+
+@dataclass
+class TrackedServer:
+    """Per-server auto-stop state."""
+
+    monitor: PlayerMonitor
+    players: int | None = None
+    idle_since: float | None = None
+    failures: int = 0
+    interval: float = 0.0
+    pushed: bool = False
+    reported: int | None = None
+
+
+class AutoStopScheduler:
+    """Stops running servers that stay empty longer than a threshold.
+
+    All servers share one timer wheel driven by a single task, so the cost of
+    an idle tick does not depend on how many servers are registered. Each tick
+    looks up the state of every due server in one batched provider call, then
+    polls the monitors of running servers concurrently, bounded by a
+    semaphore. A PollPolicy picks each server's next check from its state
+    and player count, and the result is jittered per server so checks
+    spread out instead of arriving in bursts. Servers registered as pushed
+    get their player counts from push() instead, e.g. from a LogWatcher, and
+    are checked without touching their monitor once a count has arrived.
+    """
+
+    def __init__(
+        self,
+        cloud: CloudProvider,
+        idle_timeout: float,
+        policy: PollPolicy | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        jitter: float = DEFAULT_JITTER,
+        tick: float = DEFAULT_TICK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            cloud: Provider used to read server state and stop servers.
+            idle_timeout: Seconds a running server may stay empty before it
+                is stopped.
+            policy: Policy choosing the interval between checks.
+            max_concurrency: Maximum number of monitors polled at once.
+            jitter: Fraction by which each poll interval is randomized.
+            tick: Resolution of the timer wheel in seconds.
+            clock: Monotonic time source.
+            rng: Random source for jitter.
+        """
+        self.cloud = cloud
+        self.idle_timeout = idle_timeout
+        self.policy = policy or PollPolicy()
+        self.jitter = jitter
+        self.metrics = TickMetrics()
+        self.registry: MetricsRegistry | None = None
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._wheel: TimerWheel[str] = TimerWheel(tick)
+        self._servers: dict[str, TrackedServer] = {}
+        self._observers: list[PlayerObserver] = []
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler loop is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def servers(self) -> dict[str, TrackedServer]:
+        """Tracked servers keyed by server ID."""
+        return self._servers
+
+    def register(self, server_id: str, monitor: PlayerMonitor, pushed: bool = False) -> None:
+        """Start tracking a server.
+
+        The first check is placed at a random point within one poll interval
+        so servers registered together do not all poll on the same tick.
+
+        Args:
+            server_id: Cloud provider server ID.
+            monitor: Monitor reporting the server's player count.
+            pushed: Whether player counts arrive through push(). The monitor
+                is only polled until the first count is pushed.
+        """
+        if self.registry is not None:
+            monitor = InstrumentedMonitor(monitor, self.registry)
+        self._servers[server_id] = TrackedServer(monitor, pushed=pushed)
+        first = self._rng.uniform(0, self.policy.base_interval)
+        self._wheel.schedule(server_id, self._clock() + first)
+
+    def subscribe(self, observer: PlayerObserver) -> None:
+        """Register a callback invoked with every player count a monitor reports."""
+        self._observers.append(observer)
+
+    def instrument(self, registry: MetricsRegistry) -> None:
+        """Record monitor calls and tick durations in a metrics registry.
+
+        Monitors registered before and after this call are both measured.
+        """
+        self.registry = registry
+        for tracked in self._servers.values():
+            tracked.monitor = InstrumentedMonitor(tracked.monitor, registry)
+
+    def unregister(self, server_id: str) -> None:
+        """Stop tracking a server."""
+        self._servers.pop(server_id, None)
+        self._wheel.cancel(server_id)
+
+    def push(self, server_id: str, players: int) -> None:
+        """Record a player count reported by a watcher for a pushed server.
+
+        Players joining end the idle period right away; the last player
+        leaving wakes the server so its idle clock starts on the next tick.
+        """
+        tracked = self._servers.get(server_id)
+        if tracked is None or not tracked.pushed:
+            return
+        previous, tracked.reported = tracked.reported, players
+        if players > 0:
+            tracked.idle_since = None
+        elif previous != 0:
+            self.wake(server_id)
+
+    def wake(self, server_id: str) -> None:
+        """Check a server on the next tick, e.g. right after starting it."""
+        if server_id in self._servers:
+            self._wheel.schedule(server_id, self._clock())
+
+    def idle_seconds(self, server_id: str) -> float | None:
+        """Seconds a server has been observed empty, or None if it is not idle."""
+        tracked = self._servers.get(server_id)
+        if tracked is None or tracked.idle_since is None:
+            return None
+        return self._clock() - tracked.idle_since
+
+    async def tick(self) -> TickStats:
+        """Check every server that is due.
+
+        Returns:
+            Statistics for this tick, also recorded in metrics.
+        """
+        stats = TickStats(started=self._clock())
+        due = self._wheel.pop_due(stats.started)
+        stats.due = len(due)
+        if due:
+            try:
+                snapshots = await self.cloud.get_server_snapshots(due)
+                states = {server_id: snapshots[server_id].state for server_id in due}
+            except Exception:
+                logger.exception("Failed to read state of %d servers", len(due))
+                states = dict.fromkeys(due, "error")
+            outcomes = await asyncio.gather(
+                *(self._check(server_id, states[server_id]) for server_id in due)
+            )
+            stats.polled = sum(outcome != CheckOutcome.SKIPPED for outcome in outcomes)
+            stats.stopped = outcomes.count(CheckOutcome.STOPPED)
+            stats.unreachable = outcomes.count(CheckOutcome.UNREACHABLE)
+            stats.errors = outcomes.count(CheckOutcome.ERROR)
+        stats.duration = self._clock() - stats.started
+        self.metrics.record(stats)
+        if self.registry is not None:
+            self.registry.observe("scheduler", "tick", stats.duration)
+        if stats.due:
+            logger.debug(
+                "Tick checked %d servers in %.3fs (%d stopped, %d errors)",
+                stats.due,
+                stats.duration,
+                stats.stopped,
+                stats.errors,
+            )
+        return stats
+
+    async def _check(self, server_id: str, state: str) -> CheckOutcome:
+        """Poll one server and stop it if it has been idle long enough."""
+        tracked = self._servers.get(server_id)
+        if tracked is None:
+            return CheckOutcome.SKIPPED
+        if state != "running":
+            tracked.players = None
+            tracked.idle_since = None
+            tracked.failures = 0
+            self._reschedule(server_id, self.policy.for_state(state))
+            return CheckOutcome.SKIPPED
+        try:
+            async with self._semaphore:
+                outcome = await self._poll(server_id, tracked)
+        except Exception:
+            logger.exception("Auto-stop check failed for %s", server_id)
+            outcome = CheckOutcome.ERROR
+
+        if outcome in (CheckOutcome.UNREACHABLE, CheckOutcome.ERROR):
+            tracked.failures += 1
+            interval = self.policy.for_failures(tracked.failures)
+            _, idle_remaining = self._load(tracked)
+            if idle_remaining is not None:
+                # Back off, but not past the idle deadline
+                interval = min(interval, max(idle_remaining, self.policy.min_interval))
+            self._reschedule(server_id, interval)
+        else:
+            tracked.failures = 0
+            self._reschedule(server_id, self.policy.for_players(*self._load(tracked)))
+        return outcome
+
+    def _load(self, tracked: TrackedServer) -> tuple[int, float | None]:
+        """Player count and seconds left until the idle deadline."""
+        if tracked.idle_since is None:
+            return tracked.players or 0, None
+        return 0, self.idle_timeout - (self._clock() - tracked.idle_since)
+
+    async def _poll(self, server_id: str, tracked: TrackedServer) -> CheckOutcome:
+        """Update the idle state of a running server from its monitor.
+
+        A running instance whose game cannot be reached is treated as empty,
+        so a crashed or hung game is still stopped once the idle timeout
+        passes; the timeout doubles as the grace period for booting.
+        """
+        players, reachable = await self._read(tracked)
+        if reachable:
+            tracked.players = players
+            self._notify(server_id, players)
+        else:
+            logger.warning("Monitor for %s is unreachable", server_id)
+        waiting = CheckOutcome.POLLED if reachable else CheckOutcome.UNREACHABLE
+
+        now = self._clock()
+        if players > 0:
+            tracked.idle_since = None
+            return CheckOutcome.POLLED
+        if tracked.idle_since is None:
+            tracked.idle_since = now
+        if now - tracked.idle_since < self.idle_timeout:
+            return waiting
+        return await self._stop_idle(server_id, tracked, reachable)
+
+    async def _read(self, tracked: TrackedServer) -> tuple[int, bool]:
+        """Player count of a server and whether its game could be reached."""
+        if tracked.pushed and tracked.reported is not None:
+            return tracked.reported, True
+        players = await tracked.monitor.get_player_count()
+        # Monitors report 0 when they cannot connect; only trust it if reachable
+        return players, players > 0 or await tracked.monitor.is_available()
+
+    def _notify(self, server_id: str, players: int) -> None:
+        """Pass a player count to every observer; their failures do not fail the check."""
+        for observer in self._observers:
+            try:
+                observer(server_id, players)
+            except Exception:
+                logger.exception("Player count observer failed for %s", server_id)
+
+    async def _stop_idle(
+        self, server_id: str, tracked: TrackedServer, reachable: bool
+    ) -> CheckOutcome:
+        """Stop a server whose idle deadline has passed."""
+        logger.info(
+            "Stopping %s after %.0fs without %s",
+            server_id,
+            self._clock() - (tracked.idle_since or 0.0),
+            "players" if reachable else "a reachable game",
+        )
+        try:
+            accepted = await self.cloud.stop_server(server_id)
+        except OperationInProgressError as error:
+            # A user is starting or stopping it; look again once that settles
+            logger.info("Auto-stop of %s deferred: %s", server_id, error)
+            return CheckOutcome.POLLED
+        if not accepted:
+            logger.warning("Auto-stop of %s was not accepted", server_id)
+            return CheckOutcome.ERROR
+        tracked.idle_since = None
+        tracked.players = None
+        return CheckOutcome.STOPPED
+
+    def _reschedule(self, server_id: str, interval: float) -> None:
+        """Schedule the next check of a server with jitter."""
+        tracked = self._servers.get(server_id)
+        if tracked is None:
+            return
+        tracked.interval = interval
+        spread = self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        self._wheel.schedule(server_id, self._clock() + interval * spread)
+
+    async def _run(self) -> None:
+        """Advance the wheel once per tick until cancelled."""
+        resolution = self._wheel.tick
+        while True:
+            await self.tick()
+            await asyncio.sleep(resolution - self._clock() % resolution)
+
+    def start(self) -> None:
+        """Start the scheduler loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the scheduler loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,84 @@
+"""Adaptive polling intervals for player monitors."""
+
+from gameserver_pilot.cloud.cache import TRANSITIONAL_STATES
+
+DEFAULT_BASE_INTERVAL = 60.0
+DEFAULT_MIN_INTERVAL = 15.0
+DEFAULT_MAX_INTERVAL = 600.0
+DEFAULT_MAX_BACKOFF = 900.0
+BACKOFF_FACTOR = 2.0
+
+
+class PollPolicy:
+    """Chooses how long to wait before checking a server again.
+
+    Servers with many players are checked rarely, since several players have
+    to leave before the server can become idle. Empty servers are checked at
+    the base rate and exactly at their idle deadline. Servers that are not
+    running only have their (cached) instance state re-read, never their
+    monitor, and unreachable monitors back off exponentially.
+    """
+
+    def __init__(
+        self,
+        base_interval: float = DEFAULT_BASE_INTERVAL,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            base_interval: Interval for servers with zero or one player.
+            min_interval: Shortest interval ever returned.
+            max_interval: Longest interval for busy or stopped servers.
+            max_backoff: Longest interval for unreachable monitors.
+        """
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+
+    def for_state(self, state: str) -> float:
+        """Interval for a server that is not running.
+
+        Args:
+            state: Instance state other than "running".
+
+        Returns:
+            The minimum interval while the instance is changing state, so a
+            server that just booted is picked up quickly; otherwise the
+            maximum interval.
+        """
+        if state in TRANSITIONAL_STATES:
+            return self.min_interval
+        return self.max_interval
+
+    def for_players(self, players: int, idle_remaining: float | None = None) -> float:
+        """Interval for a running server with a known player count.
+
+        Args:
+            players: Current number of players.
+            idle_remaining: Seconds until the idle deadline, if the server is
+                empty.
+
+        Returns:
+            An interval that doubles with every player beyond the first and
+            never overshoots the idle deadline by more than min_interval.
+        """
+        if players > 0:
+            return min(self.max_interval, self.base_interval * BACKOFF_FACTOR ** (players - 1))
+        if idle_remaining is None:
+            return self.base_interval
+        return min(self.base_interval, max(idle_remaining, self.min_interval))
+
+    def for_failures(self, failures: int) -> float:
+        """Interval after consecutive failed or unreachable polls.
+
+        Args:
+            failures: Number of consecutive failures, at least one.
+
+        Returns:
+            The base interval doubled for every failure, capped at max_backoff.
+        """
+        return min(self.max_backoff, self.base_interval * BACKOFF_FACTOR**failures)
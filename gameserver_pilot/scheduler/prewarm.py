@@ -0,0 +1,413 @@
+"""Starting servers ahead of the hours in which players usually arrive."""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from gameserver_pilot.cloud.base import CloudProvider
+from gameserver_pilot.cloud.coalesce import OperationInProgressError
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_DAY = 24
+HOURS_PER_WEEK = 7 * HOURS_PER_DAY
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = HOURS_PER_DAY * SECONDS_PER_HOUR
+DEFAULT_MIN_WEEKS = 2
+DEFAULT_LEAD_TIME = 600.0
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_WINDOW = 3600.0
+DEFAULT_CHECK_INTERVAL = 300.0
+
+
+def hour_of_week(timestamp: float) -> int:
+    """Bucket of a UNIX time: weekday * 24 + hour, Monday 00:00 UTC being 0."""
+    moment = datetime.fromtimestamp(timestamp, UTC)
+    return moment.weekday() * HOURS_PER_DAY + moment.hour
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    """Write a file so that a crash never leaves it partially written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
+    temporary.write_text(text)
+    temporary.replace(path)
+
+
+@dataclass
+class ActivityHistogram:
+    """Per hour of the week, how often a server was seen and how often in use."""
+
+    observed: list[int] = field(default_factory=lambda: [0] * HOURS_PER_WEEK)
+    active: list[int] = field(default_factory=lambda: [0] * HOURS_PER_WEEK)
+
+    def record(self, slot: int, active: bool) -> None:
+        """Count one finished hour."""
+        self.observed[slot] += 1
+        if active:
+            self.active[slot] += 1
+
+    def probability(self, slot: int, min_samples: int = 1) -> float | None:
+        """Share of observed hours in a slot that had players.
+
+        Returns:
+            The share, or None if the slot was observed fewer than
+            min_samples times.
+        """
+        observed = self.observed[slot]
+        if observed < max(min_samples, 1):
+            return None
+        return self.active[slot] / observed
+
+
+class DemandTracker:
+    """Learns in which hours of the week each server is in demand.
+
+    Activity during the current hour is only collected in a set: a server
+    counts as in demand if a monitor saw players or someone asked for it.
+    When the hour ends, it is added to the matching bucket of every tracked
+    server in one pass, so a prediction is the ratio of two counters and
+    never rescans history. Hours during which the bot was not running are
+    not counted either way.
+
+    Only servers with a monitor are tracked, since only those are stopped
+    again by auto-stop when a prediction turns out wrong.
+    """
+
+    def __init__(
+        self,
+        min_weeks: int = DEFAULT_MIN_WEEKS,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the tracker, loading saved history if there is any.
+
+        Args:
+            min_weeks: Times an hour of the week must have been observed
+                before it is predicted.
+            path: JSON file the histograms are saved to by flush().
+            clock: Wall-clock time source (injectable for tests).
+        """
+        self.min_weeks = min_weeks
+        self.path = path
+        self.histograms: dict[str, ActivityHistogram] = {}
+        self._clock = clock
+        self._hour: int | None = None
+        self._active: set[str] = set()
+        self._unsaved = False
+        if path is not None:
+            self._load(path)
+
+    @property
+    def servers(self) -> list[str]:
+        """IDs of servers with a histogram."""
+        return list(self.histograms)
+
+    def observe(self, server_id: str, players: int) -> None:
+        """Record a player count reported by a server's monitor."""
+        self.roll()
+        self.histograms.setdefault(server_id, ActivityHistogram())
+        if players > 0:
+            self._active.add(server_id)
+
+    def demand(self, server_id: str) -> None:
+        """Record that someone asked for a server, e.g. with /start."""
+        self.roll()
+        if server_id in self.histograms:
+            self._active.add(server_id)
+
+    def roll(self) -> bool:
+        """Close the current hour if the clock has moved past it.
+
+        Returns:
+            True if an hour was added to the histograms.
+        """
+        hour = int(self._clock() // SECONDS_PER_HOUR)
+        if self._hour is None:
+            self._hour = hour
+        if hour == self._hour:
+            return False
+        slot = hour_of_week(self._hour * SECONDS_PER_HOUR)
+        for server_id, histogram in self.histograms.items():
+            histogram.record(slot, server_id in self._active)
+        self._active.clear()
+        self._hour = hour
+        self._unsaved = True
+        return True
+
+    def probability(self, server_id: str, timestamp: float) -> float | None:
+        """Predicted chance that a server is in demand at a time.
+
+        Returns:
+            The probability, or None if the server or hour has too little history.
+        """
+        histogram = self.histograms.get(server_id)
+        if histogram is None:
+            return None
+        return histogram.probability(hour_of_week(timestamp), self.min_weeks)
+
+    async def flush(self) -> None:
+        """Save hours finished since the last flush, writing the file in a worker thread."""
+        if self.path is None or not self._unsaved:
+            return
+        data = {
+            server_id: {"observed": histogram.observed, "active": histogram.active}
+            for server_id, histogram in self.histograms.items()
+        }
+        # Encoded on the event loop, so the counters cannot change mid-write
+        text = json.dumps(data, sort_keys=True)
+        self._unsaved = False
+        await asyncio.to_thread(_write_atomically, self.path, text)
+
+    def _load(self, path: Path) -> None:
+        """Read saved histograms, ignoring unreadable or malformed files."""
+        try:
+            data = json.loads(path.read_text())
+            histograms = {
+                str(server_id): ActivityHistogram(
+                    observed=[int(count) for count in buckets["observed"]],
+                    active=[int(count) for count in buckets["active"]],
+                )
+                for server_id, buckets in data.items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            logger.warning("Ignoring unreadable demand history: %s", path)
+            return
+        self.histograms = {
+            server_id: histogram
+            for server_id, histogram in histograms.items()
+            if len(histogram.observed) == len(histogram.active) == HOURS_PER_WEEK
+        }
+
+
+@dataclass
+class PrewarmPolicy:
+    """When servers are pre-warmed and how much that may cost.
+
+    Every pre-warm is charged window / 60 instance-minutes up front: if no
+    player comes, auto-stop shuts the server down after about that long.
+    """
+
+    lead_time: float = DEFAULT_LEAD_TIME
+    threshold: float = DEFAULT_THRESHOLD
+    budget_minutes: float = 0.0
+    window: float = DEFAULT_WINDOW
+    check_interval: float = DEFAULT_CHECK_INTERVAL
+
+    @property
+    def cost_minutes(self) -> float:
+        """Instance-minutes charged against the daily budget per pre-warm."""
+        return self.window / 60
+
+
+@dataclass
+class Prewarm:
+    """A server started ahead of a predicted hour, awaiting its first player."""
+
+    server_id: str
+    started: float
+    target_hour: int
+
+
+@dataclass
+class PrewarmStats:
+    """Outcomes of settled pre-warms."""
+
+    hits: int = 0
+    misses: int = 0
+    wasted_minutes: float = 0.0
+    spent_minutes: float = 0.0
+
+    @property
+    def prewarms(self) -> int:
+        """Settled pre-warms."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of settled pre-warms that a player used."""
+        return self.hits / self.prewarms if self.prewarms else 0.0
+
+
+class PrewarmScheduler:
+    """Starts stopped servers shortly before the hours they are usually used.
+
+    Every check looks lead_time ahead and starts servers whose predicted
+    demand for that hour reaches the threshold, most likely first, while
+    the daily instance-minute budget lasts. Each server is considered once
+    per predicted hour. A pre-warm is a hit when a player arrives within
+    the window; the minutes before that are counted as wasted. A miss
+    wastes the whole window, after which auto-stop takes the server down.
+    """
+
+    def __init__(
+        self,
+        cloud: CloudProvider,
+        tracker: DemandTracker,
+        policy: PrewarmPolicy | None = None,
+        on_start: Callable[[str], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            cloud: Provider used to read server state and start servers.
+            tracker: Source of the demand predictions.
+            policy: Lead time, threshold, and budget.
+            on_start: Called with the ID of every pre-warmed server.
+            clock: Wall-clock time source (injectable for tests).
+        """
+        self.cloud = cloud
+        self.tracker = tracker
+        self.policy = policy or PrewarmPolicy()
+        self.stats = PrewarmStats()
+        self._on_start = on_start
+        self._clock = clock
+        self._pending: dict[str, Prewarm] = {}
+        self._considered: dict[str, int] = {}
+        self._day: int | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> list[Prewarm]:
+        """Pre-warms still waiting for a player."""
+        return list(self._pending.values())
+
+    def observe(self, server_id: str, players: int) -> None:
+        """Record a monitor's player count, settling a pre-warm it hits."""
+        self.tracker.observe(server_id, players)
+        if players > 0:
+            self._hit(server_id)
+
+    def demand(self, server_id: str) -> None:
+        """Record that someone asked for a server, settling a pre-warm it hits."""
+        self.tracker.demand(server_id)
+        self._hit(server_id)
+
+    def _hit(self, server_id: str) -> None:
+        """Settle a pending pre-warm of a server as used."""
+        prewarm = self._pending.pop(server_id, None)
+        if prewarm is None:
+            return
+        self.stats.hits += 1
+        self.stats.wasted_minutes += (self._clock() - prewarm.started) / 60
+        logger.info("Pre-warm of %s was used", server_id)
+
+    def _expire(self, now: float) -> None:
+        """Settle pre-warms whose window passed without a player as misses."""
+        for server_id, prewarm in list(self._pending.items()):
+            if now - prewarm.started >= self.policy.window:
+                del self._pending[server_id]
+                self.stats.misses += 1
+                self.stats.wasted_minutes += self.policy.cost_minutes
+                logger.info("Pre-warm of %s went unused", server_id)
+
+    def _new_day(self, now: float) -> None:
+        """Reset the budget at midnight UTC, logging the day's report."""
+        day = int(now // SECONDS_PER_DAY)
+        if self._day is not None and day != self._day:
+            logger.info("%s", self.report())
+            self.stats.spent_minutes = 0.0
+        self._day = day
+
+    def report(self) -> str:
+        """Summarize hit rate against wasted instance-minutes."""
+        stats = self.stats
+        return (
+            f"Pre-warm: {stats.hits}/{stats.prewarms} used ({stats.hit_rate:.0%}), "
+            f"{stats.wasted_minutes:.0f} instance-minutes wasted, "
+            f"{stats.spent_minutes:.0f}/{self.policy.budget_minutes:.0f} budgeted today"
+        )
+
+    def _candidates(self, target_time: float) -> list[str]:
+        """Servers predicted busy at a time, most likely first, within budget."""
+        target_hour = int(target_time // SECONDS_PER_HOUR)
+        ranked: list[tuple[float, str]] = []
+        for server_id in self.tracker.servers:
+            if server_id in self._pending or self._considered.get(server_id) == target_hour:
+                continue
+            probability = self.tracker.probability(server_id, target_time)
+            if probability is not None and probability >= self.policy.threshold:
+                ranked.append((probability, server_id))
+        ranked.sort(key=lambda entry: (-entry[0], entry[1]))
+        remaining = self.policy.budget_minutes - self.stats.spent_minutes
+        affordable = int(remaining // self.policy.cost_minutes) if remaining > 0 else 0
+        return [server_id for _, server_id in ranked[:affordable]]
+
+    async def check(self) -> list[str]:
+        """Pre-warm servers predicted to be needed lead_time from now.
+
+        Returns:
+            IDs of the servers started.
+        """
+        now = self._clock()
+        self.tracker.roll()
+        await self.tracker.flush()
+        self._expire(now)
+        self._new_day(now)
+        target_time = now + self.policy.lead_time
+        candidates = self._candidates(target_time)
+        if not candidates:
+            return []
+
+        target_hour = int(target_time // SECONDS_PER_HOUR)
+        snapshots = await self.cloud.get_server_snapshots(candidates)
+        started: list[str] = []
+        for server_id in candidates:
+            self._considered[server_id] = target_hour
+            # Running servers cost nothing extra; others are not ours to start
+            if snapshots[server_id].state == "stopped" and await self._start(server_id):
+                self._pending[server_id] = Prewarm(server_id, now, target_hour)
+                self.stats.spent_minutes += self.policy.cost_minutes
+                started.append(server_id)
+                if self._on_start is not None:
+                    self._on_start(server_id)
+        return started
+
+    async def _start(self, server_id: str) -> bool:
+        """Start one server, treating refusals and errors as not started."""
+        try:
+            accepted = await self.cloud.start_server(server_id)
+        except OperationInProgressError as error:
+            logger.info("Pre-warm of %s skipped: %s", server_id, error)
+            return False
+        except Exception:
+            logger.exception("Pre-warm of %s failed", server_id)
+            return False
+        if accepted:
+            logger.info("Pre-warming %s ahead of predicted players", server_id)
+        else:
+            logger.warning("Pre-warm of %s was not accepted", server_id)
+        return accepted
+
+    async def _run(self) -> None:
+        """Check on every interval until cancelled."""
+        while True:
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Pre-warm check failed")
+            await asyncio.sleep(self.policy.check_interval)
+
+    def start(self) -> None:
+        """Start checking in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background checks."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
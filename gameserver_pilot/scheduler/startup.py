@@ -0,0 +1,283 @@
+"""Following server starts until the game is reachable."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from gameserver_pilot.cloud.base import CloudProvider, ServerSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_DELAY = 2.0
+DEFAULT_MAX_DELAY = 15.0
+DEFAULT_START_TIMEOUT = 600.0
+DEFAULT_PROBE_TIMEOUT = 3.0
+# States from which a start can no longer succeed without another request
+FAILED_STATES = ("stopping", "stopped", "shutting-down", "terminated", "unknown")
+
+
+class StartStage(StrEnum):
+    """Progress of a server start, in the order it is reached."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    ADDRESSED = "ip assigned"
+    READY = "ready"
+    FAILED = "failed"
+    TIMED_OUT = "timed out"
+
+
+@dataclass
+class StartProgress:
+    """Latest known progress of one server start."""
+
+    server_id: str
+    stage: StartStage
+    snapshot: ServerSnapshot | None = None
+    elapsed: float = 0.0
+
+
+ProgressListener = Callable[[StartProgress], Awaitable[None]]
+ReadinessProbe = Callable[[ServerSnapshot], Awaitable[bool]]
+
+
+def tcp_probe(port: int, timeout: float = DEFAULT_PROBE_TIMEOUT) -> ReadinessProbe:
+    """Probe that is ready once the server's public IP accepts a TCP connection.
+
+    Args:
+        port: TCP port the game listens on.
+        timeout: Seconds to wait for each connection attempt.
+
+    Returns:
+        A readiness probe for StartWaiter.watch.
+    """
+
+    async def probe(snapshot: ServerSnapshot) -> bool:
+        if not snapshot.public_ip:
+            return False
+        try:
+            async with asyncio.timeout(timeout):
+                _, writer = await asyncio.open_connection(snapshot.public_ip, port)
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return True
+
+    return probe
+
+
+@dataclass
+class StartWatch:
+    """Polling state of one server start."""
+
+    started: float
+    due: float
+    delay: float
+    probe: ReadinessProbe | None
+    done: asyncio.Future[StartProgress]
+    listeners: list[ProgressListener] = field(default_factory=list)
+    stage: StartStage = StartStage.PENDING
+
+
+def stage_of(snapshot: ServerSnapshot) -> StartStage | None:
+    """Stage a snapshot shows, or None if it says nothing new (e.g. on errors)."""
+    if snapshot.state == "pending":
+        return StartStage.PENDING
+    if snapshot.state == "running":
+        return StartStage.ADDRESSED if snapshot.public_ip else StartStage.RUNNING
+    if snapshot.state in FAILED_STATES:
+        return StartStage.FAILED
+    return None
+
+
+class StartWaiter:
+    """Follows starting servers with one shared, batched poller.
+
+    Every watched server is polled with capped exponential backoff, reset
+    whenever it reaches a new stage. Servers due at the same time are read
+    with a single get_server_snapshots call, so any number of concurrent
+    starts costs one provider call per tick. Listeners are notified on every
+    stage change without blocking the poller.
+    """
+
+    def __init__(
+        self,
+        cloud: CloudProvider,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        timeout: float = DEFAULT_START_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the waiter.
+
+        Args:
+            cloud: Provider used to read server state.
+            initial_delay: Seconds before the first poll and after each stage change.
+            max_delay: Cap on the seconds between polls of one server.
+            timeout: Seconds after which a start that is not ready is given up.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.cloud = cloud
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._clock = clock
+        self._watches: dict[str, StartWatch] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._notifications: set[asyncio.Task[None]] = set()
+
+    @property
+    def watching(self) -> list[str]:
+        """IDs of servers whose start is being followed."""
+        return list(self._watches)
+
+    def watch(
+        self,
+        server_id: str,
+        listener: ProgressListener | None = None,
+        probe: ReadinessProbe | None = None,
+    ) -> asyncio.Future[StartProgress]:
+        """Follow a server that was just asked to start.
+
+        Watching a server that is already followed adds the listener to the
+        existing watch.
+
+        Args:
+            server_id: Cloud provider server ID.
+            listener: Called with the progress on every stage change.
+            probe: Checks whether the game answers once an IP is assigned.
+                Without one, the watch ends when the IP is assigned.
+
+        Returns:
+            Future resolved with the final progress.
+        """
+        watch = self._watches.get(server_id)
+        if watch is None:
+            now = self._clock()
+            watch = StartWatch(
+                started=now,
+                due=now + self.initial_delay,
+                delay=self.initial_delay,
+                probe=probe,
+                done=asyncio.get_running_loop().create_future(),
+            )
+            self._watches[server_id] = watch
+        if listener is not None:
+            watch.listeners.append(listener)
+        self._ensure_running()
+        self._wakeup.set()
+        return watch.done
+
+    def _ensure_running(self) -> None:
+        """Start the poller if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Poll due servers until nothing is left to watch."""
+        while self._watches:
+            now = self._clock()
+            next_due = min(watch.due for watch in self._watches.values())
+            if next_due > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_due - now)
+                except TimeoutError:
+                    pass
+                continue
+            await self.tick()
+
+    async def tick(self) -> None:
+        """Poll every due server with one batched provider call."""
+        now = self._clock()
+        due = [server_id for server_id, watch in self._watches.items() if watch.due <= now]
+        if not due:
+            return
+        try:
+            snapshots = await self.cloud.get_server_snapshots(due)
+        except Exception:
+            logger.exception("Failed to read state of %d starting servers", len(due))
+            snapshots = {}
+        await asyncio.gather(
+            *(self._advance(server_id, snapshots.get(server_id)) for server_id in due)
+        )
+
+    async def _advance(self, server_id: str, snapshot: ServerSnapshot | None) -> None:
+        """Move one watch forward from a fresh snapshot."""
+        watch = self._watches[server_id]
+        stage = stage_of(snapshot) if snapshot is not None else None
+        if stage is StartStage.ADDRESSED and snapshot is not None:
+            if watch.probe is None:
+                self._finish(server_id, StartStage.ADDRESSED, snapshot)
+                return
+            if await self._probe(server_id, watch.probe, snapshot):
+                stage = StartStage.READY
+
+        if stage in (StartStage.READY, StartStage.FAILED):
+            self._finish(server_id, stage, snapshot)
+            return
+        elapsed = self._clock() - watch.started
+        if elapsed >= self.timeout:
+            self._finish(server_id, StartStage.TIMED_OUT, snapshot)
+            return
+
+        if stage is not None and stage != watch.stage:
+            watch.stage = stage
+            watch.delay = self.initial_delay
+            self._notify(watch, StartProgress(server_id, stage, snapshot, elapsed))
+        else:
+            watch.delay = min(watch.delay * 2, self.max_delay)
+        watch.due = self._clock() + watch.delay
+
+    async def _probe(self, server_id: str, probe: ReadinessProbe, snapshot: ServerSnapshot) -> bool:
+        """Run a readiness probe, treating failures as not ready yet."""
+        try:
+            return await probe(snapshot)
+        except Exception:
+            logger.exception("Readiness probe of %s failed", server_id)
+            return False
+
+    def _finish(self, server_id: str, stage: StartStage, snapshot: ServerSnapshot | None) -> None:
+        """End a watch and report its final progress."""
+        watch = self._watches.pop(server_id)
+        watch.stage = stage
+        progress = StartProgress(server_id, stage, snapshot, self._clock() - watch.started)
+        self._notify(watch, progress)
+        if not watch.done.done():
+            watch.done.set_result(progress)
+
+    def _notify(self, watch: StartWatch, progress: StartProgress) -> None:
+        """Call every listener in the background."""
+        for listener in watch.listeners:
+            task = asyncio.create_task(self._call(listener, progress))
+            self._notifications.add(task)
+            task.add_done_callback(self._notifications.discard)
+
+    @staticmethod
+    async def _call(listener: ProgressListener, progress: StartProgress) -> None:
+        """Call a listener, logging instead of propagating its errors."""
+        try:
+            await listener(progress)
+        except Exception:
+            logger.exception("Start progress listener failed for %s", progress.server_id)
+
+    async def stop(self) -> None:
+        """Stop polling and cancel every watch."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for watch in self._watches.values():
+            watch.done.cancel()
+        self._watches.clear()
+        await asyncio.gather(*self._notifications, return_exceptions=True)
@@ -0,0 +1,100 @@
+"""Hashed timing wheel for scheduling many periodic jobs on one loop."""
+
+import math
+from collections.abc import Hashable
+
+DEFAULT_TICK_SECONDS = 1.0
+DEFAULT_SLOTS = 512
+
+
+class TimerWheel[T: Hashable]:
+    """Hashed timing wheel keyed by monotonic time.
+
+    Scheduling, rescheduling and cancelling are O(1). Collecting due items
+    only visits the slots for ticks that elapsed since the previous call, so
+    the cost does not grow with the number of idle entries.
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_SLOTS) -> None:
+        """Initialize the wheel.
+
+        Args:
+            tick: Resolution of the wheel in seconds.
+            slots: Number of slots; entries further than slots * tick
+                seconds away wait for additional rotations.
+        """
+        self.tick = tick
+        self._slots: list[dict[T, float]] = [{} for _ in range(slots)]
+        self._slot_of: dict[T, int] = {}
+        self._cursor: int | None = None
+
+    def __len__(self) -> int:
+        """Number of scheduled items."""
+        return len(self._slot_of)
+
+    def __contains__(self, item: object) -> bool:
+        """Whether an item is scheduled."""
+        return item in self._slot_of
+
+    def _tick_of(self, when: float) -> int:
+        """Absolute tick number containing a point in time."""
+        return math.floor(when / self.tick)
+
+    def schedule(self, item: T, due: float) -> None:
+        """Schedule an item, replacing any previous schedule for it.
+
+        Args:
+            item: The item to schedule.
+            due: Monotonic time at which the item becomes due.
+        """
+        self.cancel(item)
+        tick = self._tick_of(due)
+        if self._cursor is not None:
+            # Overdue items go into the slot the next pop_due() visits first
+            tick = max(tick, self._cursor)
+        slot = tick % len(self._slots)
+        self._slots[slot][item] = due
+        self._slot_of[item] = slot
+
+    def cancel(self, item: T) -> None:
+        """Remove an item from the wheel if present."""
+        slot = self._slot_of.pop(item, None)
+        if slot is not None:
+            del self._slots[slot][item]
+
+    def pop_due(self, now: float) -> list[T]:
+        """Remove and return every item due at or before now.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Due items ordered by due time.
+        """
+        current = self._tick_of(now)
+        start = self._cursor
+        if start is None:
+            start = min(
+                (self._tick_of(when) for slot in self._slots for when in slot.values()),
+                default=current,
+            )
+        # Visiting more than one full rotation would only revisit slots
+        ticks = range(start, current + 1)
+        if len(ticks) > len(self._slots):
+            ticks = range(current - len(self._slots) + 1, current + 1)
+        self._cursor = current
+
+        due: list[tuple[float, T]] = []
+        for tick in ticks:
+            slot = self._slots[tick % len(self._slots)]
+            ready = [(when, item) for item, when in slot.items() if when <= now]
+            for when, item in ready:
+                del slot[item]
+                del self._slot_of[item]
+                due.append((when, item))
+        due.sort(key=lambda entry: entry[0])
+        return [item for _, item in due]
+
+    def next_due(self) -> float | None:
+        """Earliest scheduled due time, or None if the wheel is empty."""
+        return min((when for slot in self._slots for when in slot.values()), default=None)
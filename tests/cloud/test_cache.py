@@ -0,0 +1,212 @@
+"""Tests for the caching cloud provider."""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from gameserver_pilot.cloud.base import ServerSnapshot
+from gameserver_pilot.cloud.cache import CachingProvider
+from gameserver_pilot.cloud.mock import MockProvider
+
+RUNNING_TTL = 30.0
+STOPPED_TTL = 300.0
+PENDING_TTL = 5.0
+TWO_CALLS = 2
+THREE_CALLS = 3
+DESCRIBE_DELAY = 0.2
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingMockProvider(MockProvider):
+    """MockProvider that counts snapshot requests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.snapshot_calls = 0
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        self.snapshot_calls += 1
+        return await super().get_server_snapshot(server_id)
+
+
+class SlowMockProvider(MockProvider):
+    """MockProvider whose reads take DESCRIBE_DELAY and see state from their start."""
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        snapshot = await super().get_server_snapshot(server_id)
+        await asyncio.sleep(DESCRIBE_DELAY)
+        return snapshot
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        snapshots = await super().get_server_snapshots(server_ids)
+        await asyncio.sleep(DESCRIBE_DELAY)
+        return snapshots
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def inner() -> CountingMockProvider:
+    """Create the wrapped provider."""
+    return CountingMockProvider()
+
+
+@pytest.fixture
+def cache(inner: CountingMockProvider, clock: FakeClock) -> CachingProvider:
+    """Create a caching provider around the mock."""
+    return CachingProvider(
+        inner,
+        state_ttls={"running": RUNNING_TTL, "stopped": STOPPED_TTL, "pending": PENDING_TTL},
+        clock=clock,
+    )
+
+
+async def test_second_read_is_cached(cache: CachingProvider, inner: CountingMockProvider) -> None:
+    """Test that repeated reads hit the cache."""
+    assert await cache.get_server_status("terraria") == "stopped"
+    assert await cache.get_server_ip("terraria") is None
+
+    assert inner.snapshot_calls == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+async def test_entry_expires_by_state_ttl(
+    cache: CachingProvider, inner: CountingMockProvider, clock: FakeClock
+) -> None:
+    """Test that stable states live longer than running ones."""
+    await cache.get_server_snapshot("terraria")
+    clock.now = RUNNING_TTL + 1
+    await cache.get_server_snapshot("terraria")
+    assert inner.snapshot_calls == 1
+
+    await inner.start_server("corekeeper")
+    await cache.get_server_snapshot("corekeeper")
+    clock.now += RUNNING_TTL
+    await cache.get_server_snapshot("corekeeper")
+    assert inner.snapshot_calls == THREE_CALLS
+
+
+async def test_start_invalidates(cache: CachingProvider, inner: CountingMockProvider) -> None:
+    """Test that start_server drops the cached snapshot."""
+    await cache.get_server_snapshot("terraria")
+    assert await cache.start_server("terraria") is True
+
+    assert cache.peek("terraria") is None
+    assert await cache.get_server_status("terraria") == "running"
+
+
+async def test_stop_invalidates(cache: CachingProvider) -> None:
+    """Test that stop_server drops the cached snapshot."""
+    await cache.start_server("terraria")
+    await cache.get_server_snapshot("terraria")
+    await cache.stop_server("terraria")
+
+    assert await cache.get_server_status("terraria") == "stopped"
+
+
+async def test_zero_ttl_not_cached(inner: CountingMockProvider, clock: FakeClock) -> None:
+    """Test that states with zero TTL are never cached."""
+    cache = CachingProvider(inner, state_ttls={"stopped": 0.0}, clock=clock)
+    await cache.get_server_snapshot("terraria")
+    await cache.get_server_snapshot("terraria")
+
+    assert inner.snapshot_calls == TWO_CALLS
+
+
+async def test_peek(cache: CachingProvider) -> None:
+    """Test peeking only returns fresh cached entries."""
+    assert cache.peek("terraria") is None
+
+    await cache.get_server_snapshot("terraria")
+    snapshot = cache.peek("terraria")
+
+    assert snapshot is not None
+    assert snapshot.state == "stopped"
+    assert cache.stats.hits == 1
+
+
+async def test_state_of_does_not_count(cache: CachingProvider, clock: FakeClock) -> None:
+    """Test reading a cached state without touching the statistics."""
+    assert cache.state_of("terraria") is None
+
+    await cache.get_server_snapshot("terraria")
+    assert cache.state_of("terraria") == "stopped"
+    clock.now += STOPPED_TTL
+    assert cache.state_of("terraria") is None
+    assert cache.stats.hits == 0
+
+
+async def test_invalidate_all(cache: CachingProvider) -> None:
+    """Test clearing the whole cache."""
+    await cache.get_server_snapshot("terraria")
+    await cache.get_server_snapshot("corekeeper")
+    cache.invalidate()
+
+    assert cache.peek("terraria") is None
+    assert cache.peek("corekeeper") is None
+
+
+def test_hit_rate_empty(cache: CachingProvider) -> None:
+    """Test hit rate with no lookups."""
+    assert cache.stats.hit_rate == 0.0
+
+
+async def test_batch_fetches_only_misses(
+    cache: CachingProvider, inner: CountingMockProvider
+) -> None:
+    """Test that batch reads serve hits and fetch misses together."""
+    await cache.get_server_snapshot("terraria")
+    snapshots = await cache.get_server_snapshots(["terraria", "corekeeper"])
+
+    assert set(snapshots) == {"terraria", "corekeeper"}
+    assert inner.snapshot_calls == TWO_CALLS
+    assert cache.stats.hits == 1
+    assert cache.peek("corekeeper") is not None
+
+
+@pytest.mark.parametrize("batch", [False, True])
+async def test_read_in_flight_across_start_is_not_cached(batch: bool, clock: FakeClock) -> None:
+    """Test that a describe begun before a start cannot cache the old state."""
+    cache = CachingProvider(SlowMockProvider(), state_ttls={"stopped": STOPPED_TTL}, clock=clock)
+
+    async def describe() -> None:
+        if batch:
+            await cache.get_server_snapshots(["terraria"])
+        else:
+            await cache.get_server_snapshot("terraria")
+
+    read = asyncio.create_task(describe())
+    await asyncio.sleep(0)
+
+    assert await cache.start_server("terraria")
+    await read
+
+    assert cache.peek("terraria") is None
+    assert await cache.get_server_status("terraria") == "running"
+
+
+async def test_invalidate_all_drops_reads_in_flight(clock: FakeClock) -> None:
+    """Test that clearing the cache also discards reads already in flight."""
+    cache = CachingProvider(SlowMockProvider(), state_ttls={"stopped": STOPPED_TTL}, clock=clock)
+    read = asyncio.create_task(cache.get_server_snapshot("terraria"))
+    await asyncio.sleep(0)
+
+    cache.invalidate()
+    await read
+
+    assert cache.peek("terraria") is None
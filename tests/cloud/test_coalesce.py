@@ -0,0 +1,219 @@
+"""Tests for the coalescing cloud provider."""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from gameserver_pilot.cloud.base import ServerSnapshot
+from gameserver_pilot.cloud.coalesce import CoalescingProvider, OperationInProgressError
+from gameserver_pilot.cloud.mock import MockProvider
+
+BURST = 50
+TWO_CALLS = 2
+SETTLE_TIMEOUT = 1.0
+
+
+class GatedMockProvider(MockProvider):
+    """MockProvider whose calls block until released and are counted."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.calls: list[tuple[str, tuple[str, ...]]] = []
+        self.fail = False
+
+    async def _enter(self, method: str, *server_ids: str) -> None:
+        self.calls.append((method, server_ids))
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("provider failed")
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        await self._enter("snapshot", server_id)
+        return await super().get_server_snapshot(server_id)
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        await self._enter("snapshots", *server_ids)
+        # Bypass the counted single lookup MockProvider would delegate to
+        return {
+            server_id: await MockProvider.get_server_snapshot(self, server_id)
+            for server_id in server_ids
+        }
+
+    async def start_server(self, server_id: str) -> bool:
+        await self._enter("start", server_id)
+        return await super().start_server(server_id)
+
+    async def stop_server(self, server_id: str) -> bool:
+        await self._enter("stop", server_id)
+        return await super().stop_server(server_id)
+
+
+class SlowReadMockProvider(MockProvider):
+    """MockProvider whose reads see the state at their start and return when released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.reads = 0
+
+    async def get_server_snapshot(self, server_id: str) -> ServerSnapshot:
+        self.reads += 1
+        snapshot = await super().get_server_snapshot(server_id)
+        await self.gate.wait()
+        return snapshot
+
+
+class ForgetfulMockProvider(MockProvider):
+    """MockProvider whose batch reads omit every server."""
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        return {}
+
+
+@pytest.fixture
+def inner() -> GatedMockProvider:
+    """Create the wrapped provider."""
+    return GatedMockProvider()
+
+
+@pytest.fixture
+def provider(inner: GatedMockProvider) -> CoalescingProvider:
+    """Create a coalescing provider around the mock."""
+    return CoalescingProvider(inner)
+
+
+async def test_burst_of_reads_makes_one_call(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that concurrent reads of one server share a single call."""
+    readers = [asyncio.create_task(provider.get_server_status("terraria")) for _ in range(BURST)]
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    assert await asyncio.gather(*readers) == ["stopped"] * BURST
+    assert inner.calls == [("snapshot", ("terraria",))]
+    assert provider.stats.shared == BURST - 1
+
+
+async def test_reads_after_completion_fetch_again(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that results are shared only while the call is in flight."""
+    inner.gate.set()
+
+    await provider.get_server_snapshot("terraria")
+    await provider.get_server_snapshot("terraria")
+
+    assert len(inner.calls) == TWO_CALLS
+
+
+async def test_batch_joins_in_flight_reads(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that a batch fetches only servers without a call in flight."""
+    single = asyncio.create_task(provider.get_server_snapshot("terraria"))
+    await asyncio.sleep(0)
+    batch = asyncio.create_task(
+        provider.get_server_snapshots(["terraria", "corekeeper", "terraria"])
+    )
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    snapshots = await batch
+    await single
+    assert set(snapshots) == {"terraria", "corekeeper"}
+    assert inner.calls == [("snapshot", ("terraria",)), ("snapshots", ("corekeeper",))]
+
+
+async def test_errors_reach_every_waiter(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that a failed shared call fails every caller and is not cached."""
+    inner.fail = True
+    readers = [asyncio.create_task(provider.get_server_snapshot("terraria")) for _ in range(3)]
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    results = await asyncio.gather(*readers, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    inner.fail = False
+    assert (await provider.get_server_snapshot("terraria")).state == "stopped"
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that the first caller giving up leaves the call running for others."""
+    first = asyncio.create_task(provider.get_server_snapshot("terraria"))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(provider.get_server_snapshot("terraria"))
+    await asyncio.sleep(0)
+    first.cancel()
+    inner.gate.set()
+
+    assert (await second).state == "stopped"
+    assert len(inner.calls) == 1
+
+
+async def test_concurrent_mutations_are_rejected(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that a second start or stop of a busy server is not sent."""
+    first = asyncio.create_task(provider.start_server("terraria"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(OperationInProgressError) as error:
+        await provider.start_server("terraria")
+    assert error.value.operation == "start"
+    with pytest.raises(OperationInProgressError):
+        await provider.stop_server("terraria")
+
+    inner.gate.set()
+    assert await first is True
+    assert await provider.stop_server("terraria") is True
+    assert [method for method, _ in inner.calls] == ["start", "stop"]
+    assert provider.stats.rejected == TWO_CALLS
+
+
+async def test_mutations_of_different_servers_run_concurrently(
+    provider: CoalescingProvider, inner: GatedMockProvider
+) -> None:
+    """Test that only requests for the same server are deduplicated."""
+    starts = [
+        asyncio.create_task(provider.start_server(server_id))
+        for server_id in ("terraria", "corekeeper")
+    ]
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    assert await asyncio.gather(*starts) == [True, True]
+
+
+async def test_reads_after_start_do_not_join_older_call() -> None:
+    """Test that a read issued after a start does not share a describe begun before it."""
+    inner = SlowReadMockProvider()
+    provider = CoalescingProvider(inner)
+    before = asyncio.create_task(provider.get_server_status("terraria"))
+    while not inner.reads:
+        await asyncio.sleep(0)
+
+    assert await provider.start_server("terraria")
+    after = asyncio.create_task(provider.get_server_status("terraria"))
+    await asyncio.sleep(0)
+    inner.gate.set()
+
+    assert await before == "stopped"
+    assert await after == "running"
+    assert inner.reads == TWO_CALLS
+
+
+async def test_missing_snapshots_fail_instead_of_hanging() -> None:
+    """Test that waiters get an error when the provider omits their server."""
+    provider = CoalescingProvider(ForgetfulMockProvider())
+
+    async with asyncio.timeout(SETTLE_TIMEOUT):
+        with pytest.raises(KeyError):
+            await provider.get_server_snapshots(["terraria", "corekeeper"])
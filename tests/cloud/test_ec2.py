@@ -0,0 +1,196 @@
+"""Tests for the EC2 cloud provider."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from gameserver_pilot.cloud.ec2 import EC2Provider, snapshot_from_instance
+
+REGION = "ap-northeast-1"
+IMAGE_ID = "ami-12345678"
+SLOW_CALL_SECONDS = 0.3
+HEARTBEAT_INTERVAL = 0.01
+MIN_HEARTBEATS = 10
+CONCURRENT_CALLS = 4
+DESCRIBE_CALLS = 2
+FLEET_SIZE = 5
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide fake AWS credentials for moto."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+
+
+@pytest.fixture
+def provider(aws_credentials: None) -> Iterator[EC2Provider]:
+    """Create an EC2 provider backed by moto."""
+    with mock_aws():
+        yield EC2Provider(region=REGION)
+
+
+@pytest.fixture
+def instance_id(provider: EC2Provider) -> str:
+    """Launch a moto instance and return its ID."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    response = ec2.run_instances(ImageId=IMAGE_ID, MinCount=1, MaxCount=1)
+    return str(response["Instances"][0]["InstanceId"])
+
+
+async def test_get_status_running(provider: EC2Provider, instance_id: str) -> None:
+    """Test that a launched instance reports running."""
+    assert await provider.get_server_status(instance_id) == "running"
+
+
+async def test_stop_and_start(provider: EC2Provider, instance_id: str) -> None:
+    """Test stopping and starting an instance."""
+    assert await provider.stop_server(instance_id) is True
+    assert await provider.get_server_status(instance_id) == "stopped"
+
+    assert await provider.start_server(instance_id) is True
+    assert await provider.get_server_status(instance_id) == "running"
+
+
+async def test_get_ip(provider: EC2Provider, instance_id: str) -> None:
+    """Test fetching the public IP of a running instance."""
+    assert await provider.get_server_ip(instance_id) is not None
+
+
+async def test_unknown_instance(provider: EC2Provider) -> None:
+    """Test that API errors are mapped to fallback values."""
+    assert await provider.get_server_status("i-00000000000000000") == "error"
+    assert await provider.get_server_ip("i-00000000000000000") is None
+    assert await provider.start_server("i-00000000000000000") is False
+
+
+async def test_snapshot_single_call(provider: EC2Provider, instance_id: str) -> None:
+    """Test that a snapshot is built from one DescribeInstances call."""
+    snapshot = await provider.get_server_snapshot(instance_id)
+
+    assert snapshot.server_id == instance_id
+    assert snapshot.state == "running"
+    assert snapshot.public_ip is not None
+    assert snapshot.instance_type is not None
+    assert snapshot.launch_time is not None
+    assert provider.call_stats["describe_instances"].count == 1
+
+
+async def test_snapshot_error(provider: EC2Provider) -> None:
+    """Test that API errors produce an error snapshot."""
+    snapshot = await provider.get_server_snapshot("i-00000000000000000")
+    assert snapshot.state == "error"
+
+
+def test_snapshot_transition_time() -> None:
+    """Test parsing of the state transition timestamp."""
+    snapshot = snapshot_from_instance(
+        {
+            "InstanceId": "i-1",
+            "State": {"Name": "stopped"},
+            "StateTransitionReason": "User initiated (2024-05-01 12:34:56 GMT)",
+        }
+    )
+
+    assert snapshot.state_transition_time == datetime(2024, 5, 1, 12, 34, 56, tzinfo=UTC)
+    assert snapshot.public_ip is None
+
+
+async def test_snapshots_batch(provider: EC2Provider) -> None:
+    """Test that a fleet is described with one paginated call."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    response = ec2.run_instances(ImageId=IMAGE_ID, MinCount=FLEET_SIZE, MaxCount=FLEET_SIZE)
+    instance_ids = [instance["InstanceId"] for instance in response["Instances"]]
+    ec2.stop_instances(InstanceIds=instance_ids[:1])
+
+    snapshots = await provider.get_server_snapshots([*instance_ids, "i-00000000000000000"])
+
+    assert snapshots[instance_ids[0]].state == "stopped"
+    assert all(snapshots[i].state == "running" for i in instance_ids[1:])
+    assert snapshots["i-00000000000000000"].state == "unknown"
+    assert provider.call_stats["describe_instances"].count == 1
+
+
+async def test_call_stats_recorded(provider: EC2Provider, instance_id: str) -> None:
+    """Test that per-operation timing is recorded."""
+    await provider.get_server_status(instance_id)
+    await provider.get_server_ip(instance_id)
+
+    stats = provider.call_stats["describe_instances"]
+    assert stats.count == DESCRIBE_CALLS
+    assert stats.max_seconds >= stats.mean_seconds > 0.0
+
+
+async def test_calls_do_not_block_event_loop(
+    provider: EC2Provider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that slow boto3 calls leave the event loop responsive."""
+
+    def slow_describe(**kwargs: Any) -> dict[str, Any]:
+        time.sleep(SLOW_CALL_SECONDS)
+        return {"Reservations": []}
+
+    monkeypatch.setattr(provider.ec2, "describe_instances", slow_describe)
+    heartbeats = 0
+
+    async def heartbeat() -> None:
+        nonlocal heartbeats
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            heartbeats += 1
+
+    task = asyncio.create_task(heartbeat())
+    statuses = await asyncio.gather(
+        *(provider.get_server_status("i-slow") for _ in range(CONCURRENT_CALLS))
+    )
+    task.cancel()
+
+    assert statuses == ["unknown"] * CONCURRENT_CALLS
+    assert heartbeats >= MIN_HEARTBEATS
+
+
+async def test_close_shuts_down_executor(provider: EC2Provider) -> None:
+    """Test that close stops accepting new calls."""
+    await provider.close()
+
+    with pytest.raises(RuntimeError):
+        await provider.get_server_status("i-00000000000000000")
+
+
+async def test_discover_servers_by_tag(provider: EC2Provider) -> None:
+    """Test that tagged, non-terminated instances are discovered and named."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+
+    def launch(tags: dict[str, str]) -> str:
+        response = ec2.run_instances(
+            ImageId=IMAGE_ID,
+            MinCount=1,
+            MaxCount=1,
+            TagSpecifications=[
+                {
+                    "ResourceType": "instance",
+                    "Tags": [{"Key": key, "Value": value} for key, value in tags.items()],
+                }
+            ],
+        )
+        return str(response["Instances"][0]["InstanceId"])
+
+    terraria = launch({"GameServer": "terraria"})
+    named = launch({"GameServer": "", "Name": "valheim"})
+    launch({"Name": "web"})
+    terminated = launch({"GameServer": "old"})
+    ec2.terminate_instances(InstanceIds=[terminated])
+
+    servers = await provider.discover_servers("GameServer")
+
+    assert {server.server_id: server.name for server in servers} == {
+        terraria: "terraria",
+        named: "valheim",
+    }
@@ -0,0 +1,285 @@
+"""Tests for EC2 state-change event ingestion."""
+
+import asyncio
+import json
+from collections.abc import Iterator
+
+import boto3
+import pytest
+from botocore.exceptions import EndpointConnectionError
+from moto import mock_aws
+
+from gameserver_pilot.cloud import events
+from gameserver_pilot.cloud.ec2 import EC2Provider
+from gameserver_pilot.cloud.events import (
+    InstanceStateEvent,
+    InstanceStateListener,
+    parse_state_event,
+)
+
+REGION = "ap-northeast-1"
+IMAGE_ID = "ami-12345678"
+EVENT_TIMEOUT = 5.0
+TWO_EVENTS = 2
+VIEW_MAX_AGE = 60.0
+EARLIER = "2024-05-01T11:59:00Z"
+LATER = "2024-05-01T12:01:00Z"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyListener(InstanceStateListener):
+    """Listener whose first poll fails as if the endpoint were unreachable."""
+
+    def __init__(self, queue_url: str) -> None:
+        super().__init__(queue_url, REGION, lambda event: None, wait_seconds=0)
+        self.polls = 0
+        self.recovered = asyncio.Event()
+
+    async def poll_once(self) -> int:
+        self.polls += 1
+        if self.polls == 1:
+            raise EndpointConnectionError(endpoint_url=self.queue_url)
+        self.recovered.set()
+        await asyncio.sleep(0)
+        return 0
+
+
+def state_event(instance_id: str, state: str, time: str) -> InstanceStateEvent:
+    """Build a parsed state change event."""
+    return InstanceStateEvent.model_validate(
+        {"instance_id": instance_id, "state": state, "time": time}
+    )
+
+
+def run_instance() -> str:
+    """Launch a moto instance and return its ID."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    return str(
+        ec2.run_instances(ImageId=IMAGE_ID, MinCount=1, MaxCount=1)["Instances"][0]["InstanceId"]
+    )
+
+
+def state_change_body(instance_id: str, state: str) -> str:
+    """Build an EventBridge EC2 state-change event body."""
+    return json.dumps(
+        {
+            "version": "0",
+            "detail-type": "EC2 Instance State-change Notification",
+            "source": "aws.ec2",
+            "time": "2024-05-01T12:00:00Z",
+            "region": REGION,
+            "detail": {"instance-id": instance_id, "state": state},
+        }
+    )
+
+
+@pytest.fixture
+def aws(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Provide fake AWS credentials and moto mocks."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", REGION)
+    with mock_aws():
+        yield
+
+
+@pytest.fixture
+def queue_url(aws: None) -> str:
+    """Create the state-change queue."""
+    sqs = boto3.client("sqs", region_name=REGION)
+    return str(sqs.create_queue(QueueName="ec2-state")["QueueUrl"])
+
+
+def send(queue_url: str, body: str) -> None:
+    """Send a message to the queue."""
+    boto3.client("sqs", region_name=REGION).send_message(QueueUrl=queue_url, MessageBody=body)
+
+
+def test_parse_eventbridge_event() -> None:
+    """Test parsing a raw EventBridge event."""
+    event = parse_state_event(state_change_body("i-1", "stopped"))
+
+    assert event is not None
+    assert event.instance_id == "i-1"
+    assert event.state == "stopped"
+    assert event.time is not None
+
+
+def test_parse_sns_wrapped_event() -> None:
+    """Test parsing an event delivered through SNS."""
+    body = json.dumps({"Type": "Notification", "Message": state_change_body("i-1", "pending")})
+    event = parse_state_event(body)
+
+    assert event is not None
+    assert event.state == "pending"
+
+
+def test_parse_ignores_other_messages() -> None:
+    """Test that unrelated or malformed messages are ignored."""
+    assert parse_state_event(json.dumps({"detail-type": "Other"})) is None
+    assert parse_state_event("not json") is None
+    assert parse_state_event("[]") is None
+
+
+async def test_poll_once_dispatches_and_deletes(queue_url: str) -> None:
+    """Test that a batch is dispatched and removed from the queue."""
+    received: list[InstanceStateEvent] = []
+    listener = InstanceStateListener(queue_url, REGION, received.append, wait_seconds=0)
+    send(queue_url, state_change_body("i-1", "stopping"))
+    send(queue_url, state_change_body("i-1", "stopped"))
+    send(queue_url, "garbage")
+
+    dispatched = await listener.poll_once()
+    await listener.stop()
+
+    assert dispatched == TWO_EVENTS
+    assert [event.state for event in received] == ["stopping", "stopped"]
+    attributes = boto3.client("sqs", region_name=REGION).get_queue_attributes(
+        QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+    )
+    assert attributes["Attributes"]["ApproximateNumberOfMessages"] == "0"
+
+
+async def test_provider_serves_reads_from_events(queue_url: str) -> None:
+    """Test that pushed events update the provider without extra describes."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    instance_id = ec2.run_instances(ImageId=IMAGE_ID, MinCount=1, MaxCount=1)["Instances"][0][
+        "InstanceId"
+    ]
+    provider = EC2Provider(region=REGION, state_queue_url=queue_url)
+    assert provider.events is not None
+    provider.events.wait_seconds = 1
+    received: list[InstanceStateEvent] = []
+    provider.subscribe(received.append)
+    await provider.start()
+
+    try:
+        assert (await provider.get_server_snapshot(instance_id)).state == "running"
+        send(queue_url, state_change_body(instance_id, "stopped"))
+        async with asyncio.timeout(EVENT_TIMEOUT):
+            while not received:
+                await asyncio.sleep(0.05)
+
+        snapshot = await provider.get_server_snapshot(instance_id)
+        assert snapshot.state == "stopped"
+        assert snapshot.public_ip is None
+        assert await provider.get_server_status(instance_id) == "stopped"
+        assert provider.call_stats["describe_instances"].count == 1
+    finally:
+        await provider.close()
+
+
+async def test_provider_polls_without_queue(aws: None) -> None:
+    """Test that every read describes the instance when no queue is set."""
+    ec2 = boto3.client("ec2", region_name=REGION)
+    instance_id = ec2.run_instances(ImageId=IMAGE_ID, MinCount=1, MaxCount=1)["Instances"][0][
+        "InstanceId"
+    ]
+    provider = EC2Provider(region=REGION)
+    await provider.start()
+
+    await provider.get_server_snapshot(instance_id)
+    await provider.get_server_snapshot(instance_id)
+
+    assert provider.events is None
+    assert provider.call_stats["describe_instances"].count == TWO_EVENTS
+    await provider.close()
+
+
+async def test_failed_events_stay_on_the_queue(queue_url: str) -> None:
+    """Test that an event whose handler raises is not deleted and is redelivered."""
+    sqs = boto3.client("sqs", region_name=REGION)
+    # Redeliver unacknowledged messages immediately
+    sqs.set_queue_attributes(QueueUrl=queue_url, Attributes={"VisibilityTimeout": "0"})
+    received: list[InstanceStateEvent] = []
+    failing = {"stopping"}
+
+    def handler(event: InstanceStateEvent) -> None:
+        if event.state in failing:
+            raise RuntimeError("subscriber failed")
+        received.append(event)
+
+    listener = InstanceStateListener(queue_url, REGION, handler, wait_seconds=0)
+    send(queue_url, state_change_body("i-1", "stopping"))
+    send(queue_url, state_change_body("i-1", "stopped"))
+
+    assert await listener.poll_once() == 1
+    assert [event.state for event in received] == ["stopped"]
+
+    failing.clear()
+    assert await listener.poll_once() == 1
+    await listener.stop()
+
+    assert [event.state for event in received] == ["stopped", "stopping"]
+    attributes = sqs.get_queue_attributes(
+        QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+    )
+    assert attributes["Attributes"]["ApproximateNumberOfMessages"] == "0"
+
+
+async def test_listener_survives_network_errors(
+    queue_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a connection failure is retried instead of ending the listener."""
+    monkeypatch.setattr(events, "INITIAL_ERROR_BACKOFF_SECONDS", 0.0)
+    listener = FlakyListener(queue_url)
+    listener.start()
+
+    async with asyncio.timeout(EVENT_TIMEOUT):
+        await listener.recovered.wait()
+
+    assert listener.running
+    await listener.stop()
+
+
+async def test_out_of_order_events_are_ignored(queue_url: str) -> None:
+    """Test that an event older than the viewed state does not overwrite it."""
+    instance_id = run_instance()
+    provider = EC2Provider(region=REGION, state_queue_url=queue_url)
+    assert provider.events is not None
+    provider.events.wait_seconds = 1
+    received: list[InstanceStateEvent] = []
+    provider.subscribe(received.append)
+    await provider.start()
+
+    try:
+        await provider.get_server_snapshot(instance_id)
+        provider.events.handler(state_event(instance_id, "stopped", LATER))
+        provider.events.handler(state_event(instance_id, "stopping", EARLIER))
+
+        assert (await provider.get_server_snapshot(instance_id)).state == "stopped"
+        assert [event.state for event in received] == ["stopped"]
+    finally:
+        await provider.close()
+
+
+async def test_view_entries_expire(queue_url: str) -> None:
+    """Test that an event-fed snapshot is described again after its maximum age."""
+    instance_id = run_instance()
+    clock = FakeClock()
+    provider = EC2Provider(
+        region=REGION, state_queue_url=queue_url, view_max_age=VIEW_MAX_AGE, clock=clock
+    )
+    assert provider.events is not None
+    provider.events.wait_seconds = 1
+    await provider.start()
+
+    try:
+        await provider.get_server_snapshot(instance_id)
+        await provider.get_server_snapshot(instance_id)
+        assert provider.call_stats["describe_instances"].count == 1
+
+        clock.now += VIEW_MAX_AGE
+        await provider.get_server_snapshot(instance_id)
+        assert provider.call_stats["describe_instances"].count == TWO_EVENTS
+    finally:
+        await provider.close()
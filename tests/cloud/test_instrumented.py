@@ -0,0 +1,20 @@
+"""Tests for the instrumented cloud provider."""
+
+from gameserver_pilot.cloud.instrumented import InstrumentedProvider
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.metrics import MetricsRegistry
+
+
+async def test_calls_are_recorded_and_delegated() -> None:
+    """Test that each method is forwarded and counted under its own name."""
+    registry = MetricsRegistry()
+    provider = InstrumentedProvider(MockProvider(), registry)
+
+    assert await provider.start_server("terraria") is True
+    assert await provider.get_server_status("terraria") == "running"
+    snapshots = await provider.get_server_snapshots(["terraria", "corekeeper"])
+
+    assert snapshots["corekeeper"].state == "stopped"
+    for method in ("start_server", "get_server_status", "get_server_snapshots"):
+        assert registry.series("cloud", method).calls == 1
+    assert registry.series("cloud", "stop_server").calls == 0
@@ -56,3 +56,41 @@ async def test_unknown_server(provider: MockProvider) -> None:
 
     success = await provider.start_server("unknown")
     assert success is False
+
+
+async def test_snapshot_when_running(provider: MockProvider) -> None:
+    """Test that a snapshot carries state, IP and instance details."""
+    await provider.start_server("terraria")
+    snapshot = await provider.get_server_snapshot("terraria")
+
+    assert snapshot.server_id == "terraria"
+    assert snapshot.state == "running"
+    assert snapshot.public_ip is not None
+    assert snapshot.instance_type == "t3.small"
+    assert snapshot.launch_time is not None
+    assert snapshot.state_transition_time == snapshot.launch_time
+
+
+async def test_snapshot_is_a_copy(provider: MockProvider) -> None:
+    """Test that mutating a snapshot does not change provider state."""
+    snapshot = await provider.get_server_snapshot("terraria")
+    snapshot.state = "running"
+
+    assert await provider.get_server_status("terraria") == "stopped"
+
+
+async def test_snapshot_unknown_server(provider: MockProvider) -> None:
+    """Test snapshot of an unknown server."""
+    snapshot = await provider.get_server_snapshot("unknown")
+    assert snapshot.state == "unknown"
+    assert snapshot.public_ip is None
+
+
+async def test_snapshots_batch(provider: MockProvider) -> None:
+    """Test fetching several snapshots at once."""
+    await provider.start_server("terraria")
+    snapshots = await provider.get_server_snapshots(["terraria", "corekeeper", "unknown"])
+
+    assert snapshots["terraria"].state == "running"
+    assert snapshots["corekeeper"].state == "stopped"
+    assert snapshots["unknown"].state == "unknown"
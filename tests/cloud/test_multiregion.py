@@ -0,0 +1,140 @@
+"""Tests for the multi-region cloud provider."""
+
+import asyncio
+import time
+from collections.abc import Iterator, Sequence
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from gameserver_pilot.cloud.base import ServerSnapshot
+from gameserver_pilot.cloud.ec2 import EC2Provider
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.cloud.multiregion import MultiRegionProvider, merge_snapshots
+
+TOKYO = "ap-northeast-1"
+OREGON = "us-west-2"
+IMAGE_ID = "ami-12345678"
+REGION_DELAY = 0.2
+REGION_COUNT = 3
+MISSING_ID = "i-0123456789abcdef0"
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Provide fake AWS credentials for moto."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", TOKYO)
+
+
+@pytest.fixture
+def provider(aws_credentials: None) -> Iterator[MultiRegionProvider]:
+    """Create a provider for two moto regions."""
+    with mock_aws():
+        yield MultiRegionProvider.for_regions([TOKYO, OREGON])
+
+
+def launch(region: str, name: str = "") -> str:
+    """Launch a moto instance in a region and return its ID."""
+    response = boto3.client("ec2", region_name=region).run_instances(
+        ImageId=IMAGE_ID,
+        MinCount=1,
+        MaxCount=1,
+        TagSpecifications=[
+            {"ResourceType": "instance", "Tags": [{"Key": "GameServer", "Value": name}]}
+        ],
+    )
+    return str(response["Instances"][0]["InstanceId"])
+
+
+def describe_calls(provider: MultiRegionProvider, region: str) -> int:
+    """Number of DescribeInstances calls a region's provider made."""
+    regional = provider.providers[region]
+    assert isinstance(regional, EC2Provider)
+    stats = regional.call_stats.get("describe_instances")
+    return stats.count if stats else 0
+
+
+async def test_fleet_snapshots_span_regions(provider: MultiRegionProvider) -> None:
+    """Test that one batch finds servers in every region and learns their owners."""
+    tokyo = launch(TOKYO)
+    oregon = launch(OREGON)
+
+    snapshots = await provider.get_server_snapshots([tokyo, oregon, MISSING_ID])
+
+    assert snapshots[tokyo].state == "running"
+    assert snapshots[oregon].state == "running"
+    assert snapshots[MISSING_ID].state == "unknown"
+    assert provider.regions == {tokyo: TOKYO, oregon: OREGON}
+
+
+async def test_known_server_is_routed_to_its_region(provider: MultiRegionProvider) -> None:
+    """Test that once located, single-server calls go to the owning region only."""
+    oregon = launch(OREGON)
+    assert await provider.get_server_status(oregon) == "running"
+    tokyo_calls = describe_calls(provider, TOKYO)
+
+    assert await provider.stop_server(oregon) is True
+    assert await provider.get_server_status(oregon) == "stopped"
+
+    assert describe_calls(provider, TOKYO) == tokyo_calls
+
+
+async def test_server_gone_from_its_region_is_located_again(
+    provider: MultiRegionProvider,
+) -> None:
+    """Test that a stale region index is corrected instead of reporting an error."""
+    oregon = launch(OREGON)
+    provider.regions[oregon] = TOKYO
+
+    assert await provider.get_server_status(oregon) == "running"
+    assert provider.regions[oregon] == OREGON
+
+
+async def test_unknown_server_cannot_be_started(provider: MultiRegionProvider) -> None:
+    """Test that a server missing from every region is reported, not started."""
+    assert await provider.start_server(MISSING_ID) is False
+    assert await provider.get_server_status(MISSING_ID) == "unknown"
+
+
+async def test_discovery_covers_every_region(provider: MultiRegionProvider) -> None:
+    """Test that tagged servers are discovered in all regions."""
+    tokyo = launch(TOKYO, "terraria")
+    oregon = launch(OREGON, "valheim")
+
+    servers = await provider.discover_servers("GameServer")
+
+    assert {server.name for server in servers} == {"terraria", "valheim"}
+    assert provider.regions == {tokyo: TOKYO, oregon: OREGON}
+
+
+class SlowRegion(MockProvider):
+    """MockProvider whose batched reads take a fixed time."""
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        await asyncio.sleep(REGION_DELAY)
+        return await super().get_server_snapshots(server_ids)
+
+
+async def test_fleet_latency_is_the_slowest_region() -> None:
+    """Test that regions are queried concurrently rather than one after another."""
+    provider = MultiRegionProvider({f"region-{i}": SlowRegion() for i in range(REGION_COUNT)})
+
+    started = time.perf_counter()
+    await provider.get_server_snapshots(["terraria", "corekeeper"])
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < REGION_DELAY * 2
+
+
+def test_merge_prefers_owner_then_error() -> None:
+    """Test that a region's failure is not mistaken for a missing server."""
+    running = ServerSnapshot(server_id="i-1", state="running")
+    unknown = ServerSnapshot(server_id="i-1", state="unknown")
+    error = ServerSnapshot(server_id="i-1", state="error")
+
+    assert merge_snapshots("i-1", [unknown, running]) is running
+    assert merge_snapshots("i-1", [unknown, error]).state == "error"
+    assert merge_snapshots("i-1", [unknown, unknown]).state == "unknown"
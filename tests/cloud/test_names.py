@@ -0,0 +1,42 @@
+"""Tests for the server name index."""
+
+from gameserver_pilot.cloud.names import MAX_RESULTS, NameIndex
+
+NAMES = ["terraria", "Terraria-Modded", "corekeeper", "minecraft-survival", "vanilla-minecraft"]
+FLEET_SIZE = 1000
+
+
+def test_prefix_matches_rank_first() -> None:
+    """Test that names starting with the query precede word and substring matches."""
+    index = NameIndex(NAMES)
+
+    assert index.search("minec") == ["minecraft-survival", "vanilla-minecraft"]
+    assert index.search("TERR") == ["terraria", "Terraria-Modded"]
+
+
+def test_substring_matches_need_three_characters() -> None:
+    """Test that matches inside a word are found once the query is long enough."""
+    index = NameIndex(NAMES)
+
+    assert index.search("kee") == ["corekeeper"]
+    assert index.search("ke") == []
+    assert index.search("modd") == ["Terraria-Modded"]
+
+
+def test_empty_query_lists_names_alphabetically() -> None:
+    """Test that an empty query offers the first names."""
+    index = NameIndex(NAMES)
+
+    assert index.search("  ") == sorted(NAMES, key=str.casefold)
+
+
+def test_results_are_limited_and_unique() -> None:
+    """Test that large fleets are cut to Discord's choice limit without repeats."""
+    index = NameIndex(f"server-{i:04d}" for i in range(FLEET_SIZE))
+
+    results = index.search("server")
+
+    assert len(results) == MAX_RESULTS
+    assert len(set(results)) == MAX_RESULTS
+    assert index.search("0999") == ["server-0999"]
+    assert index.search("nothing") == []
@@ -0,0 +1,106 @@
+"""Tests for the server registry."""
+
+import asyncio
+
+import pytest
+
+from gameserver_pilot.cloud.base import ServerInfo
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.cloud.registry import ServerRegistry
+
+TAG_KEY = "GameServer"
+
+
+def info(server_id: str, name: str) -> ServerInfo:
+    """Build a discovered server."""
+    return ServerInfo(server_id=server_id, name=name, tags={TAG_KEY: name})
+
+
+class TaggedProvider(MockProvider):
+    """MockProvider discovering a settable list of servers."""
+
+    def __init__(self, servers: list[ServerInfo]) -> None:
+        super().__init__()
+        self.servers = servers
+        self.error: Exception | None = None
+        self.discoveries: list[str] = []
+
+    async def discover_servers(self, tag_key: str) -> list[ServerInfo]:
+        self.discoveries.append(tag_key)
+        if self.error is not None:
+            raise self.error
+        return self.servers
+
+
+async def test_refresh_indexes_mock_servers() -> None:
+    """Test that the mock provider's servers resolve by name."""
+    registry = ServerRegistry(MockProvider(), tag_key=TAG_KEY)
+
+    await registry.refresh()
+
+    assert registry.servers == {"corekeeper": "corekeeper", "terraria": "terraria"}
+    assert registry.resolve("terraria") == "terraria"
+
+
+async def test_resolve_is_case_insensitive_and_passes_ids_through() -> None:
+    """Test name lookups and the raw-ID fallback."""
+    provider = TaggedProvider([info("i-0abc", "Terraria")])
+    registry = ServerRegistry(provider, tag_key=TAG_KEY)
+
+    await registry.refresh()
+
+    assert registry.resolve("terraria") == "i-0abc"
+    assert registry.resolve("TERRARIA") == "i-0abc"
+    assert registry.resolve("i-0def") == "i-0def"
+    assert registry.get("i-0abc") == info("i-0abc", "Terraria")
+    assert registry.servers == {"Terraria": "i-0abc"}
+
+
+async def test_duplicate_names_keep_one_server() -> None:
+    """Test that two servers sharing a name resolve deterministically."""
+    provider = TaggedProvider([info("i-2", "terraria"), info("i-1", "terraria")])
+    registry = ServerRegistry(provider, tag_key=TAG_KEY)
+
+    await registry.refresh()
+
+    assert registry.resolve("terraria") == "i-1"
+    assert registry.servers == {"terraria": "i-1"}
+
+
+async def test_failed_refresh_keeps_previous_index() -> None:
+    """Test that a discovery error leaves the known servers in place."""
+    provider = TaggedProvider([info("i-0abc", "terraria")])
+    registry = ServerRegistry(provider, tag_key=TAG_KEY)
+    await registry.refresh()
+
+    provider.error = RuntimeError("throttled")
+    with pytest.raises(RuntimeError):
+        await registry.refresh()
+
+    assert registry.resolve("terraria") == "i-0abc"
+
+
+async def test_background_refresh_runs_immediately() -> None:
+    """Test that starting the registry discovers servers right away."""
+    provider = TaggedProvider([info("i-0abc", "terraria")])
+    registry = ServerRegistry(provider, tag_key=TAG_KEY, refresh_interval=3600.0)
+
+    registry.start()
+    try:
+        while registry.refreshed_at is None:
+            await asyncio.sleep(0)
+    finally:
+        await registry.stop()
+
+    assert len(registry) == 1
+    assert provider.discoveries == [TAG_KEY]
+
+
+async def test_search_returns_names_and_ids() -> None:
+    """Test that partial names are resolved from the in-memory index."""
+    provider = TaggedProvider([info("i-1", "terraria"), info("i-2", "corekeeper")])
+    registry = ServerRegistry(provider, tag_key=TAG_KEY)
+    await registry.refresh()
+
+    assert registry.search("ter") == [("terraria", "i-1")]
+    assert registry.search("") == [("corekeeper", "i-2"), ("terraria", "i-1")]
@@ -4,13 +4,21 @@ import httpx
 import pytest
 import respx
 
-from gameserver_pilot.monitoring.beszel_client import BeszelClient, ServerMetrics
+from gameserver_pilot.metrics import MetricsRegistry
+from gameserver_pilot.monitoring.beszel_client import (
+    BeszelClient,
+    InstrumentedTransport,
+    ServerMetrics,
+)
 
 HUB_URL = "https://beszel.example.com"
 TEST_EMAIL = "admin@example.com"
 TEST_PASSWORD = "password123"
 TEST_TOKEN = "test-auth-token"
 EXPECTED_SYSTEM_COUNT = 2
+PAGE_SIZE = 3
+EXPECTED_PAGES = 2
+TWO_CALLS = 2
 
 
 @pytest.fixture
@@ -144,3 +152,86 @@ def test_hub_url_trailing_slash() -> None:
     """Test that trailing slash is removed from hub URL."""
     client = BeszelClient(hub_url="https://example.com/", email=TEST_EMAIL, password=TEST_PASSWORD)
     assert client.hub_url == "https://example.com"
+
+
+@respx.mock
+async def test_get_all_systems_paginates(
+    client: BeszelClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that every page of systems is fetched."""
+    monkeypatch.setattr("gameserver_pilot.monitoring.beszel_client.PAGE_SIZE", PAGE_SIZE)
+    respx.post(f"{HUB_URL}/api/collections/users/auth-with-password").mock(
+        return_value=httpx.Response(200, json={"token": TEST_TOKEN})
+    )
+
+    def page(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params["page"])
+        count = PAGE_SIZE if number == 1 else 1
+        items = [{"name": f"server-{number}-{i}", "status": "up"} for i in range(count)]
+        return httpx.Response(200, json={"items": items})
+
+    route = respx.get(f"{HUB_URL}/api/collections/systems/records").mock(side_effect=page)
+
+    systems = await client.get_all_systems()
+
+    assert len(systems) == PAGE_SIZE + 1
+    assert route.call_count == EXPECTED_PAGES
+    params = route.calls.last.request.url.params
+    assert params["perPage"] == str(PAGE_SIZE)
+    assert params["fields"] == "id,name,status,info"
+
+
+@respx.mock
+async def test_reauthenticates_on_401(client: BeszelClient) -> None:
+    """Test that an expired token is replaced once and the request retried."""
+    client._token = "expired-token"
+    auth = respx.post(f"{HUB_URL}/api/collections/users/auth-with-password").mock(
+        return_value=httpx.Response(200, json={"token": TEST_TOKEN})
+    )
+    respx.get(f"{HUB_URL}/api/collections/systems/records").mock(
+        side_effect=[
+            httpx.Response(401, json={"message": "expired"}),
+            httpx.Response(200, json={"items": [{"name": "server1", "status": "up"}]}),
+        ]
+    )
+
+    systems = await client.get_all_systems()
+
+    assert len(systems) == 1
+    assert auth.call_count == 1
+    assert client._token == TEST_TOKEN
+
+
+@respx.mock
+async def test_persistent_client_reused(client: BeszelClient) -> None:
+    """Test that consecutive calls share one HTTP client."""
+    respx.post(f"{HUB_URL}/api/collections/users/auth-with-password").mock(
+        return_value=httpx.Response(200, json={"token": TEST_TOKEN})
+    )
+    respx.get(f"{HUB_URL}/api/collections/systems/records").mock(
+        return_value=httpx.Response(200, json={"items": []})
+    )
+
+    await client.get_all_systems()
+    http_client = client.client
+    await client.get_all_systems()
+
+    assert client.client is http_client
+    await client.close()
+    assert http_client.is_closed is True
+
+
+@respx.mock
+async def test_instrumented_transport_records_requests() -> None:
+    """Test that HTTP requests are recorded by method and path."""
+    respx.get(f"{HUB_URL}/api/health").mock(side_effect=[httpx.Response(200), httpx.Response(503)])
+    registry = MetricsRegistry()
+    transport = InstrumentedTransport(httpx.AsyncHTTPTransport(), registry, "beszel")
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get(f"{HUB_URL}/api/health")
+        await client.get(f"{HUB_URL}/api/health?probe=1")
+
+    series = registry.series("beszel", "GET /api/health")
+    assert series.calls == TWO_CALLS
+    assert series.errors == 1
@@ -0,0 +1,199 @@
+"""Tests for Beszel realtime streaming against a local fake hub."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from gameserver_pilot.monitoring.beszel_client import (
+    SYSTEMS_TOPIC,
+    BeszelClient,
+    SystemChange,
+    read_sse,
+)
+
+TOKEN = "test-auth-token"
+CLIENT_ID = "client-1"
+TIMEOUT = 5.0
+RECONNECTED = 2
+
+
+def record(record_id: str, name: str, status: str = "up", cpu: float = 10.0) -> dict[str, object]:
+    """Build a systems collection record."""
+    return {"id": record_id, "name": name, "status": status, "info": {"cpu": cpu}}
+
+
+class FakeHub:
+    """Minimal PocketBase serving auth, systems records and realtime SSE."""
+
+    def __init__(self) -> None:
+        self.records = {"r1": record("r1", "terraria"), "r2": record("r2", "corekeeper")}
+        self.connections = 0
+        self.record_requests = 0
+        self.subscriptions: list[str] = []
+        self._streams: list[asyncio.Queue[str | None]] = []
+        self.app = web.Application()
+        self.app.router.add_post("/api/collections/users/auth-with-password", self.auth)
+        self.app.router.add_get("/api/collections/systems/records", self.list_records)
+        self.app.router.add_get("/api/realtime", self.realtime)
+        self.app.router.add_post("/api/realtime", self.subscribe)
+
+    async def auth(self, request: web.Request) -> web.Response:
+        return web.json_response({"token": TOKEN})
+
+    async def list_records(self, request: web.Request) -> web.Response:
+        self.record_requests += 1
+        return web.json_response({"items": list(self.records.values())})
+
+    async def subscribe(self, request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == TOKEN
+        body = await request.json()
+        assert body["clientId"] == CLIENT_ID
+        self.subscriptions.extend(body["subscriptions"])
+        return web.Response(status=204)
+
+    async def realtime(self, request: web.Request) -> web.StreamResponse:
+        self.connections += 1
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._streams.append(queue)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        connect = json.dumps({"clientId": CLIENT_ID})
+        await response.write(f"id:{CLIENT_ID}\nevent:PB_CONNECT\ndata:{connect}\n\n".encode())
+        while (message := await queue.get()) is not None:
+            await response.write(message.encode())
+        self._streams.remove(queue)
+        return response
+
+    def push(self, action: str, data: dict[str, object]) -> None:
+        """Change a record and broadcast the event."""
+        if action == "delete":
+            self.records.pop(str(data["id"]), None)
+        else:
+            self.records[str(data["id"])] = data
+        payload = json.dumps({"action": action, "record": data})
+        for queue in self._streams:
+            queue.put_nowait(f"event: {SYSTEMS_TOPIC}\ndata: {payload}\n\n")
+
+    def drop(self) -> None:
+        """Close every open stream."""
+        for queue in self._streams:
+            queue.put_nowait(None)
+
+
+@pytest.fixture
+async def hub() -> AsyncIterator[tuple[FakeHub, str]]:
+    """Run the fake hub on a local port."""
+    fake = FakeHub()
+    server = TestServer(fake.app)
+    await server.start_server()
+    yield fake, str(server.make_url("")).rstrip("/")
+    await server.close()
+
+
+@pytest.fixture
+async def client(
+    hub: tuple[FakeHub, str], monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[BeszelClient]:
+    """Create a client pointed at the fake hub."""
+    monkeypatch.setattr("gameserver_pilot.monitoring.beszel_client.INITIAL_BACKOFF", 0.01)
+    beszel = BeszelClient(hub_url=hub[1], email="admin@example.com", password="password")
+    yield beszel
+    await beszel.close()
+
+
+async def next_change(changes: AsyncGenerator[SystemChange]) -> SystemChange:
+    """Wait for the next change."""
+    async with asyncio.timeout(TIMEOUT):
+        return await anext(changes)
+
+
+async def wait_for(condition: Callable[[], bool]) -> None:
+    """Poll until a callable returns true."""
+    async with asyncio.timeout(TIMEOUT):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def test_read_sse_parses_events() -> None:
+    """Test splitting a stream into named events with multi-line data."""
+
+    async def lines() -> AsyncIterator[str]:
+        for line in ["event: a", "data: 1", "data: 2", "", ": comment", "data:x", ""]:
+            yield line
+
+    events = [event async for event in read_sse(lines())]
+
+    assert events == [("a", "1\n2"), ("message", "x")]
+
+
+async def test_stream_syncs_and_serves_from_memory(
+    hub: tuple[FakeHub, str], client: BeszelClient
+) -> None:
+    """Test that the initial sync fills the cache and later reads skip the hub."""
+    fake, _ = hub
+    changes = client.changes()
+    first = asyncio.ensure_future(next_change(changes))
+    await asyncio.sleep(0)
+    client.start_streaming()
+
+    assert (await first).action == "create"
+    await wait_for(lambda: len(client.systems) == len(fake.records))
+    requests = fake.record_requests
+    systems = await client.get_all_systems()
+
+    assert {system.name for system in systems} == {"terraria", "corekeeper"}
+    assert fake.record_requests == requests
+    assert fake.subscriptions == [SYSTEMS_TOPIC]
+    await changes.aclose()
+
+
+async def test_stream_applies_updates(hub: tuple[FakeHub, str], client: BeszelClient) -> None:
+    """Test that pushed status changes reach the cache and the iterator."""
+    fake, _ = hub
+    client.start_streaming()
+    await wait_for(lambda: len(client.systems) == len(fake.records))
+    changes = client.changes()
+    pending = asyncio.ensure_future(next_change(changes))
+    await asyncio.sleep(0)
+
+    fake.push("update", record("r1", "terraria", status="down"))
+    change = await pending
+
+    assert change.action == "update"
+    assert change.previous is not None
+    assert change.previous.status == "up"
+    assert client.systems["terraria"].status == "down"
+
+    fake.push("update", record("r2", "corekeeper-renamed"))
+    await wait_for(lambda: "corekeeper-renamed" in client.systems)
+    assert "corekeeper" not in client.systems
+
+    fake.push("delete", record("r1", "terraria", status="down"))
+    await wait_for(lambda: "terraria" not in client.systems)
+    await changes.aclose()
+
+
+async def test_reconnect_resyncs_missed_changes(
+    hub: tuple[FakeHub, str], client: BeszelClient
+) -> None:
+    """Test that changes made while disconnected are reported after reconnecting."""
+    fake, _ = hub
+    client.start_streaming()
+    await wait_for(lambda: len(client.systems) == len(fake.records))
+    changes = client.changes()
+    pending = asyncio.ensure_future(next_change(changes))
+    await asyncio.sleep(0)
+
+    fake.drop()
+    # Changed during the gap, so no realtime event is delivered
+    fake.records["r2"] = record("r2", "corekeeper", status="down")
+    change = await pending
+
+    assert fake.connections >= RECONNECTED
+    assert change.system.name == "corekeeper"
+    assert change.system.status == "down"
+    await changes.aclose()
@@ -0,0 +1,102 @@
+"""Tests for the in-memory metrics history."""
+
+import pytest
+
+from gameserver_pilot.monitoring.beszel_client import ServerMetrics
+from gameserver_pilot.monitoring.history import MetricsHistory, RingBuffer, summarize
+
+SAMPLE_INTERVAL = 60.0
+HOUR = 3600.0
+DAY = 24 * HOUR
+CAPACITY = 4
+SAMPLES_PER_HOUR = 60
+HUNDRED = 100
+P95_OF_HUNDRED = 95.0
+MEAN_OF_HUNDRED = 50.5
+CPU_PEAK = 90.0
+
+
+def metrics(name: str, cpu: float, memory: float = 50.0, disk: float = 20.0) -> ServerMetrics:
+    """Build a metrics sample."""
+    return ServerMetrics(name=name, status="up", cpu=cpu, memory=memory, disk=disk)
+
+
+def test_summarize() -> None:
+    """Test min/avg/max/p95 of a known series."""
+    summary = summarize([float(i) for i in range(1, HUNDRED + 1)])
+
+    assert summary is not None
+    assert summary.minimum == 1.0
+    assert summary.maximum == HUNDRED
+    assert summary.mean == MEAN_OF_HUNDRED
+    assert summary.p95 == P95_OF_HUNDRED
+    assert summarize([]) is None
+
+
+def test_ring_buffer_overwrites_oldest() -> None:
+    """Test that a full ring keeps only the newest rows in time order."""
+    ring = RingBuffer(CAPACITY, 1)
+    for i in range(CAPACITY + 2):
+        ring.append(float(i), [float(i * 10)])
+
+    times, [values] = ring.window(0.0)
+
+    assert len(ring) == CAPACITY
+    assert list(times) == [2.0, 3.0, 4.0, 5.0]
+    assert list(values) == [20.0, 30.0, 40.0, 50.0]
+
+
+def test_trend_over_window() -> None:
+    """Test that trends summarize only samples inside the window."""
+    history = MetricsHistory(sample_interval=SAMPLE_INTERVAL)
+    for i in range(SAMPLES_PER_HOUR):
+        cpu = CPU_PEAK if i == SAMPLES_PER_HOUR - 1 else 10.0
+        history.record([metrics("web", cpu)], timestamp=i * SAMPLE_INTERVAL)
+
+    trend = history.trend("web", window=HOUR, now=HOUR)
+
+    assert trend is not None
+    assert trend["cpu"].maximum == CPU_PEAK
+    assert trend["cpu"].minimum == pytest.approx(10.0)
+    assert trend["memory"].mean == pytest.approx(50.0)
+    assert history.trend("missing") is None
+
+
+def test_finished_hours_are_rolled_up() -> None:
+    """Test that each completed period produces one rollup row."""
+    history = MetricsHistory(sample_interval=SAMPLE_INTERVAL)
+    for i in range(3 * SAMPLES_PER_HOUR):
+        history.record([metrics("web", float(i % SAMPLES_PER_HOUR))], timestamp=i * SAMPLE_INTERVAL)
+
+    rollups = history.rollups("web")
+
+    assert [start for start, _ in rollups] == [0.0, HOUR]
+    assert rollups[0][1]["cpu"].maximum == SAMPLES_PER_HOUR - 1
+    assert rollups[0][1]["disk"].p95 == pytest.approx(20.0)
+
+
+def test_memory_is_bounded() -> None:
+    """Test that storage does not grow with uptime."""
+    history = MetricsHistory(sample_interval=SAMPLE_INTERVAL, retention=HOUR)
+    history.record([metrics("web", 1.0)], timestamp=0.0)
+    allocated = history.nbytes
+
+    for i in range(1, 3 * 24 * SAMPLES_PER_HOUR):
+        history.record([metrics("web", 1.0)], timestamp=i * SAMPLE_INTERVAL)
+
+    assert history.nbytes == allocated
+
+
+def test_silent_systems_are_dropped() -> None:
+    """Test that systems missing for longer than the retention are forgotten."""
+    history = MetricsHistory(sample_interval=SAMPLE_INTERVAL, retention=HOUR)
+    history.record([metrics("old", 1.0), metrics("web", 1.0)], timestamp=0.0)
+    history.record([metrics("web", 1.0)], timestamp=2 * HOUR)
+
+    assert history.systems == ["web"]
+
+
+def test_retention_must_cover_rollup() -> None:
+    """Test that a raw window shorter than a rollup period is rejected."""
+    with pytest.raises(ValueError, match="retention"):
+        MetricsHistory(retention=HOUR / 2, rollup_seconds=HOUR)
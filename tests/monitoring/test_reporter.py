@@ -5,11 +5,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import discord
 import pytest
 
-from gameserver_pilot.monitoring.beszel_client import BeszelClient, ServerMetrics
-from gameserver_pilot.monitoring.reporter import MonitoringReporter
+from gameserver_pilot.embeds import MAX_EMBED_CHARS, MAX_EMBEDS_PER_MESSAGE, MAX_FIELDS_PER_EMBED
+from gameserver_pilot.monitoring.beszel_client import BeszelClient, ServerMetrics, SystemChange
+from gameserver_pilot.monitoring.history import MetricsHistory
+from gameserver_pilot.monitoring.reporter import MonitoringReporter, format_alert
 
 TEST_CHANNEL_ID = 123456789
 EXPECTED_FIELD_COUNT = 2
+SAMPLE_INTERVAL = 60.0
+OTHER_CHANNEL_ID = 987654321
+MISSING_CHANNEL_ID = 555
+FLEET_SIZE = 300
 
 
 @pytest.fixture
@@ -56,10 +62,12 @@ async def test_daily_report_sends_embed(
     mock_bot.get_channel.assert_called_once_with(TEST_CHANNEL_ID)
     mock_channel.send.assert_called_once()
 
-    call_kwargs = mock_channel.send.call_args.kwargs
-    embed = call_kwargs["embed"]
-    assert embed.title == "Daily Server Report"
-    assert len(embed.fields) == EXPECTED_FIELD_COUNT
+    embeds = mock_channel.send.call_args.kwargs["embeds"]
+    assert [embed.title for embed in embeds] == [
+        "Daily Server Report: down (1)",
+        "Daily Server Report: up (1)",
+    ]
+    assert sum(len(embed.fields) for embed in embeds) == EXPECTED_FIELD_COUNT
 
 
 async def test_daily_report_channel_not_found(
@@ -114,3 +122,95 @@ def test_stop_cancels_task(reporter: MonitoringReporter) -> None:
     with patch.object(reporter.daily_report, "cancel") as mock_cancel:
         reporter.stop()
         mock_cancel.assert_called_once()
+
+
+async def test_sample_metrics_records_history(mock_bot: MagicMock, mock_beszel: MagicMock) -> None:
+    """Test that sampling stores metrics and reports show daily trends."""
+    history = MetricsHistory(sample_interval=SAMPLE_INTERVAL)
+    reporter = MonitoringReporter(
+        bot=mock_bot, beszel=mock_beszel, channel_id=TEST_CHANNEL_ID, history=history
+    )
+    mock_beszel.get_all_systems = AsyncMock(
+        return_value=[ServerMetrics(name="server1", status="up", cpu=50.0, memory=60.0, disk=30.0)]
+    )
+
+    await reporter.sample_metrics()
+    value = reporter.format_system(mock_beszel.get_all_systems.return_value[0])
+
+    assert history.systems == ["server1"]
+    assert "CPU: 50.0% (avg 50.0 / p95 50.0 / max 50.0)" in value
+
+
+def test_format_alert_on_status_change() -> None:
+    """Test that only status changes and removals produce alerts."""
+    up = ServerMetrics(name="server1", status="up", cpu=1.0, memory=1.0, disk=1.0)
+    down = up.model_copy(update={"status": "down"})
+    busier = up.model_copy(update={"cpu": 90.0})
+
+    assert format_alert(SystemChange("update", down, up)) == "- server1 is now down (was up)"
+    assert format_alert(SystemChange("update", busier, up)) is None
+    assert format_alert(SystemChange("create", up, None)) is None
+    assert format_alert(SystemChange("delete", up, up)) == "- server1 was removed from monitoring"
+
+
+def text_channel(channel_id: int) -> MagicMock:
+    """Create a mock text channel."""
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = channel_id
+    channel.send = AsyncMock()
+    return channel
+
+
+async def test_large_fleet_is_paginated(mock_bot: MagicMock, mock_beszel: MagicMock) -> None:
+    """Test that hundreds of systems are split into valid embeds and messages."""
+    reporter = MonitoringReporter(bot=mock_bot, beszel=mock_beszel, channel_id=TEST_CHANNEL_ID)
+    systems = [
+        ServerMetrics(
+            name=f"server-{i:03d}",
+            status="down" if i % 10 == 0 else "up",
+            cpu=1.0,
+            memory=2.0,
+            disk=3.0,
+        )
+        for i in range(FLEET_SIZE)
+    ]
+
+    messages = reporter.render(systems)
+    embeds = [embed for batch in messages for embed in batch]
+    names = [str(field.name) for embed in embeds for field in embed.fields]
+
+    assert len(names) == FLEET_SIZE
+    assert all(name.startswith("- ") for name in names[: FLEET_SIZE // 10])
+    assert names[FLEET_SIZE // 10 :] == sorted(names[FLEET_SIZE // 10 :])
+    assert all(len(embed.fields) <= MAX_FIELDS_PER_EMBED for embed in embeds)
+    assert all(len(batch) <= MAX_EMBEDS_PER_MESSAGE for batch in messages)
+    assert all(sum(len(embed) for embed in batch) <= MAX_EMBED_CHARS for batch in messages)
+
+
+async def test_report_delivered_to_every_channel(
+    mock_bot: MagicMock, mock_beszel: MagicMock
+) -> None:
+    """Test that all reachable channels get the report and timings are recorded."""
+    channels = {
+        TEST_CHANNEL_ID: text_channel(TEST_CHANNEL_ID),
+        OTHER_CHANNEL_ID: text_channel(OTHER_CHANNEL_ID),
+    }
+    mock_bot.get_channel.side_effect = channels.get
+    mock_beszel.get_all_systems = AsyncMock(
+        return_value=[ServerMetrics(name="server1", status="up", cpu=1.0, memory=1.0, disk=1.0)]
+    )
+    reporter = MonitoringReporter(
+        bot=mock_bot,
+        beszel=mock_beszel,
+        channel_id=TEST_CHANNEL_ID,
+        channel_ids=[OTHER_CHANNEL_ID, MISSING_CHANNEL_ID],
+    )
+
+    await reporter.daily_report()
+
+    for channel in channels.values():
+        channel.send.assert_called_once()
+    assert reporter.last_timing is not None
+    assert reporter.last_timing.channels == len(channels)
+    assert reporter.last_timing.messages == 1
+    assert reporter.last_timing.render_seconds >= 0.0
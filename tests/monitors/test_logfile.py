@@ -6,6 +6,8 @@ import pytest
 
 from gameserver_pilot.monitors.logfile import LogFileMonitor
 
+TWO_PLAYERS = 2
+
 
 @pytest.fixture
 def temp_log(tmp_path: Path) -> Path:
@@ -68,3 +70,99 @@ async def test_custom_patterns(temp_log: Path) -> None:
     )
     count = await monitor.get_player_count()
     assert count == 1
+
+
+async def test_incremental_append(temp_log: Path) -> None:
+    """Test that only appended lines are parsed on later polls."""
+    temp_log.write_text("PlayerOne has joined\n")
+    monitor = LogFileMonitor(str(temp_log))
+    assert await monitor.get_player_count() == 1
+
+    with temp_log.open("a") as f:
+        f.write("PlayerTwo has joined\n")
+    assert await monitor.get_player_count() == TWO_PLAYERS
+    assert monitor._offset == temp_log.stat().st_size
+
+    with temp_log.open("a") as f:
+        f.write("PlayerOne has left\n")
+    assert await monitor.get_player_count() == 1
+
+
+async def test_partial_line_deferred(temp_log: Path) -> None:
+    """Test that a line without a trailing newline is parsed once complete."""
+    temp_log.write_text("PlayerOne has jo")
+    monitor = LogFileMonitor(str(temp_log))
+    assert await monitor.get_player_count() == 0
+
+    with temp_log.open("a") as f:
+        f.write("ined\n")
+    assert await monitor.get_player_count() == 1
+
+
+async def test_truncation_rescans(temp_log: Path) -> None:
+    """Test that a truncated log is parsed from the start."""
+    temp_log.write_text("PlayerOne has joined\nPlayerTwo has joined\n")
+    monitor = LogFileMonitor(str(temp_log))
+    assert await monitor.get_player_count() == TWO_PLAYERS
+
+    temp_log.write_text("PlayerThree has joined\n")
+    assert await monitor.get_player_count() == 1
+
+
+async def test_copytruncate_rewrite_rescans(temp_log: Path) -> None:
+    """Test that a log rewritten in place beyond the old offset is rescanned."""
+    temp_log.write_text("PlayerOne has joined\n")
+    monitor = LogFileMonitor(str(temp_log))
+    assert await monitor.get_player_count() == 1
+
+    temp_log.write_text("Server restarted\nPlayerTwo has joined\nPlayerThree has joined\n")
+    assert await monitor.get_player_count() == TWO_PLAYERS
+
+
+async def test_rotation_rescans(temp_log: Path) -> None:
+    """Test that a rotated log (new inode) is parsed from the start."""
+    temp_log.write_text("PlayerOne has joined\nPlayerTwo has joined\n")
+    monitor = LogFileMonitor(str(temp_log))
+    assert await monitor.get_player_count() == TWO_PLAYERS
+
+    temp_log.rename(temp_log.with_suffix(".1"))
+    temp_log.write_text("PlayerOne has joined\n")
+    assert await monitor.get_player_count() == 1
+
+
+async def test_checkpoint_resume(temp_log: Path, tmp_path: Path) -> None:
+    """Test that a restarted monitor resumes from the checkpoint."""
+    state_path = tmp_path / "state.json"
+    temp_log.write_text("PlayerOne has joined\nPlayerTwo has joined\n")
+    monitor = LogFileMonitor(str(temp_log), state_path=str(state_path))
+    assert await monitor.get_player_count() == TWO_PLAYERS
+    assert state_path.exists()
+
+    with temp_log.open("a") as f:
+        f.write("PlayerOne has left\n")
+
+    restarted = LogFileMonitor(str(temp_log), state_path=str(state_path))
+    assert restarted._offset > 0
+    assert await restarted.get_player_count() == 1
+
+
+async def test_checkpoint_ignored_after_rotation(temp_log: Path, tmp_path: Path) -> None:
+    """Test that a stale checkpoint does not survive log rotation."""
+    state_path = tmp_path / "state.json"
+    temp_log.write_text("PlayerOne has joined\nPlayerTwo has joined\n")
+    await LogFileMonitor(str(temp_log), state_path=str(state_path)).get_player_count()
+
+    temp_log.unlink()
+    temp_log.write_text("PlayerThree has joined\n")
+    restarted = LogFileMonitor(str(temp_log), state_path=str(state_path))
+    assert await restarted.get_player_count() == 1
+
+
+async def test_corrupt_checkpoint(temp_log: Path, tmp_path: Path) -> None:
+    """Test that an unreadable checkpoint falls back to a full scan."""
+    state_path = tmp_path / "state.json"
+    state_path.write_text("not json")
+    temp_log.write_text("PlayerOne has joined\n")
+
+    monitor = LogFileMonitor(str(temp_log), state_path=str(state_path))
+    assert await monitor.get_player_count() == 1
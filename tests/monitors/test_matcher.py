@@ -0,0 +1,110 @@
+"""Tests for the combined join/leave matcher."""
+
+import pytest
+
+from gameserver_pilot.monitors.matcher import JoinLeaveMatcher, LogEvent, required_literal
+
+
+@pytest.fixture
+def matcher() -> JoinLeaveMatcher:
+    """Create a matcher with the default patterns."""
+    return JoinLeaveMatcher(r"(.+) has joined", r"(.+) has left")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (r"(.+) has joined", " has joined"),
+        (r"\[Join\] (\w+)", "[Join] "),
+        (r"ab?cd", "cd"),
+        (r"foo\d+bar", "foo"),
+        (r"[abc]def(gh)?", "def"),
+        (r"(a|b) xyz", " xyz"),
+        (r"joined|connected", ""),
+        (r"(?i)(.+) joined", ""),
+    ],
+)
+def test_required_literal(pattern: str, expected: str) -> None:
+    """Test literal extraction from regex sources."""
+    assert required_literal(pattern) == expected
+
+
+def test_match_join_and_leave(matcher: JoinLeaveMatcher) -> None:
+    """Test that both event kinds are recognized in one pass."""
+    assert matcher.match("Alice has joined") == LogEvent("join", "Alice")
+    assert matcher.match("Alice has left") == LogEvent("leave", "Alice")
+    assert matcher.match("Server started") is None
+
+
+def test_match_bytes_prefilter(matcher: JoinLeaveMatcher) -> None:
+    """Test that raw lines are matched and non-candidates rejected."""
+    assert matcher.literals == (b" has joined", b" has left")
+    assert matcher.match_bytes("プレイヤー has joined".encode()) == LogEvent("join", "プレイヤー")
+    assert matcher.match_bytes(b"Saving world...") is None
+
+
+def test_scan_preserves_order(matcher: JoinLeaveMatcher) -> None:
+    """Test scanning a buffer yields events in log order."""
+    data = b"boot\nAlice has joined\nnoise\nBob has joined\r\nAlice has left\n"
+
+    assert list(matcher.scan(data)) == [
+        LogEvent("join", "Alice"),
+        LogEvent("join", "Bob"),
+        LogEvent("leave", "Alice"),
+    ]
+
+
+def test_scan_without_prefilter() -> None:
+    """Test scanning when no literal can be derived from the patterns."""
+    matcher = JoinLeaveMatcher(r"(\w+)\s(?:joined|connected)", r"(\w+)\s(?:left|disconnected)")
+    data = b"alice connected\nbob joined\nalice disconnected\n"
+
+    assert matcher.literals == ()
+    assert [event.kind for event in matcher.scan(data)] == ["join", "join", "leave"]
+
+
+def test_patterns_with_extra_groups() -> None:
+    """Test that the player capture is the first group of each pattern."""
+    matcher = JoinLeaveMatcher(r"(\w+) joined (from (\S+))", r"(\w+) left")
+
+    assert matcher.match("alice joined from 10.0.0.1") == LogEvent("join", "alice")
+    assert matcher.match("bob left") == LogEvent("leave", "bob")
+
+
+@pytest.mark.parametrize(
+    ("join_pattern", "leave_pattern", "line", "expected"),
+    [
+        (r"(?i)(.+) joined", r"(?i)(.+) left", "Alice JOINED", LogEvent("join", "Alice")),
+        (r"(?i)(.+) joined", r"(?i)(.+) left", "Bob Left", LogEvent("leave", "Bob")),
+        (
+            r"(?P<player>\w+) has joined",
+            r"(?P<player>\w+) has left",
+            "Carol has left",
+            LogEvent("leave", "Carol"),
+        ),
+        (r"<(\w+)> (\1) joined", r"<(\w+)> left", "<dave> dave joined", LogEvent("join", "dave")),
+    ],
+)
+def test_uncombinable_patterns(
+    join_pattern: str, leave_pattern: str, line: str, expected: LogEvent
+) -> None:
+    """Test that inline flags, named groups and backreferences fall back to separate regexes."""
+    matcher = JoinLeaveMatcher(join_pattern, leave_pattern)
+
+    assert matcher.regex is None
+    assert matcher.match(line) == expected
+    assert matcher.match("Server started") is None
+
+
+def test_separate_patterns_keep_prefilter() -> None:
+    """Test that the bytes prefilter still guards separately compiled patterns."""
+    matcher = JoinLeaveMatcher(r"(?P<player>\w+) has joined", r"(?P<player>\w+) has left")
+    data = b"noise\nalice has joined\nbob has joined\nalice has left\n"
+
+    assert matcher.literals == (b" has joined", b" has left")
+    assert matcher.match_bytes(b"Saving world...") is None
+    assert list(matcher.scan(data)) == [
+        LogEvent("join", "alice"),
+        LogEvent("join", "bob"),
+        LogEvent("leave", "alice"),
+    ]
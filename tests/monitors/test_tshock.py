@@ -0,0 +1,118 @@
+"""Tests for the TShock REST API player monitor."""
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import respx
+
+from gameserver_pilot.monitors.tshock import TShockMonitor, create_http_client
+
+BASE_URL = "http://terraria.example.com:7878"
+TEST_TOKEN = "tshock-token"
+THREE_PLAYERS = 3
+PROBES = 5
+CONNECT_TIMEOUT = 1.5
+READ_TIMEOUT = 4.0
+
+
+@pytest.fixture
+async def shared_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Create a shared pooled client."""
+    client = create_http_client()
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def monitor(shared_client: httpx.AsyncClient) -> TShockMonitor:
+    """Create a monitor using the shared client."""
+    return TShockMonitor("terraria.example.com", token=TEST_TOKEN, client=shared_client)
+
+
+@respx.mock
+async def test_get_player_count(monitor: TShockMonitor) -> None:
+    """Test counting players from the REST API."""
+    route = respx.get(f"{BASE_URL}/v2/players/list").mock(
+        return_value=httpx.Response(200, json={"players": [{}, {}, {}]})
+    )
+
+    assert await monitor.get_player_count() == THREE_PLAYERS
+    assert route.calls.last.request.url.params["token"] == TEST_TOKEN
+
+
+@respx.mock
+async def test_get_player_count_error(monitor: TShockMonitor) -> None:
+    """Test that HTTP errors count as zero players."""
+    respx.get(f"{BASE_URL}/v2/players/list").mock(side_effect=httpx.ConnectError("refused"))
+
+    assert await monitor.get_player_count() == 0
+
+
+@respx.mock
+async def test_is_available(monitor: TShockMonitor) -> None:
+    """Test the availability probe."""
+    respx.get(f"{BASE_URL}/v2/server/status").mock(return_value=httpx.Response(200))
+    assert await monitor.is_available() is True
+
+    respx.get(f"{BASE_URL}/v2/server/status").mock(side_effect=httpx.ConnectTimeout("timeout"))
+    assert await monitor.is_available() is False
+
+
+@respx.mock
+async def test_probes_reuse_client(
+    monitor: TShockMonitor, shared_client: httpx.AsyncClient
+) -> None:
+    """Test that repeated probes go through the same client."""
+    respx.get(f"{BASE_URL}/v2/players/list").mock(
+        return_value=httpx.Response(200, json={"players": []})
+    )
+
+    for _ in range(PROBES):
+        await monitor.get_player_count()
+
+    assert monitor.client is shared_client
+    assert respx.calls.call_count == PROBES
+
+
+async def test_close_keeps_shared_client(
+    monitor: TShockMonitor, shared_client: httpx.AsyncClient
+) -> None:
+    """Test that closing a monitor leaves a shared client open."""
+    await monitor.close()
+    assert shared_client.is_closed is False
+
+
+async def test_close_owned_client() -> None:
+    """Test that a monitor closes a client it created itself."""
+    monitor = TShockMonitor("localhost")
+    client = monitor.client
+    await monitor.close()
+
+    assert client.is_closed is True
+
+
+def test_create_http_client_timeouts() -> None:
+    """Test that connect and read timeouts are configured separately."""
+    client = create_http_client(connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT)
+
+    assert client.timeout.connect == CONNECT_TIMEOUT
+    assert client.timeout.read == READ_TIMEOUT
+
+
+@respx.mock
+async def test_resolved_host(shared_client: httpx.AsyncClient) -> None:
+    """Test that a resolver supplies the host on every probe, and no host means unreachable."""
+    hosts: list[str | None] = [None, "terraria.example.com"]
+
+    async def resolve() -> str | None:
+        return hosts[0]
+
+    monitor = TShockMonitor(resolve, token=TEST_TOKEN, client=shared_client)
+    respx.get(f"{BASE_URL}/v2/server/status").mock(return_value=httpx.Response(200))
+
+    assert await monitor.is_available() is False
+    assert await monitor.get_player_count() == 0
+
+    hosts.pop(0)
+    assert await monitor.is_available() is True
@@ -0,0 +1,168 @@
+"""Tests for the event-driven log watcher."""
+
+import asyncio
+import shutil
+import sys
+from collections.abc import AsyncGenerator, AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+from gameserver_pilot.monitors.watcher import LogWatcher, PlayerCountChange
+
+POLL_INTERVAL = 0.02
+CHANGE_TIMEOUT = 2.0
+TWO_PLAYERS = 2
+
+LINUX_ONLY = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+WATCH_MODES = [
+    pytest.param(False, id="polling"),
+    pytest.param(True, id="inotify", marks=LINUX_ONLY),
+]
+QUEUE_LIMIT = Path("/proc/sys/fs/inotify/max_queued_events")
+
+
+@pytest.fixture(params=WATCH_MODES)
+async def watcher(request: pytest.FixtureRequest) -> AsyncIterator[LogWatcher]:
+    """Create a watcher in each supported mode."""
+    log_watcher = LogWatcher(poll_interval=POLL_INTERVAL, use_inotify=request.param)
+    yield log_watcher
+    await log_watcher.stop()
+
+
+async def next_change(changes: AsyncGenerator[PlayerCountChange]) -> PlayerCountChange:
+    """Wait for the next change with a timeout."""
+    async with asyncio.timeout(CHANGE_TIMEOUT):
+        return await anext(changes)
+
+
+def append(path: Path, text: str) -> None:
+    """Append text to a log file."""
+    with path.open("a") as f:
+        f.write(text)
+
+
+async def wait_for_change(received: list[PlayerCountChange], change: PlayerCountChange) -> None:
+    """Wait until a callback has received a change."""
+    async with asyncio.timeout(CHANGE_TIMEOUT):
+        while change not in received:
+            await asyncio.sleep(POLL_INTERVAL)
+
+
+async def test_pushes_count_changes(watcher: LogWatcher, tmp_path: Path) -> None:
+    """Test that appended joins and leaves are pushed to iterators."""
+    log = tmp_path / "terraria.log"
+    log.write_text("Alice has joined\n")
+    watcher.add("terraria", LogFileMonitor(str(log)))
+    changes = watcher.changes()
+    pending = asyncio.ensure_future(next_change(changes))
+    await asyncio.sleep(0)
+    await watcher.start()
+
+    assert await pending == PlayerCountChange("terraria", 1)
+
+    append(log, "Bob has joined\n")
+    assert await next_change(changes) == PlayerCountChange("terraria", TWO_PLAYERS)
+
+    append(log, "Alice has left\nBob has left\n")
+    assert await next_change(changes) == PlayerCountChange("terraria", 0)
+    await changes.aclose()
+
+
+async def test_multiplexes_logs(watcher: LogWatcher, tmp_path: Path) -> None:
+    """Test that one watcher serves several logs and callbacks."""
+    received: list[PlayerCountChange] = []
+    logs = {name: tmp_path / f"{name}.log" for name in ("terraria", "corekeeper")}
+    for name, log in logs.items():
+        log.touch()
+        watcher.add(name, LogFileMonitor(str(log)))
+    watcher.subscribe(received.append)
+    await watcher.start()
+
+    append(logs["corekeeper"], "Carol has joined\n")
+    await wait_for_change(received, PlayerCountChange("corekeeper", 1))
+
+    assert watcher.counts == {"terraria": 0, "corekeeper": 1}
+
+
+async def test_detects_rotation(watcher: LogWatcher, tmp_path: Path) -> None:
+    """Test that a rotated log is re-read from the new file."""
+    log = tmp_path / "server.log"
+    log.write_text("Alice has joined\nBob has joined\n")
+    watcher.add("terraria", LogFileMonitor(str(log)))
+    changes = watcher.changes()
+    pending = asyncio.ensure_future(next_change(changes))
+    await asyncio.sleep(0)
+    await watcher.start()
+    assert await pending == PlayerCountChange("terraria", TWO_PLAYERS)
+
+    log.rename(tmp_path / "server.log.1")
+    log.write_text("Carol has joined\n")
+
+    assert await next_change(changes) == PlayerCountChange("terraria", 1)
+    await changes.aclose()
+
+
+async def test_async_callback_and_remove(watcher: LogWatcher, tmp_path: Path) -> None:
+    """Test async callbacks and removing a watched log."""
+    log = tmp_path / "server.log"
+    log.write_text("Alice has joined\n")
+    seen = asyncio.Event()
+
+    async def on_change(change: PlayerCountChange) -> None:
+        seen.set()
+
+    watcher.subscribe(on_change)
+    watcher.add("terraria", LogFileMonitor(str(log)))
+    await watcher.start()
+    async with asyncio.timeout(CHANGE_TIMEOUT):
+        await seen.wait()
+
+    watcher.remove("terraria")
+    assert "terraria" not in watcher.counts
+
+
+@LINUX_ONLY
+async def test_rescans_after_queue_overflow(tmp_path: Path) -> None:
+    """Test that a change whose event was dropped is still seen after an overflow."""
+    log = tmp_path / "server.log"
+    log.write_text("Alice has joined\n")
+    watcher = LogWatcher(poll_interval=POLL_INTERVAL, use_inotify=True)
+    received: list[PlayerCountChange] = []
+    watcher.subscribe(received.append)
+    watcher.add("terraria", LogFileMonitor(str(log)))
+    await watcher.start()
+    await wait_for_change(received, PlayerCountChange("terraria", 1))
+
+    # Fill the kernel queue before the loop can read it, then change the log
+    noise = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for i in range(int(QUEUE_LIMIT.read_text()) + 1):
+        append(noise[i % len(noise)], "x")
+    append(log, "Bob has joined\n")
+
+    await wait_for_change(received, PlayerCountChange("terraria", TWO_PLAYERS))
+    await watcher.stop()
+
+
+@LINUX_ONLY
+async def test_removed_directory_is_polled(tmp_path: Path) -> None:
+    """Test that logs whose directory watch was removed fall back to polling."""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    log = log_dir / "server.log"
+    log.write_text("Alice has joined\n")
+    watcher = LogWatcher(poll_interval=POLL_INTERVAL, use_inotify=True)
+    received: list[PlayerCountChange] = []
+    watcher.subscribe(received.append)
+    watcher.add("terraria", LogFileMonitor(str(log)))
+    await watcher.start()
+    await wait_for_change(received, PlayerCountChange("terraria", 1))
+
+    shutil.rmtree(log_dir)
+    await wait_for_change(received, PlayerCountChange("terraria", 0))
+    log_dir.mkdir()
+    log.write_text("Bob has joined\nCarol has joined\n")
+
+    await wait_for_change(received, PlayerCountChange("terraria", TWO_PLAYERS))
+    await watcher.stop()
@@ -0,0 +1,403 @@
+"""Tests for the auto-stop scheduler."""
+
+import asyncio
+import random
+
+import pytest
+
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.metrics import MetricsRegistry
+from gameserver_pilot.monitors.base import PlayerMonitor
+from gameserver_pilot.scheduler.autostop import AutoStopScheduler
+from gameserver_pilot.scheduler.policy import PollPolicy
+
+IDLE_TIMEOUT = 300.0
+LONG_IDLE_TIMEOUT = 7200.0
+POLL_INTERVAL = 60.0
+MANY_SERVERS = 300
+MAX_CONCURRENCY = 5
+BUSY_PLAYERS = 8
+HOUR = 3600.0
+LEAVE_SPACING = 600.0
+MIN_INTERVAL = 15.0
+MAX_BACKOFF = 900.0
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeMonitor(PlayerMonitor):
+    """Monitor returning a settable player count and tracking concurrency."""
+
+    def __init__(self, players: int = 0, delay: float = 0.0) -> None:
+        self.players = players
+        self.available = True
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def get_player_count(self) -> int:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.players
+        finally:
+            self.active -= 1
+
+    async def is_available(self) -> bool:
+        return self.available
+
+
+class FleetMockProvider(MockProvider):
+    """MockProvider with an arbitrary number of servers."""
+
+    def __init__(self, count: int) -> None:
+        super().__init__()
+        template = self._servers["terraria"]
+        self._servers = {
+            f"srv-{i}": template.model_copy(update={"server_id": f"srv-{i}"}) for i in range(count)
+        }
+        self.snapshot_batches = 0
+
+    async def get_server_snapshots(self, server_ids):  # type: ignore[no-untyped-def]
+        self.snapshot_batches += 1
+        return await super().get_server_snapshots(server_ids)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+async def run_until(clock: FakeClock, scheduler: AutoStopScheduler, until: float) -> None:
+    """Advance the fake clock one second at a time, ticking the scheduler."""
+    while clock.now < until:
+        clock.now += 1.0
+        await scheduler.tick()
+
+
+async def test_idle_server_is_stopped(clock: FakeClock) -> None:
+    """Test that a server empty for longer than the timeout is stopped."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    scheduler = AutoStopScheduler(
+        cloud,
+        IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL),
+        clock=clock,
+        rng=random.Random(0),
+    )
+    scheduler.register("terraria", FakeMonitor(players=0))
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT)
+    assert await cloud.get_server_status("terraria") == "running"
+    await run_until(clock, scheduler, IDLE_TIMEOUT + 2 * POLL_INTERVAL)
+
+    assert await cloud.get_server_status("terraria") == "stopped"
+    assert sum(tick.stopped for tick in scheduler.metrics.recent) == 1
+
+
+async def test_players_reset_idle_time(clock: FakeClock) -> None:
+    """Test that a server with players is never stopped."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=0)
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor)
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT - POLL_INTERVAL)
+    assert scheduler.idle_seconds("terraria") is not None
+    monitor.players = 1
+    await run_until(clock, scheduler, IDLE_TIMEOUT * 3)
+
+    assert scheduler.idle_seconds("terraria") is None
+    assert await cloud.get_server_status("terraria") == "running"
+
+
+async def test_stopped_servers_are_not_polled(clock: FakeClock) -> None:
+    """Test that monitors of non-running servers are skipped."""
+    monitor = FakeMonitor(players=0)
+    scheduler = AutoStopScheduler(
+        MockProvider(), IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor)
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT)
+
+    assert monitor.calls == 0
+    assert scheduler.metrics.ticks == int(IDLE_TIMEOUT)
+
+
+async def test_fan_out_is_bounded_and_batched(clock: FakeClock) -> None:
+    """Test that hundreds of servers share batched lookups and bounded polling."""
+    cloud = FleetMockProvider(MANY_SERVERS)
+    monitor = FakeMonitor(players=1, delay=0.001)
+    scheduler = AutoStopScheduler(
+        cloud,
+        IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL),
+        max_concurrency=MAX_CONCURRENCY,
+        clock=clock,
+    )
+    for i in range(MANY_SERVERS):
+        await cloud.start_server(f"srv-{i}")
+        scheduler.register(f"srv-{i}", monitor)
+
+    await run_until(clock, scheduler, POLL_INTERVAL)
+
+    # Every server was checked at least once within the first interval
+    assert monitor.calls >= MANY_SERVERS
+    assert monitor.peak <= MAX_CONCURRENCY
+    assert cloud.snapshot_batches <= POLL_INTERVAL
+    assert sum(tick.polled for tick in scheduler.metrics.recent) == monitor.calls
+
+
+async def test_unregister_cancels_checks(clock: FakeClock) -> None:
+    """Test that an unregistered server is no longer checked."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=0)
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor)
+    scheduler.unregister("terraria")
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT * 2)
+
+    assert monitor.calls == 0
+    assert await cloud.get_server_status("terraria") == "running"
+
+
+async def test_start_and_stop_loop() -> None:
+    """Test that the background loop can be started and stopped."""
+    scheduler = AutoStopScheduler(MockProvider(), IDLE_TIMEOUT, tick=0.01)
+    scheduler.start()
+    assert scheduler.running
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert not scheduler.running
+    assert scheduler.metrics.ticks > 0
+
+
+async def test_busy_server_is_polled_rarely(clock: FakeClock) -> None:
+    """Test that a crowded server is probed an order of magnitude less often."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=BUSY_PLAYERS)
+    scheduler = AutoStopScheduler(
+        cloud,
+        IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL),
+        jitter=0.0,
+        clock=clock,
+    )
+    scheduler.register("terraria", monitor)
+    await run_until(clock, scheduler, HOUR)
+    monitor.calls = 0
+
+    await run_until(clock, scheduler, 2 * HOUR)
+
+    fixed_rate_polls = HOUR / POLL_INTERVAL
+    assert monitor.calls * 10 <= fixed_rate_polls
+
+
+async def test_stop_is_not_delayed(clock: FakeClock) -> None:
+    """Test that an emptied server is stopped close to its idle deadline."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=BUSY_PLAYERS)
+    scheduler = AutoStopScheduler(
+        cloud,
+        IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL, min_interval=MIN_INTERVAL),
+        jitter=0.0,
+        clock=clock,
+    )
+    scheduler.register("terraria", monitor)
+    await run_until(clock, scheduler, HOUR)
+
+    # Players drift away one every ten minutes, then the server stays empty
+    while monitor.players:
+        await run_until(clock, scheduler, clock.now + LEAVE_SPACING)
+        monitor.players -= 1
+    emptied_at = clock.now
+    while await cloud.get_server_status("terraria") == "running":
+        await run_until(clock, scheduler, clock.now + 1)
+
+    assert clock.now - emptied_at <= IDLE_TIMEOUT + POLL_INTERVAL + MIN_INTERVAL
+
+
+async def test_unreachable_monitor_backs_off(clock: FakeClock) -> None:
+    """Test that an unreachable monitor is retried less often before the idle deadline."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=0)
+    monitor.available = False
+    scheduler = AutoStopScheduler(
+        cloud,
+        LONG_IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL, max_backoff=MAX_BACKOFF),
+        jitter=0.0,
+        clock=clock,
+    )
+    scheduler.register("terraria", monitor)
+
+    await run_until(clock, scheduler, HOUR)
+
+    tracked = scheduler.servers["terraria"]
+    assert tracked.interval == MAX_BACKOFF
+    assert monitor.calls < HOUR / POLL_INTERVAL / 2
+    assert await cloud.get_server_status("terraria") == "running"
+
+    monitor.available = True
+    await run_until(clock, scheduler, clock.now + MAX_BACKOFF)
+    assert tracked.failures == 0
+
+
+async def test_crashed_game_is_stopped(clock: FakeClock) -> None:
+    """Test that a running instance whose game never answers is stopped after the timeout."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=0)
+    monitor.available = False
+    scheduler = AutoStopScheduler(
+        cloud,
+        IDLE_TIMEOUT,
+        policy=PollPolicy(base_interval=POLL_INTERVAL, max_backoff=MAX_BACKOFF),
+        jitter=0.0,
+        clock=clock,
+    )
+    scheduler.register("terraria", monitor)
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT)
+    assert await cloud.get_server_status("terraria") == "running"
+    await run_until(clock, scheduler, IDLE_TIMEOUT + POLL_INTERVAL + MIN_INTERVAL)
+
+    assert await cloud.get_server_status("terraria") == "stopped"
+    assert sum(tick.stopped for tick in scheduler.metrics.recent) == 1
+
+
+async def test_wake_checks_on_next_tick(clock: FakeClock) -> None:
+    """Test that waking a stopped server skips its long interval."""
+    cloud = MockProvider()
+    monitor = FakeMonitor(players=1)
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor)
+    await run_until(clock, scheduler, POLL_INTERVAL)
+    assert monitor.calls == 0
+
+    await cloud.start_server("terraria")
+    scheduler.wake("terraria")
+    await run_until(clock, scheduler, clock.now + 1)
+
+    assert monitor.calls == 1
+
+
+async def test_instrument_records_monitor_calls(clock: FakeClock) -> None:
+    """Test that monitor calls and ticks are recorded once instrumented."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    registry = MetricsRegistry()
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", FakeMonitor(players=1))
+    scheduler.instrument(registry)
+
+    await run_until(clock, scheduler, POLL_INTERVAL)
+
+    assert registry.series("monitor", "FakeMonitor.get_player_count").calls == 1
+    assert registry.series("scheduler", "tick").calls == int(POLL_INTERVAL)
+
+
+async def test_subscribers_see_player_counts(clock: FakeClock) -> None:
+    """Test that observers get every player count a monitor reports."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", FakeMonitor(players=BUSY_PLAYERS))
+    seen: list[tuple[str, int]] = []
+    scheduler.subscribe(lambda server_id, players: seen.append((server_id, players)))
+
+    await run_until(clock, scheduler, POLL_INTERVAL)
+
+    assert seen == [("terraria", BUSY_PLAYERS)]
+
+
+async def test_failing_observer_does_not_fail_check(clock: FakeClock) -> None:
+    """Test that an observer raising does not turn a healthy poll into an error."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", FakeMonitor(players=BUSY_PLAYERS))
+
+    def observer(server_id: str, players: int) -> None:
+        raise RuntimeError("observer failed")
+
+    scheduler.subscribe(observer)
+    await run_until(clock, scheduler, POLL_INTERVAL)
+
+    assert sum(tick.errors for tick in scheduler.metrics.recent) == 0
+    assert scheduler.servers["terraria"].failures == 0
+
+
+async def test_pushed_counts_replace_polls(clock: FakeClock) -> None:
+    """Test that a pushed server is stopped from pushed counts without polling its monitor."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=BUSY_PLAYERS)
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor, pushed=True)
+    scheduler.push("terraria", 1)
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT * 2)
+    assert await cloud.get_server_status("terraria") == "running"
+
+    scheduler.push("terraria", 0)
+    await run_until(clock, scheduler, clock.now + 1)
+    assert scheduler.idle_seconds("terraria") is not None
+    await run_until(clock, scheduler, clock.now + IDLE_TIMEOUT + 2 * POLL_INTERVAL)
+
+    assert await cloud.get_server_status("terraria") == "stopped"
+    assert monitor.calls == 0
+
+
+async def test_push_ignores_polled_servers(clock: FakeClock) -> None:
+    """Test that counts pushed for a polled or unknown server are ignored."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    monitor = FakeMonitor(players=1)
+    scheduler = AutoStopScheduler(
+        cloud, IDLE_TIMEOUT, policy=PollPolicy(base_interval=POLL_INTERVAL), clock=clock
+    )
+    scheduler.register("terraria", monitor)
+    scheduler.push("terraria", 0)
+    scheduler.push("unknown", 0)
+
+    await run_until(clock, scheduler, IDLE_TIMEOUT * 2)
+
+    assert monitor.calls > 0
+    assert scheduler.idle_seconds("terraria") is None
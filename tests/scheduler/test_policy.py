@@ -0,0 +1,54 @@
+"""Tests for adaptive polling intervals."""
+
+from gameserver_pilot.scheduler.policy import PollPolicy
+
+BASE = 60.0
+MIN = 15.0
+MAX = 600.0
+MAX_BACKOFF = 900.0
+REMAINING = 40.0
+BUSY = 10
+
+
+def make_policy() -> PollPolicy:
+    """Create a policy with known bounds."""
+    return PollPolicy(
+        base_interval=BASE, min_interval=MIN, max_interval=MAX, max_backoff=MAX_BACKOFF
+    )
+
+
+def test_interval_grows_with_players() -> None:
+    """Test that busier servers are polled less often, up to the maximum."""
+    policy = make_policy()
+
+    intervals = [policy.for_players(players) for players in range(1, BUSY)]
+
+    assert intervals == sorted(intervals)
+    assert intervals[0] == BASE
+    assert intervals[-1] == MAX
+
+
+def test_empty_server_polls_at_deadline() -> None:
+    """Test that an empty server is checked when its idle deadline arrives."""
+    policy = make_policy()
+
+    assert policy.for_players(0) == BASE
+    assert policy.for_players(0, idle_remaining=REMAINING) == REMAINING
+    assert policy.for_players(0, idle_remaining=0.0) == MIN
+
+
+def test_not_running_states() -> None:
+    """Test that stopped servers wait long and booting servers are rechecked soon."""
+    policy = make_policy()
+
+    assert policy.for_state("stopped") == MAX
+    assert policy.for_state("pending") == MIN
+
+
+def test_failures_back_off_exponentially() -> None:
+    """Test that consecutive failures double the interval up to the cap."""
+    policy = make_policy()
+
+    assert policy.for_failures(1) == BASE * 2
+    assert policy.for_failures(2) == BASE * 4
+    assert policy.for_failures(BUSY) == MAX_BACKOFF
@@ -0,0 +1,225 @@
+"""Tests for predictive pre-warming."""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.scheduler.prewarm import (
+    HOURS_PER_WEEK,
+    SECONDS_PER_DAY,
+    SECONDS_PER_HOUR,
+    DemandTracker,
+    PrewarmPolicy,
+    PrewarmScheduler,
+    hour_of_week,
+)
+
+# A Monday, 00:00 UTC
+MONDAY = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+WEEK = HOURS_PER_WEEK * SECONDS_PER_HOUR
+EVENING = 20
+LEAD_TIME = 600.0
+WINDOW = 3600.0
+COST = WINDOW / 60
+TRAINING_WEEKS = 2
+PLAYERS = 3
+LAST_SLOT = HOURS_PER_WEEK - 1
+GAP_HOURS = 5
+MINUTES_UNTIL_PLAYER = 15
+HALF = 0.5
+
+
+class FakeClock:
+    """Manually set wall clock."""
+
+    def __init__(self, now: float = MONDAY) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+def train(
+    tracker: DemandTracker,
+    clock: FakeClock,
+    busy: dict[str, Iterable[int]],
+    weeks: int,
+    first_week: int = 0,
+) -> None:
+    """Report players at the given hours of the week, and none otherwise."""
+    start = MONDAY + first_week * WEEK
+    for hour in range(weeks * HOURS_PER_WEEK):
+        clock.now = start + hour * SECONDS_PER_HOUR + 1
+        for server_id, slots in busy.items():
+            tracker.observe(server_id, PLAYERS if hour % HOURS_PER_WEEK in slots else 0)
+    clock.now = start + weeks * WEEK
+    tracker.roll()
+
+
+def before_evening(clock: FakeClock, minutes: float = LEAD_TIME / 60 - 2) -> None:
+    """Move the clock to Monday evening of the week after training, minus some minutes."""
+    clock.now = MONDAY + TRAINING_WEEKS * WEEK + EVENING * SECONDS_PER_HOUR - minutes * 60
+
+
+def make_scheduler(
+    cloud: MockProvider, tracker: DemandTracker, clock: FakeClock, budget: float = COST
+) -> PrewarmScheduler:
+    """Create a scheduler whose budget covers one pre-warm by default."""
+    policy = PrewarmPolicy(lead_time=LEAD_TIME, budget_minutes=budget, window=WINDOW)
+    return PrewarmScheduler(cloud, tracker, policy, clock=clock)
+
+
+def test_hour_of_week() -> None:
+    """Test that buckets start on Monday midnight UTC."""
+    assert hour_of_week(MONDAY) == 0
+    assert hour_of_week(MONDAY + EVENING * SECONDS_PER_HOUR + 1) == EVENING
+    assert hour_of_week(MONDAY + WEEK - 1) == LAST_SLOT
+
+
+def test_tracker_learns_busy_hours(clock: FakeClock) -> None:
+    """Test that predictions follow the hours players were seen."""
+    tracker = DemandTracker(min_weeks=TRAINING_WEEKS, clock=clock)
+    train(tracker, clock, {"terraria": [EVENING]}, TRAINING_WEEKS)
+    evening = MONDAY + EVENING * SECONDS_PER_HOUR
+
+    assert tracker.probability("terraria", evening) == 1.0
+    assert tracker.probability("terraria", evening + SECONDS_PER_HOUR) == 0.0
+    assert tracker.probability("unknown", evening) is None
+
+    strict = DemandTracker(min_weeks=TRAINING_WEEKS + 1, clock=clock)
+    strict.histograms = tracker.histograms
+    assert strict.probability("terraria", evening) is None
+
+
+def test_tracker_skips_hours_it_did_not_see(clock: FakeClock) -> None:
+    """Test that only the hour in progress is counted after a gap."""
+    tracker = DemandTracker(clock=clock)
+    tracker.observe("terraria", PLAYERS)
+    clock.now += GAP_HOURS * SECONDS_PER_HOUR
+
+    assert tracker.roll()
+    histogram = tracker.histograms["terraria"]
+    assert sum(histogram.observed) == 1
+    assert histogram.active[0] == 1
+
+
+def test_demand_counts_only_monitored_servers(clock: FakeClock) -> None:
+    """Test that requests mark tracked servers busy and ignore others."""
+    tracker = DemandTracker(min_weeks=1, clock=clock)
+    tracker.observe("terraria", 0)
+    tracker.demand("terraria")
+    tracker.demand("corekeeper")
+    clock.now += SECONDS_PER_HOUR
+    tracker.roll()
+
+    assert tracker.probability("terraria", MONDAY) == 1.0
+    assert tracker.servers == ["terraria"]
+
+
+async def test_history_survives_restart(clock: FakeClock, tmp_path: Path) -> None:
+    """Test that flushed hours are saved and loaded again."""
+    path = tmp_path / "history.json"
+    tracker = DemandTracker(min_weeks=1, path=path, clock=clock)
+    tracker.observe("terraria", PLAYERS)
+    clock.now += SECONDS_PER_HOUR
+    tracker.roll()
+    assert not path.exists()
+
+    await tracker.flush()
+
+    restored = DemandTracker(min_weeks=1, path=path, clock=clock)
+
+    assert restored.probability("terraria", MONDAY) == 1.0
+
+    path.write_text("{not json")
+    assert DemandTracker(path=path, clock=clock).histograms == {}
+
+
+async def test_predicted_server_is_started_and_used(clock: FakeClock) -> None:
+    """Test that a server is started once ahead of its busy hour and counted as a hit."""
+    cloud = MockProvider()
+    tracker = DemandTracker(min_weeks=TRAINING_WEEKS, clock=clock)
+    train(tracker, clock, {"terraria": [EVENING]}, TRAINING_WEEKS)
+    woken: list[str] = []
+    scheduler = PrewarmScheduler(
+        cloud,
+        tracker,
+        PrewarmPolicy(lead_time=LEAD_TIME, budget_minutes=COST, window=WINDOW),
+        on_start=woken.append,
+        clock=clock,
+    )
+
+    before_evening(clock)
+    assert await scheduler.check() == ["terraria"]
+    assert await cloud.get_server_status("terraria") == "running"
+    assert woken == ["terraria"]
+    assert await scheduler.check() == []
+
+    clock.now += MINUTES_UNTIL_PLAYER * 60
+    scheduler.observe("terraria", PLAYERS)
+
+    assert scheduler.stats.hits == 1
+    assert scheduler.stats.hit_rate == 1.0
+    assert scheduler.stats.wasted_minutes == pytest.approx(MINUTES_UNTIL_PLAYER)
+    assert scheduler.pending == []
+
+
+async def test_unused_prewarm_wastes_its_window(clock: FakeClock) -> None:
+    """Test that a pre-warm nobody uses is a miss costing the whole window."""
+    cloud = MockProvider()
+    tracker = DemandTracker(min_weeks=TRAINING_WEEKS, clock=clock)
+    train(tracker, clock, {"terraria": [EVENING]}, TRAINING_WEEKS)
+    scheduler = make_scheduler(cloud, tracker, clock)
+
+    before_evening(clock)
+    await scheduler.check()
+    clock.now += WINDOW
+    await scheduler.check()
+
+    assert scheduler.stats.misses == 1
+    assert scheduler.stats.hit_rate == 0.0
+    assert scheduler.stats.wasted_minutes == COST
+
+
+async def test_budget_limits_prewarms(clock: FakeClock) -> None:
+    """Test that the budget goes to the most likely server and resets daily."""
+    cloud = MockProvider()
+    tracker = DemandTracker(min_weeks=TRAINING_WEEKS, clock=clock)
+    # Core Keeper is busy one Monday evening out of two, Terraria on both
+    train(tracker, clock, {"terraria": [EVENING], "corekeeper": [EVENING]}, 1)
+    train(tracker, clock, {"terraria": [EVENING], "corekeeper": []}, 1, first_week=1)
+    scheduler = make_scheduler(cloud, tracker, clock)
+    scheduler.policy.threshold = HALF
+
+    before_evening(clock)
+    assert await scheduler.check() == ["terraria"]
+    assert await cloud.get_server_status("corekeeper") == "stopped"
+    assert scheduler.stats.spent_minutes == COST
+
+    clock.now += SECONDS_PER_DAY
+    await scheduler.check()
+    assert scheduler.stats.spent_minutes == 0.0
+
+
+async def test_running_server_is_not_charged(clock: FakeClock) -> None:
+    """Test that a server already running is left alone."""
+    cloud = MockProvider()
+    await cloud.start_server("terraria")
+    tracker = DemandTracker(min_weeks=TRAINING_WEEKS, clock=clock)
+    train(tracker, clock, {"terraria": [EVENING]}, TRAINING_WEEKS)
+    scheduler = make_scheduler(cloud, tracker, clock)
+
+    before_evening(clock)
+
+    assert await scheduler.check() == []
+    assert scheduler.stats.spent_minutes == 0.0
+    assert scheduler.pending == []
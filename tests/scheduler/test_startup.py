@@ -0,0 +1,156 @@
+"""Tests for following server starts."""
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from gameserver_pilot.cloud.base import ServerSnapshot
+from gameserver_pilot.cloud.mock import MockProvider
+from gameserver_pilot.scheduler.startup import (
+    StartProgress,
+    StartStage,
+    StartWaiter,
+    tcp_probe,
+)
+
+INITIAL_DELAY = 0.01
+MAX_DELAY = 0.02
+TIMEOUT = 1.0
+SERVER_IP = "203.0.113.10"
+CONCURRENT_STARTS = 10
+LOCALHOST = "127.0.0.1"
+
+PENDING = ("pending", None)
+RUNNING = ("running", None)
+ADDRESSED = ("running", SERVER_IP)
+
+
+class ScriptedProvider(MockProvider):
+    """Provider whose servers walk through scripted states, one per poll."""
+
+    def __init__(self, scripts: dict[str, list[tuple[str, str | None]]]) -> None:
+        super().__init__()
+        self.scripts = scripts
+        self.batches: list[list[str]] = []
+
+    async def get_server_snapshots(self, server_ids: Sequence[str]) -> dict[str, ServerSnapshot]:
+        self.batches.append(list(server_ids))
+        snapshots = {}
+        for server_id in server_ids:
+            script = self.scripts[server_id]
+            state, ip = script.pop(0) if len(script) > 1 else script[0]
+            snapshots[server_id] = ServerSnapshot(server_id=server_id, state=state, public_ip=ip)
+        return snapshots
+
+
+def make_waiter(provider: ScriptedProvider, timeout: float = TIMEOUT) -> StartWaiter:
+    """Create a waiter polling quickly."""
+    return StartWaiter(provider, initial_delay=INITIAL_DELAY, max_delay=MAX_DELAY, timeout=timeout)
+
+
+async def test_listener_sees_every_stage() -> None:
+    """Test that each stage after pending is reported once, ending with the IP."""
+    provider = ScriptedProvider({"terraria": [PENDING, PENDING, RUNNING, ADDRESSED]})
+    waiter = make_waiter(provider)
+    seen: list[StartStage] = []
+
+    async def listener(progress: StartProgress) -> None:
+        seen.append(progress.stage)
+
+    final = await waiter.watch("terraria", listener)
+    await waiter.stop()
+
+    assert final.stage is StartStage.ADDRESSED
+    assert final.snapshot is not None
+    assert final.snapshot.public_ip == SERVER_IP
+    assert seen == [StartStage.RUNNING, StartStage.ADDRESSED]
+
+
+async def test_probe_gates_readiness() -> None:
+    """Test that a start with a probe ends only once the game answers."""
+    provider = ScriptedProvider({"terraria": [ADDRESSED]})
+    waiter = make_waiter(provider)
+    answers = [False, False, True]
+
+    async def probe(snapshot: ServerSnapshot) -> bool:
+        return answers.pop(0)
+
+    final = await waiter.watch("terraria", probe=probe)
+    await waiter.stop()
+
+    assert final.stage is StartStage.READY
+    assert answers == []
+
+
+async def test_concurrent_starts_share_one_call_per_tick() -> None:
+    """Test that every due server is read in the same batched call."""
+    server_ids = [f"srv-{i}" for i in range(CONCURRENT_STARTS)]
+    provider = ScriptedProvider({server_id: [PENDING, ADDRESSED] for server_id in server_ids})
+    waiter = make_waiter(provider)
+
+    results = await asyncio.gather(*(waiter.watch(server_id) for server_id in server_ids))
+    await waiter.stop()
+
+    assert all(result.stage is StartStage.ADDRESSED for result in results)
+    assert provider.batches == [server_ids, server_ids]
+
+
+async def test_stopped_server_fails_and_stuck_one_times_out() -> None:
+    """Test that starts end when the server stops or never becomes ready."""
+    provider = ScriptedProvider({"stopped": [PENDING, ("stopped", None)], "stuck": [PENDING]})
+    waiter = make_waiter(provider, timeout=INITIAL_DELAY * 5)
+
+    stopped = await waiter.watch("stopped")
+    stuck = await waiter.watch("stuck")
+    await waiter.stop()
+
+    assert stopped.stage is StartStage.FAILED
+    assert stuck.stage is StartStage.TIMED_OUT
+    assert waiter.watching == []
+
+
+async def test_watching_twice_adds_listener() -> None:
+    """Test that a second /start of the same server joins the first watch."""
+    provider = ScriptedProvider({"terraria": [PENDING, ADDRESSED]})
+    waiter = make_waiter(provider)
+    finals: list[StartProgress] = []
+
+    async def listener(progress: StartProgress) -> None:
+        if progress.stage is StartStage.ADDRESSED:
+            finals.append(progress)
+
+    first = waiter.watch("terraria", listener)
+    second = waiter.watch("terraria", listener)
+    await first
+    await waiter.stop()
+
+    assert first is second
+    assert len(finals) == len([first, second])
+
+
+async def test_stop_cancels_watches() -> None:
+    """Test that stopping the waiter cancels unfinished watches."""
+    provider = ScriptedProvider({"terraria": [PENDING]})
+    waiter = make_waiter(provider)
+    done = waiter.watch("terraria")
+
+    await waiter.stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await done
+
+
+async def test_tcp_probe_needs_an_open_port() -> None:
+    """Test that the TCP probe is ready only while the game port accepts connections."""
+    listener = await asyncio.start_server(lambda _reader, writer: writer.close(), LOCALHOST, 0)
+    probe = tcp_probe(listener.sockets[0].getsockname()[1])
+
+    assert await probe(ServerSnapshot(server_id="terraria", state="running", public_ip=LOCALHOST))
+    assert not await probe(ServerSnapshot(server_id="terraria", state="running"))
+
+    listener.close()
+    await listener.wait_closed()
+    assert not await probe(
+        ServerSnapshot(server_id="terraria", state="running", public_ip=LOCALHOST)
+    )
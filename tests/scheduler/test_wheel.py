@@ -0,0 +1,62 @@
+"""Tests for the timer wheel."""
+
+from gameserver_pilot.scheduler.wheel import TimerWheel
+
+SLOTS = 8
+RESCHEDULED_DUE = 4.0
+
+
+def test_pop_due_returns_items_in_due_order() -> None:
+    """Test that only due items are returned, earliest first."""
+    wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=SLOTS)
+    wheel.schedule("b", 2.5)
+    wheel.schedule("a", 2.0)
+    wheel.schedule("c", 5.0)
+
+    assert wheel.pop_due(1.0) == []
+    assert wheel.pop_due(3.0) == ["a", "b"]
+    assert list(wheel.pop_due(10.0)) == ["c"]
+    assert len(wheel) == 0
+
+
+def test_items_beyond_one_rotation_wait() -> None:
+    """Test that items sharing a slot with a later rotation are kept."""
+    wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=SLOTS)
+    wheel.schedule("soon", 1.0)
+    wheel.schedule("later", 1.0 + SLOTS)
+
+    assert wheel.pop_due(1.5) == ["soon"]
+    assert "later" in wheel
+    assert wheel.pop_due(SLOTS + 1.5) == ["later"]
+
+
+def test_reschedule_and_cancel() -> None:
+    """Test that rescheduling moves an item and cancelling removes it."""
+    wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=SLOTS)
+    wheel.schedule("a", 1.0)
+    wheel.schedule("a", RESCHEDULED_DUE)
+    wheel.schedule("b", 2.0)
+    wheel.cancel("b")
+
+    assert wheel.next_due() == RESCHEDULED_DUE
+    assert wheel.pop_due(3.0) == []
+    assert wheel.pop_due(RESCHEDULED_DUE) == ["a"]
+    assert wheel.next_due() is None
+
+
+def test_large_jump_collects_everything() -> None:
+    """Test that advancing past several rotations still finds every item."""
+    wheel: TimerWheel[int] = TimerWheel(tick=1.0, slots=SLOTS)
+    for i in range(SLOTS * 3):
+        wheel.schedule(i, float(i))
+
+    assert wheel.pop_due(1000.0) == list(range(SLOTS * 3))
+
+
+def test_overdue_item_is_popped_next() -> None:
+    """Test that an item scheduled in the past is returned by the next pop."""
+    wheel: TimerWheel[str] = TimerWheel(tick=1.0, slots=SLOTS)
+    wheel.pop_due(5.0)
+    wheel.schedule("late", 2.0)
+
+    assert wheel.pop_due(5.0) == ["late"]
@@ -0,0 +1,109 @@
+"""Tests for wiring the bot from settings."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from gameserver_pilot.bot import GameServerBot
+from gameserver_pilot.cloud.base import ServerSnapshot
+from gameserver_pilot.config import GameServerSettings, Settings
+from gameserver_pilot.monitors.logfile import LogFileMonitor
+from gameserver_pilot.monitors.tshock import TShockMonitor
+
+CHANGE_TIMEOUT = 2.0
+LOCALHOST = "127.0.0.1"
+
+
+@pytest.fixture
+async def bot(tmp_path: Path) -> AsyncIterator[GameServerBot]:
+    """Create a development bot with a log-monitored and a TShock-monitored server."""
+    log = tmp_path / "terraria.log"
+    log.write_text("Alice has joined\nAlice has left\n")
+    settings = Settings(
+        auto_stop_minutes=0,
+        prewarm_history_file=str(tmp_path / "prewarm.json"),
+        game_servers={
+            "Terraria": GameServerSettings(monitor="logfile", log_path=str(log)),
+            "corekeeper": GameServerSettings(monitor="tshock", token="secret"),
+        },
+    )
+    game_bot = GameServerBot(settings)
+    yield game_bot
+    await game_bot.close()
+
+
+async def test_configured_servers_are_tracked(bot: GameServerBot) -> None:
+    """Test that every configured server gets a monitor in auto-stop."""
+    await bot.registry.refresh()
+    await bot.sync_monitors()
+
+    assert set(bot.autostop.servers) == {"terraria", "corekeeper"}
+    assert isinstance(bot.monitors["terraria"], LogFileMonitor)
+    assert isinstance(bot.monitors["corekeeper"], TShockMonitor)
+    assert bot.monitors["corekeeper"].client is bot.tshock_http
+    assert bot.readiness_probe("terraria") is not None
+
+
+async def test_names_move_to_ids_after_discovery(bot: GameServerBot) -> None:
+    """Test that a name tracked before discovery is re-registered under its ID."""
+    await bot.sync_monitors()
+    assert "Terraria" in bot.autostop.servers
+
+    bot.registry.subscribe(bot.sync_monitors)
+    await bot.registry.refresh()
+
+    assert "Terraria" not in bot.autostop.servers
+    assert "terraria" in bot.autostop.servers
+
+
+async def test_idle_server_is_stopped(bot: GameServerBot) -> None:
+    """Test that an empty running server is stopped by the bot's auto-stop."""
+    await bot.registry.refresh()
+    await bot.sync_monitors()
+    assert await bot.cloud.start_server("terraria")
+
+    bot.autostop.wake("terraria")
+    await bot.autostop.tick()
+
+    assert await bot.cloud.get_server_status("terraria") == "stopped"
+
+
+async def test_log_watcher_pushes_to_autostop(bot: GameServerBot) -> None:
+    """Test that log file servers are pushed by the watcher instead of polled."""
+    await bot.registry.refresh()
+    await bot.sync_monitors()
+    assert bot.autostop.servers["terraria"].pushed
+    assert not bot.autostop.servers["corekeeper"].pushed
+
+    await bot.log_watcher.start()
+    async with asyncio.timeout(CHANGE_TIMEOUT):
+        while bot.autostop.servers["terraria"].reported is None:
+            await asyncio.sleep(0)
+
+    assert bot.autostop.servers["terraria"].reported == 0
+
+
+async def test_game_port_decides_readiness(tmp_path: Path) -> None:
+    """Test that a configured game port is probed without auto-stop or monitors."""
+    listener = await asyncio.start_server(lambda _reader, writer: writer.close(), LOCALHOST, 0)
+    port = listener.sockets[0].getsockname()[1]
+    settings = Settings(
+        auto_stop_minutes=0,
+        prewarm_history_file=str(tmp_path / "prewarm.json"),
+        game_servers={"terraria": GameServerSettings(game_port=port)},
+    )
+    game_bot = GameServerBot(settings)
+    await game_bot.sync_monitors()
+    snapshot = ServerSnapshot(server_id="terraria", state="running", public_ip=LOCALHOST)
+
+    probe = game_bot.readiness_probe("terraria")
+    assert probe is not None
+    assert not game_bot.autostop.servers
+    assert await probe(snapshot)
+
+    listener.close()
+    await listener.wait_closed()
+    assert not await probe(snapshot)
+    await game_bot.close()
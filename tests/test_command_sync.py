@@ -0,0 +1,102 @@
+"""Tests for fingerprinted command-tree sync."""
+
+from pathlib import Path
+
+import discord
+import pytest
+from discord import app_commands
+
+from gameserver_pilot.command_sync import load_fingerprints, sync_commands, tree_fingerprint
+
+DEV_GUILD_ID = 123456789
+
+
+async def ping(interaction: discord.Interaction, server: str) -> None:
+    """Command callback used to build test trees."""
+
+
+class RecordingTree(app_commands.CommandTree[discord.Client]):
+    """Command tree that records syncs instead of calling Discord."""
+
+    def __init__(self) -> None:
+        """Initialize the tree with an offline client."""
+        super().__init__(discord.Client(intents=discord.Intents.none()))
+        self.synced: list[discord.abc.Snowflake | None] = []
+        self.fail = False
+
+    async def sync(
+        self, *, guild: discord.abc.Snowflake | None = None
+    ) -> list[app_commands.AppCommand]:
+        """Record the sync, or fail like a rejected request."""
+        if self.fail:
+            raise discord.DiscordException
+        self.synced.append(guild)
+        return []
+
+
+def make_tree(description: str = "Ping a server") -> RecordingTree:
+    """Create a command tree with one command."""
+    tree = RecordingTree()
+    tree.add_command(app_commands.Command(name="ping", description=description, callback=ping))
+    return tree
+
+
+@pytest.fixture
+def state_path(tmp_path: Path) -> Path:
+    """Location of the sync state file."""
+    return tmp_path / "command-sync.json"
+
+
+def test_fingerprint_tracks_command_changes() -> None:
+    """Test that identical trees match and edited commands do not."""
+    assert tree_fingerprint(make_tree()) == tree_fingerprint(make_tree())
+    assert tree_fingerprint(make_tree()) != tree_fingerprint(make_tree("Ping it"))
+
+
+async def test_unchanged_tree_is_not_synced_again(state_path: Path) -> None:
+    """Test that a restart with the same commands skips the sync."""
+    first = make_tree()
+    second = make_tree()
+
+    assert await sync_commands(first, state_path) is True
+    assert await sync_commands(second, state_path) is False
+    assert second.synced == []
+
+
+async def test_changed_or_forced_tree_is_synced(state_path: Path) -> None:
+    """Test that edited commands, or force, trigger a sync."""
+    await sync_commands(make_tree(), state_path)
+
+    assert await sync_commands(make_tree("Ping it"), state_path) is True
+    assert await sync_commands(make_tree("Ping it"), state_path, force=True) is True
+
+
+async def test_guild_scope_is_tracked_separately(state_path: Path) -> None:
+    """Test that a development guild sync does not satisfy the global one."""
+    tree = make_tree()
+    guild = discord.Object(id=DEV_GUILD_ID)
+    tree.copy_global_to(guild=guild)
+
+    assert await sync_commands(tree, state_path, guild) is True
+    assert await sync_commands(tree, state_path) is True
+    assert tree.synced == [guild, None]
+    assert set(load_fingerprints(state_path)) == {f"None:{DEV_GUILD_ID}", "None:global"}
+
+
+async def test_failed_sync_is_retried(state_path: Path) -> None:
+    """Test that a fingerprint is stored only after a successful sync."""
+    tree = make_tree()
+    tree.fail = True
+
+    with pytest.raises(discord.DiscordException):
+        await sync_commands(tree, state_path)
+
+    assert load_fingerprints(state_path) == {}
+    assert await sync_commands(make_tree(), state_path) is True
+
+
+async def test_corrupt_state_triggers_sync(state_path: Path) -> None:
+    """Test that an unreadable state file is treated as never synced."""
+    state_path.write_text("{not json")
+
+    assert await sync_commands(make_tree(), state_path) is True
@@ -1,6 +1,6 @@
 """Tests for application configuration."""
 
-from gameserver_pilot.config import Settings
+from gameserver_pilot.config import Settings, get_settings
 
 DEFAULT_AUTO_STOP_MINUTES = 60
 
@@ -23,3 +23,8 @@ def test_is_production_true() -> None:
     """Test is_production returns True for production."""
     settings = Settings(env="production")
     assert settings.is_production is True
+
+
+def test_get_settings_is_cached() -> None:
+    """Test that settings are loaded once and shared."""
+    assert get_settings() is get_settings()
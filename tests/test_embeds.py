@@ -0,0 +1,76 @@
+"""Tests for Discord embed pagination helpers."""
+
+import discord
+
+from gameserver_pilot.embeds import (
+    MAX_EMBED_CHARS,
+    MAX_EMBEDS_PER_MESSAGE,
+    MAX_FIELD_VALUE_CHARS,
+    MAX_FIELDS_PER_EMBED,
+    group_into_messages,
+    paginate_fields,
+)
+
+FLEET_SIZE = 60
+EXPECTED_PAGES = 3
+LONG_VALUE_FIELDS = 20
+
+
+def test_no_fields() -> None:
+    """Test that no fields produce no embeds."""
+    assert paginate_fields("Fleet", []) == []
+
+
+def test_single_page_keeps_title() -> None:
+    """Test that a small result fits in one embed with the plain title."""
+    embeds = paginate_fields("Fleet", [("terraria", "running")])
+
+    assert len(embeds) == 1
+    assert embeds[0].title == "Fleet"
+    assert embeds[0].fields[0].name == "terraria"
+
+
+def test_field_limit_paginates() -> None:
+    """Test that more than 25 fields are split across embeds."""
+    fields = [(f"server-{i}", "stopped") for i in range(FLEET_SIZE)]
+    embeds = paginate_fields("Fleet", fields)
+
+    assert len(embeds) == EXPECTED_PAGES
+    assert all(len(embed.fields) <= MAX_FIELDS_PER_EMBED for embed in embeds)
+    assert sum(len(embed.fields) for embed in embeds) == FLEET_SIZE
+    assert embeds[0].title == f"Fleet (1/{EXPECTED_PAGES})"
+
+
+def test_char_limit_paginates() -> None:
+    """Test that embeds stay under the character cap."""
+    fields = [(f"server-{i}", "x" * MAX_FIELD_VALUE_CHARS) for i in range(LONG_VALUE_FIELDS)]
+    embeds = paginate_fields("Fleet", fields)
+
+    assert len(embeds) > 1
+    assert all(len(embed) <= MAX_EMBED_CHARS for embed in embeds)
+
+
+def test_long_value_truncated() -> None:
+    """Test that oversized field values are truncated."""
+    embeds = paginate_fields("Fleet", [("server", "x" * (MAX_FIELD_VALUE_CHARS + 1))])
+    value = embeds[0].fields[0].value
+
+    assert value is not None
+    assert len(value) == MAX_FIELD_VALUE_CHARS
+
+
+def test_group_into_messages_count_limit() -> None:
+    """Test that at most 10 embeds are sent per message."""
+    embeds = [discord.Embed(title=str(i)) for i in range(MAX_EMBEDS_PER_MESSAGE + 1)]
+    messages = group_into_messages(embeds)
+
+    assert [len(batch) for batch in messages] == [MAX_EMBEDS_PER_MESSAGE, 1]
+
+
+def test_group_into_messages_char_limit() -> None:
+    """Test that combined embed size per message stays under the cap."""
+    fields = [(f"server-{i}", "x" * MAX_FIELD_VALUE_CHARS) for i in range(LONG_VALUE_FIELDS)]
+    messages = group_into_messages(paginate_fields("Fleet", fields))
+
+    assert len(messages) > 1
+    assert all(sum(len(embed) for embed in batch) <= MAX_EMBED_CHARS for batch in messages)
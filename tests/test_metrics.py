@@ -0,0 +1,89 @@
+"""Tests for call metrics and the Prometheus endpoint."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from gameserver_pilot.metrics import MetricsRegistry, MetricsServer
+
+BUCKETS = (0.1, 1.0)
+FAST = 0.05
+SLOW = 0.5
+TWO_CALLS = 2
+
+
+def test_observe_fills_cumulative_buckets() -> None:
+    """Test that rendered histogram buckets are cumulative."""
+    registry = MetricsRegistry(BUCKETS)
+    registry.observe("cloud", "start_server", FAST)
+    registry.observe("cloud", "start_server", SLOW, error=True)
+
+    text = registry.render()
+
+    labels = 'component="cloud",method="start_server"'
+    assert f"gameserver_pilot_calls_total{{{labels}}} 2" in text
+    assert f"gameserver_pilot_errors_total{{{labels}}} 1" in text
+    assert f'gameserver_pilot_call_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'gameserver_pilot_call_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+    assert f'gameserver_pilot_call_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"gameserver_pilot_call_duration_seconds_count{{{labels}}} 2" in text
+
+
+def test_timer_counts_exceptions() -> None:
+    """Test that a block raising an exception is recorded as an error."""
+    registry = MetricsRegistry()
+
+    with registry.timer("monitor", "get_player_count"):
+        pass
+    with pytest.raises(RuntimeError), registry.timer("monitor", "get_player_count"):
+        raise RuntimeError
+
+    series = registry.series("monitor", "get_player_count")
+    assert series.calls == TWO_CALLS
+    assert series.errors == 1
+
+
+def test_label_values_are_escaped() -> None:
+    """Test that quotes in label values cannot break the format."""
+    registry = MetricsRegistry()
+    registry.observe("command", 'say "hi"', FAST)
+
+    assert 'method="say \\"hi\\""' in registry.render()
+
+
+async def test_metrics_server_serves_text_format() -> None:
+    """Test that the endpoint serves the registry and 404s elsewhere."""
+    registry = MetricsRegistry()
+    registry.observe("cloud", "get_server_status", FAST)
+    server = MetricsServer(registry, port=0)
+    await server.start()
+
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{server.port}") as client:
+            response = await client.get("/metrics")
+            missing = await client.get("/other")
+    finally:
+        await server.close()
+
+    assert response.status_code == httpx.codes.OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'method="get_server_status"' in response.text
+    assert missing.status_code == httpx.codes.NOT_FOUND
+
+
+async def test_metrics_server_ignores_broken_clients() -> None:
+    """Test that a client disconnecting mid-request does not break the server."""
+    server = MetricsServer(MetricsRegistry(), port=0)
+    await server.start()
+    try:
+        _, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"GET /metrics HTTP/1.1\r\n")
+        writer.close()
+        await writer.wait_closed()
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://127.0.0.1:{server.port}/metrics")
+    finally:
+        await server.close()
+
+    assert response.status_code == httpx.codes.OK
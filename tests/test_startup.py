@@ -0,0 +1,71 @@
+"""Cold-start import cost of the bot, measured with ``python -X importtime``."""
+
+import subprocess
+import sys
+
+# Generous bound on importing the bot module; a cold start is typically ~0.5s
+IMPORT_BUDGET_SECONDS = 3.0
+# Modules needed only by the production cloud provider
+PRODUCTION_ONLY = ("boto3", "botocore")
+SLOWEST_REPORTED = 10
+# Columns of an importtime line: self [us] | cumulative [us] | imported package
+IMPORTTIME_COLUMNS = 3
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Import a module in a fresh interpreter and collect cumulative import times.
+
+    Args:
+        module: Dotted name of the module to import
+
+    Returns:
+        Cumulative seconds spent importing each module, keyed by module name
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != IMPORTTIME_COLUMNS:
+            continue
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue
+        times[fields[2].strip()] = cumulative / 1_000_000
+    return times
+
+
+def report(times: dict[str, float]) -> str:
+    """List the slowest imports for an assertion message."""
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_REPORTED]
+    return "\n".join(f"{seconds:8.3f}s  {name}" for name, seconds in slowest)
+
+
+def test_bot_import_is_bounded() -> None:
+    """Test that importing the bot stays fast and skips production-only modules."""
+    times = import_times("gameserver_pilot.bot")
+
+    assert times["gameserver_pilot.bot"] < IMPORT_BUDGET_SECONDS, report(times)
+    assert not [name for name in PRODUCTION_ONLY if name in times], report(times)
+
+
+def test_subsystems_import_without_unrelated_dependencies() -> None:
+    """Test that the scheduler and Beszel client load neither boto3 nor discord.py."""
+    for module in ("gameserver_pilot.scheduler", "gameserver_pilot.monitoring"):
+        times = import_times(module)
+
+        assert "boto3" not in times, report(times)
+        assert "discord" not in times, report(times)
+
+
+def test_cloud_and_scheduler_import_without_httpx() -> None:
+    """Test that only the Beszel client and TShock monitor load httpx."""
+    for module in ("gameserver_pilot.cloud", "gameserver_pilot.scheduler"):
+        times = import_times(module)
+
+        assert "httpx" not in times, report(times)